@@ -0,0 +1,103 @@
+"""
+HTTP/1.1 against HTTP/2 for concurrent GETs through the client built by make_client
+
+A local TLS server (hypercorn, offering h2 and http/1.1) answers every request after a
+20 ms delay; 30 GETs are sent at once on a cold pool and again on the warmed pool.
+Needs the bench extra (hypercorn, h2) and the openssl command.
+
+    uv pip install ".[bench]"
+    python benchmarks/bench_http_pool.py
+"""
+
+import os
+import sys
+import socket
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+CONCURRENT = 30
+RUNS = 10
+DELAY = 0.02
+
+
+async def app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await asyncio.sleep(DELAY)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"ok":true}'})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def certificate(directory: str):
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1", "-keyout", key, "-out", cert],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+async def burst(client):
+    async def get():
+        start = time.perf_counter()
+        response = await client.get("/")
+        response.raise_for_status()
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*[get() for _ in range(CONCURRENT)]))
+    return time.perf_counter() - start, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = certificate(directory)
+        # make_client trusts the default store; point it at the test certificate
+        os.environ["SSL_CERT_FILE"] = cert
+        from laevitas_http import make_client, pool_stats
+
+        port = free_port()
+        config = Config()
+        config.bind = [f"127.0.0.1:{port}"]
+        config.certfile, config.keyfile = cert, key
+        config.alpn_protocols = ["h2", "http/1.1"]
+        config.loglevel = "WARNING"
+        shutdown = asyncio.Event()
+        server = asyncio.ensure_future(serve(app, config, shutdown_trigger=shutdown.wait))
+        await asyncio.sleep(0.5)
+
+        print(f"{CONCURRENT} concurrent GETs, {DELAY * 1000:.0f} ms handler delay, medians of {RUNS} runs:")
+        print(f"  {'':10}{'cold wall / p50 / p95':>26}{'warm wall':>12}{'connections':>13}")
+        for http2 in (False, True):
+            cold, warm, kept = [], [], []
+            for _ in range(RUNS):
+                client = make_client(f"https://localhost:{port}", {}, 10.0, http2=http2)
+                async with client:
+                    cold.append(await burst(client))
+                    warm.append((await burst(client))[0])
+                    kept.append(pool_stats(client)["connections"])
+            wall, p50, p95 = (statistics.median(run[i] for run in cold) * 1000 for i in range(3))
+            print(f"  {'HTTP/2' if http2 else 'HTTP/1.1':10}{wall:10.0f} / {p50:4.0f} / {p95:4.0f} ms"
+                  f"{statistics.median(warm) * 1000:9.0f} ms{statistics.median(kept):13.0f}")
+
+        shutdown.set()
+        await server
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
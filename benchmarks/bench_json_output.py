@@ -0,0 +1,67 @@
+"""
+Tool output serialization: Python repr against compact JSON against raw passthrough,
+on a synthetic 7,600-row options snapshot
+
+    python benchmarks/bench_json_output.py
+"""
+
+import os
+import sys
+import json
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laevitas_output import to_json, body_to_text
+
+
+def snapshot(rows: int) -> bytes:
+    rng = random.Random(0)
+    items = [
+        {
+            "instrument": f"BTC-27JUN25-{80000 + 1000 * (i % 60)}-{'C' if i % 2 else 'P'}",
+            "market": "deribit",
+            "maturity": "27JUN25",
+            "strike": 80000 + 1000 * (i % 60),
+            "option_type": "call" if i % 2 else "put",
+            "mark_price": rng.random() * 0.1,
+            "mark_iv": 40 + rng.random() * 40,
+            "delta": rng.random() * 2 - 1,
+            "gamma": rng.random() * 1e-4,
+            "vega": rng.random() * 200,
+            "theta": -rng.random() * 100,
+            "open_interest": rng.random() * 1000,
+            "volume": rng.random() * 500,
+            "underlying_price": 100000 + rng.random() * 1000,
+            "date": 1748736000000 + i * 60000,
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({"date": 1748736000000, "items": items}).encode()
+
+
+def best_of(runs: int, fn):
+    times, result = [], None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    body = snapshot(7600)
+    cases = [
+        ("str(json.loads(body))", lambda: str(json.loads(body))),
+        ("to_json(json.loads(body))", lambda: to_json(json.loads(body))),
+        ("raw passthrough", lambda: body_to_text(body)),
+    ]
+    print(f"7,600-row options snapshot ({len(body) / 1e6:.1f} MB of JSON):")
+    for name, fn in cases:
+        seconds, text = best_of(5, fn)
+        print(f"  {name:26} {seconds * 1000:7.1f} ms, {len(text.encode()) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
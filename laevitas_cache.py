@@ -0,0 +1,246 @@
+"""
+Response cache for the Laevitas MCP Server
+"""
+
+import re
+import time
+import asyncio
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Any, Tuple, Callable, Awaitable
+from urllib.parse import urlencode
+from laevitas_history import parse_instant
+
+# Pricer endpoints listing the instruments they accept, e.g. /pricer/v2/risk_slide_instruments/{market}
+INSTRUMENTS_PATH = re.compile(r"^/pricer/.*_instruments(/|$)")
+
+# Historical data younger than this may still be back-filled upstream
+SETTLE_WINDOW = timedelta(minutes=5)
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Drop unset query parameters and render the rest as strings, sorted by name."""
+    if not params:
+        return {}
+    return {k: str(v) for k, v in sorted(params.items()) if v is not None}
+
+
+def cache_key(method: str, endpoint: str, params: Dict[str, str]) -> str:
+    """Key a request on its method, path and normalized query parameters."""
+    return f"{method.upper()} {endpoint}?{urlencode(params)}"
+
+
+def parse_range_end(params: Dict[str, str]) -> Optional[datetime]:
+    """Return the (exclusive) end of the time range a historical request covers, if known.
+
+    Accepts the formats the API accepts: '2025-05-19', '2025-05-19T10:15',
+    '2025-05-04T14' (date_h) and epoch milliseconds.
+    """
+    value = params.get("end") or params.get("date") or params.get("date_h")
+    if not value:
+        return None
+    end = parse_instant(value)
+    if end is None or value.isdigit():
+        return end
+    if len(value) == 10:
+        return end + timedelta(days=1)
+    if len(value) == 13:
+        return end + timedelta(hours=1)
+    return end
+
+
+class ResponseCache:
+    """Two-tier (in-process LRU + optional SQLite file) cache of raw response bodies.
+
+    Bodies are stored as the bytes returned by the API so entries are immutable and
+    can be shared between callers. A TTL of None means the entry never expires. The
+    file tier holds at most disk_max_bytes of bodies, dropping expired entries and then
+    the oldest written ones beyond that.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_path: Optional[str] = None,
+        analytics_ttl: float = 15.0,
+        historical_ttl: float = 60.0,
+        instruments_ttl: float = 6 * 3600.0,
+        disk_min_ttl: float = 300.0,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.analytics_ttl = analytics_ttl
+        self.historical_ttl = historical_ttl
+        self.instruments_ttl = instruments_ttl
+        self.disk_min_ttl = disk_min_ttl
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._disk = None
+        self._disk_bytes = 0
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path)
+            # Commits run on the event loop; in WAL mode with synchronous=NORMAL they append
+            # to the log without an fsync, so each one costs microseconds, not a disk flush
+            self._disk.execute("PRAGMA journal_mode=WAL")
+            self._disk.execute("PRAGMA synchronous=NORMAL")
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL, body BLOB)"
+            )
+            self._disk.commit()
+            self._disk_bytes, = self._disk.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def ttl_for(self, method: str, endpoint: str, params: Dict[str, str]) -> Optional[float]:
+        """TTL in seconds for a request; 0 means do not cache, None means cache indefinitely."""
+        if method.upper() != "GET":
+            return 0
+        if endpoint.startswith("/analytics/"):
+            return self.analytics_ttl
+        if endpoint.startswith("/historical/") or endpoint.startswith("/V2/historical/"):
+            end = parse_range_end(params)
+            if end is not None and end + SETTLE_WINDOW <= datetime.now(timezone.utc):
+                return None
+            return self.historical_ttl
+        if INSTRUMENTS_PATH.match(endpoint):
+            return self.instruments_ttl
+        return 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, body = entry
+            if expires is None or expires > now:
+                self._entries.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                return body
+            self._discard(key)
+            self.counters["expirations"] += 1
+        if self._disk is not None:
+            row = self._disk.execute("SELECT expires, body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                expires, body = row
+                if expires is None or expires > now:
+                    self._remember(key, expires, body)
+                    self.counters["disk_hits"] += 1
+                    return body
+                self._disk.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._disk.commit()
+                self._disk_bytes -= len(body)
+                self.counters["expirations"] += 1
+        self.counters["misses"] += 1
+        return None
+
+    def set(self, key: str, body: bytes, ttl: Optional[float]):
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.time() + ttl
+        self._remember(key, expires, body)
+        if self._disk is not None and (ttl is None or ttl >= self.disk_min_ttl) and len(body) <= self.disk_max_bytes:
+            replaced = self._disk.execute("SELECT LENGTH(body) FROM responses WHERE key = ?", (key,)).fetchone()
+            self._disk.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, body) VALUES (?, ?, ?)",
+                (key, expires, body),
+            )
+            self._disk_bytes += len(body) - (replaced[0] if replaced else 0)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._trim_disk()
+            self._disk.commit()
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+        if self._disk is not None:
+            self._disk.execute("DELETE FROM responses")
+            self._disk.commit()
+            self._disk_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+        lookups = hits + self.counters["misses"]
+        return {
+            "hits": hits,
+            **self.counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "disk": self._disk is not None,
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def _remember(self, key: str, expires: Optional[float], body: bytes):
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+        self._discard(key)
+        self._entries[key] = (expires, body)
+        self._bytes += len(body)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.counters["evictions"] += 1
+
+    def _trim_disk(self):
+        expired = self._disk.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),)).rowcount
+        self.counters["expirations"] += expired
+        self._disk_bytes, = self._disk.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()
+        evicted = []
+        for rowid, size in self._disk.execute("SELECT rowid, LENGTH(body) FROM responses ORDER BY rowid"):
+            if self._disk_bytes <= self.disk_max_bytes:
+                break
+            evicted.append((rowid,))
+            self._disk_bytes -= size
+        self._disk.executemany("DELETE FROM responses WHERE rowid = ?", evicted)
+        self.counters["evictions"] += len(evicted)
+
+    def _discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+class SingleFlight:
+    """Coalesce concurrent identical requests onto one upstream call.
+
+    The first caller for a key starts the call; callers arriving while it is in flight
+    await the same task. The task is shielded so one caller being cancelled does not
+    cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Task[bytes]"] = {}
+        self.counters = {"leaders": 0, "coalesced": 0}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[bytes]]) -> bytes:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.counters["leaders"] += 1
+        else:
+            self.counters["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def pending(self, key: str) -> bool:
+        """Whether a call for `key` is in flight."""
+        return key in self._calls
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "in_flight": len(self._calls)}
+
+    def _finish(self, key: str, task: "asyncio.Task[bytes]"):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter has gone away
+            task.exception()
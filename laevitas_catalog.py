@@ -0,0 +1,277 @@
+"""
+Indexed access to laevitas_catalog.json
+
+The catalog is parsed once per process. The indexed form is pickled next to the JSON
+file and reused as long as the JSON file's mtime and size are unchanged.
+"""
+
+import os
+import json
+import time
+import pickle
+import logging
+import difflib
+import functools
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Tuple, FrozenSet
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "laevitas_catalog.json")
+SNAPSHOT_PATH = os.path.splitext(CATALOG_PATH)[0] + ".pickle"
+
+# Bump when the indexed layout changes so stale snapshots are rebuilt
+SNAPSHOT_VERSION = 2
+
+# Cold start (snapshot or JSON load plus indexing) above this logs a warning
+COLD_START_BUDGET = 0.05
+
+# Exchanges list new expiries continually; unlisted maturities further out than this are rejected
+MATURITY_HORIZON = timedelta(days=3 * 366)
+
+# Maturity values that are not expiry codes
+MATURITY_KEYWORDS = {"ALL"}
+
+# Endpoints whose maturity must still be listed: snapshots of live option expiries
+LIVE_MATURITY_PREFIX = "/analytics/options/"
+
+# Market values that combine other venues rather than name one
+AGGREGATE_MARKETS = {"aggregate", "aggregated", "all", "undefined"}
+
+MONTHS = {m: i for i, m in enumerate(
+    ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"], start=1
+)}
+
+
+def takes_live_maturity(path: str) -> bool:
+    """Whether an endpoint's maturity argument names a live option expiry (not an expired one)."""
+    return path.startswith(LIVE_MATURITY_PREFIX) and "expired" not in path
+
+
+def maturity_date(maturity: str) -> Optional[date]:
+    """Parse an exchange maturity code such as '27JUN25' or '9MAY25'."""
+    try:
+        return date(2000 + int(maturity[-2:]), MONTHS[maturity[-5:-2].upper()], int(maturity[:-5]))
+    except (KeyError, ValueError):
+        return None
+
+
+class Catalog:
+    """Hash indexes over the catalog: market -> currency -> maturities / sorted strikes."""
+
+    def __init__(
+        self,
+        api_list: List[Dict[str, Any]],
+        maturities: Dict[str, Dict[str, Tuple[str, ...]]],
+        strikes: Dict[str, Dict[str, Tuple[float, ...]]],
+        currencies: FrozenSet[str],
+        markets: FrozenSet[str],
+    ):
+        self.api_list = api_list
+        self.markets = markets
+        self.maturity_index = maturities
+        self.maturity_sets = {
+            market: {currency: frozenset(values) for currency, values in by_currency.items()}
+            for market, by_currency in maturities.items()
+        }
+        self.strike_index = strikes
+        self.currencies = currencies
+        self.load_seconds: Optional[float] = None
+        self.source: Optional[str] = None
+        self.rejected = 0
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Catalog":
+        params = data["params"]
+        maturities = {}
+        for market, by_currency in (params["maturities"]["data"] or {}).items():
+            if by_currency:
+                maturities[market.lower()] = {
+                    currency.upper(): tuple(sorted(set(values), key=lambda m: maturity_date(m) or date.max))
+                    for currency, values in by_currency.items()
+                }
+        strikes = {}
+        for market, by_currency in (params["strikes"]["data"] or {}).items():
+            if by_currency:
+                strikes[market.lower()] = {
+                    currency.upper(): tuple(sorted(set(values))) for currency, values in by_currency.items()
+                }
+        currencies = {symbol.upper() for symbol in params["currency"]["data"]}
+        markets = set(maturities) | set(strikes)
+        for api in data["api_list"]:
+            for source in (api.get("path_params") or {}, api.get("query_params") or {}):
+                currencies.update(str(v).upper() for v in source.get("currency") or [])
+                markets.update(str(v).lower() for v in source.get("market") or [])
+        return cls(data["api_list"], maturities, strikes, frozenset(currencies), frozenset(markets))
+
+    def option_markets(self) -> List[str]:
+        return sorted(set(self.maturity_index) | set(self.strike_index))
+
+    def option_currencies(self, market: str) -> List[str]:
+        market = market.lower()
+        return sorted(set(self.maturity_index.get(market, {})) | set(self.strike_index.get(market, {})))
+
+    def maturities(self, market: str, currency: str) -> Tuple[str, ...]:
+        """Listed maturities, nearest expiry first."""
+        return self.maturity_index.get(market.lower(), {}).get(currency.upper(), ())
+
+    def has_maturity(self, market: str, currency: str, maturity: str) -> bool:
+        return maturity.upper() in self.maturity_sets.get(market.lower(), {}).get(currency.upper(), ())
+
+    def strikes(self, market: str, currency: str) -> Tuple[float, ...]:
+        """Listed strikes in ascending order."""
+        return self.strike_index.get(market.lower(), {}).get(currency.upper(), ())
+
+    def nearest_strikes(self, market: str, currency: str, strike: float, count: int = 3) -> List[float]:
+        """The `count` listed strikes closest to `strike` (binary search on the sorted array)."""
+        strikes = self.strikes(market, currency)
+        i = bisect_left(strikes, strike)
+        lo, hi = i, i
+        while hi - lo < count and (lo > 0 or hi < len(strikes)):
+            if lo > 0 and (hi >= len(strikes) or strike - strikes[lo - 1] <= strikes[hi] - strike):
+                lo -= 1
+            else:
+                hi += 1
+        return list(strikes[lo:hi])
+
+    def has_strike(self, market: str, currency: str, strike: float) -> bool:
+        strikes = self.strikes(market, currency)
+        i = bisect_left(strikes, strike)
+        return i < len(strikes) and strikes[i] == strike
+
+    def is_currency(self, symbol: str) -> bool:
+        return symbol.upper() in self.currencies
+
+    def venues(self, path: str, markets: Tuple[str, ...], currency: Optional[str] = None) -> List[str]:
+        """The venues an all_markets call fans out to: the endpoint's listed markets without aggregates.
+
+        Markets keep the spelling they are given in; they are compared case-insensitively.
+        On option endpoints, venues whose option listings lack `currency` are left out;
+        venues the option indexes do not cover are kept.
+        """
+        venues = [m for m in markets if m.lower() not in AGGREGATE_MARKETS]
+        if currency and "/options/" in path:
+            indexed = set(self.maturity_index) | set(self.strike_index)
+            venues = [m for m in venues if m.lower() not in indexed or currency.upper() in self.option_currencies(m)]
+        return venues
+
+    def check_params(self, path: str, args: Dict[str, Any]) -> Optional[str]:
+        """Check market, currency, maturity and strike arguments against the catalog.
+
+        Returns an error message listing the nearest valid values, or None if the call
+        may go ahead. Listings change after the catalog snapshot was taken, so maturities
+        and strikes it does not list are still accepted when they are plausible.
+        """
+        error = self.check_market(args.get("market"))
+        error = error or self.check_currency(args.get("currency"))
+        market = str(args.get("market") or "")
+        currency = str(args.get("currency") or "")
+        error = error or self.check_maturity(market, currency, args.get("maturity"), live=takes_live_maturity(path))
+        error = error or self.check_strike(market, currency, args.get("strike"))
+        if error:
+            self.rejected += 1
+            return f"Error: {error}"
+        return None
+
+    def check_market(self, market: Any) -> Optional[str]:
+        if market is None or str(market).lower() in self.markets:
+            return None
+        suggestions = difflib.get_close_matches(str(market).lower(), self.markets, n=3)
+        return f"unknown market '{market}'. Did you mean: {', '.join(suggestions) or ', '.join(sorted(self.markets))}"
+
+    def check_currency(self, currency: Any) -> Optional[str]:
+        if currency is None or str(currency).upper() in self.currencies:
+            return None
+        suggestions = difflib.get_close_matches(str(currency).upper(), self.currencies, n=3)
+        return f"unknown currency '{currency}'." + (f" Did you mean: {', '.join(suggestions)}" if suggestions else "")
+
+    def check_maturity(self, market: str, currency: str, maturity: Any, live: bool) -> Optional[str]:
+        if maturity is None:
+            return None
+        maturity = str(maturity).upper()
+        if maturity in MATURITY_KEYWORDS:
+            return None
+        expiry = maturity_date(maturity)
+        today = datetime.now(timezone.utc).date()
+        if expiry is None:
+            problem = "is not a maturity code like '27JUN25'"
+        elif live and expiry < today:
+            problem = "has already expired"
+        elif expiry > today + MATURITY_HORIZON and not self.has_maturity(market, currency, maturity):
+            problem = "is too far out to be listed"
+        else:
+            return None
+        listed = self.maturities(market, currency)
+        if live:
+            listed = tuple(m for m in listed if (maturity_date(m) or date.max) >= today)
+        if expiry is not None:
+            listed = tuple(sorted(listed, key=lambda m: abs(((maturity_date(m) or date.max) - expiry).days)))
+        hint = f" Nearest listed: {', '.join(listed[:3])}" if listed else " Use getoptionmaturities for the listed maturities."
+        return f"maturity '{maturity}' {problem}.{hint}"
+
+    def check_strike(self, market: str, currency: str, strike: Any) -> Optional[str]:
+        if strike is None:
+            return None
+        try:
+            value = float(strike)
+        except (TypeError, ValueError):
+            value = None
+        strikes = self.strikes(market, currency)
+        if value is None or value <= 0:
+            problem = "is not a positive number"
+        elif not strikes or self.has_strike(market, currency, value) or strikes[0] / 2 <= value <= strikes[-1] * 2:
+            return None
+        else:
+            problem = f"is far outside the listed range {strikes[0]}-{strikes[-1]}"
+        nearest = self.nearest_strikes(market, currency, value) if value is not None and value > 0 else []
+        hint = f" Nearest listed: {', '.join(str(k) for k in nearest)}" if nearest else ""
+        return f"strike '{strike}' {problem}.{hint}"
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "load_seconds": round(self.load_seconds, 4) if self.load_seconds is not None else None,
+            "budget_seconds": COLD_START_BUDGET,
+            "endpoints": len(self.api_list),
+            "currencies": len(self.currencies),
+            "rejected_calls": self.rejected,
+        }
+
+
+def load_catalog(path: str = CATALOG_PATH, snapshot_path: str = SNAPSHOT_PATH) -> Catalog:
+    """Load the indexed catalog from its snapshot, rebuilding the snapshot if the JSON changed."""
+    stat = os.stat(path)
+    stamp = (SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot_stamp, catalog = pickle.load(f)
+        if snapshot_stamp == stamp:
+            catalog.source = "snapshot"
+            return catalog
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError, TypeError):
+        pass
+    with open(path) as f:
+        catalog = Catalog.from_json(json.load(f))
+    try:
+        tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, catalog), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        logger.warning("Could not write catalog snapshot %s: %s", snapshot_path, e)
+    catalog.source = "json"
+    return catalog
+
+
+@functools.lru_cache(maxsize=None)
+def get_catalog() -> Catalog:
+    """The process-wide catalog, loaded on first use."""
+    start = time.perf_counter()
+    catalog = load_catalog()
+    catalog.load_seconds = time.perf_counter() - start
+    if catalog.load_seconds > COLD_START_BUDGET:
+        logger.warning(
+            "Catalog cold start took %.3fs (budget %.3fs)", catalog.load_seconds, COLD_START_BUDGET
+        )
+    return catalog
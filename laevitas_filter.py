@@ -0,0 +1,189 @@
+"""
+Row filtering and ranking of tool results for the Laevitas MCP Server
+"""
+
+import re
+import heapq
+import functools
+from typing import List, Optional, Any, Callable, Tuple
+from laevitas_output import row_key
+
+PREDICATE = re.compile(
+    r"^\s*([\w.]+)\s*(>=|<=|!=|==|=|>|<|not\s+in\b|between\b|in\b|contains\b)\s*(.*?)\s*$",
+    re.IGNORECASE,
+)
+
+SORT_BY = re.compile(r"^\s*([\w.]+)(?:\s+(asc|desc))?\s*$", re.IGNORECASE)
+
+
+def number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def lookup(path: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """Getter for a dotted path in a row; missing keys give None."""
+    if len(path) == 1:
+        key = path[0]
+        return lambda row: row.get(key) if isinstance(row, dict) else None
+
+    def get(row: Any) -> Any:
+        for key in path:
+            if not isinstance(row, dict):
+                return None
+            row = row.get(key)
+        return row
+
+    return get
+
+
+def split_values(text: str) -> List[str]:
+    return [v.strip().strip("'\"") for v in re.split(r"\s*,\s*|\s+and\s+|\s+", text.strip("[]() "), flags=re.IGNORECASE) if v.strip()]
+
+
+def matcher(operand: str) -> Callable[[Any], bool]:
+    """Equality test against a predicate operand: numeric when both sides are numbers, else case-insensitive."""
+    target = number(operand)
+    text = operand.lower()
+    if target is not None:
+        return lambda value: number(value) == target or (value is not None and str(value).lower() == text)
+    return lambda value: value is not None and str(value).lower() == text
+
+
+def compile_predicate(text: str) -> Callable[[Any], bool]:
+    """Compile one predicate such as 'strike between 90000 and 110000', 'maturity in 27JUN25,26SEP25'
+    or 'open_interest > 100' into a test on a row."""
+    match = PREDICATE.match(text)
+    if not match:
+        raise ValueError(f"invalid where predicate '{text}', expected '<field> <op> <value>'")
+    field, op, operand = match.groups()
+    op = " ".join(op.lower().split())
+    get = lookup(tuple(field.split(".")))
+    operand = operand.strip("'\"") if op not in ("in", "not in", "between") else operand
+
+    if op in ("=", "=="):
+        equals = matcher(operand)
+        return lambda row: equals(get(row))
+    if op == "!=":
+        equals = matcher(operand)
+        return lambda row: not equals(get(row))
+    if op in ("in", "not in"):
+        tests = [matcher(v) for v in split_values(operand)]
+        if not tests:
+            raise ValueError(f"where predicate '{text}' needs a list of values")
+        if op == "in":
+            return lambda row: any(test(get(row)) for test in tests)
+        return lambda row: not any(test(get(row)) for test in tests)
+    if op == "contains":
+        needle = operand.lower()
+        return lambda row: (lambda v: v is not None and needle in str(v).lower())(get(row))
+
+    bounds = [number(v) for v in (split_values(operand) if op == "between" else [operand])]
+    if None in bounds or (op == "between" and len(bounds) != 2):
+        raise ValueError(f"where predicate '{text}' needs numeric bounds")
+    if op == "between":
+        low, high = sorted(bounds)
+        return lambda row: (lambda v: v is not None and low <= v <= high)(number(get(row)))
+    bound = bounds[0]
+    compare = {
+        ">": lambda v: v > bound,
+        ">=": lambda v: v >= bound,
+        "<": lambda v: v < bound,
+        "<=": lambda v: v <= bound,
+    }[op]
+    return lambda row: (lambda v: v is not None and compare(v))(number(get(row)))
+
+
+@functools.lru_cache(maxsize=256)
+def row_filter(where: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """Compile predicates (all must hold) into a row transform returning the row or None."""
+    predicates = [compile_predicate(text) for text in where]
+
+    def keep(row: Any) -> Any:
+        for predicate in predicates:
+            if not predicate(row):
+                return None
+        return row
+
+    return keep
+
+
+@functools.lru_cache(maxsize=256)
+def sort_key(sort_by: str) -> Tuple[Callable[[Any], Any], bool]:
+    """Getter for the field of 'field' or 'field asc|desc' (default desc), and whether to sort descending."""
+    match = SORT_BY.match(sort_by)
+    if not match:
+        raise ValueError(f"invalid sort_by '{sort_by}', expected '<field> [asc|desc]'")
+    field, direction = match.groups()
+    return lookup(tuple(field.split("."))), (direction or "desc").lower() == "desc"
+
+
+def ranking_key(get: Callable[[Any], Any], descending: bool, numeric: bool) -> Callable[[Any], Any]:
+    """Key putting rows without a usable value last in either direction.
+
+    Numeric columns compare as floats (the common case, kept to one float per row);
+    other columns compare as strings.
+    """
+    if numeric:
+        last = float("-inf") if descending else float("inf")
+
+        def key(row: Any) -> float:
+            value = get(row)
+            if value.__class__ is float or value.__class__ is int:
+                return value
+            n = number(value) if value is not None else None
+            return last if n is None else n
+
+        return key
+    missing = (0, "") if descending else (1, "")
+    present = 1 if descending else 0
+
+    def text_key(row: Any) -> Tuple[int, str]:
+        value = get(row)
+        return missing if value is None else (present, str(value))
+
+    return text_key
+
+
+def query_rows(
+    rows: List[Any],
+    where: Optional[Tuple[str, ...]] = None,
+    sort_by: Optional[str] = None,
+    top_n: Optional[int] = None,
+) -> List[Any]:
+    """Filter rows, then sort them or pick the top_n with a heap (O(n log top_n))."""
+    if where:
+        keep = row_filter(where)
+        rows = [row for row in rows if keep(row) is not None]
+    if sort_by:
+        get, descending = sort_key(sort_by)
+        sample = next((v for v in map(get, rows) if v is not None), None)
+        key = ranking_key(get, descending, sample is None or number(sample) is not None)
+        if top_n is not None:
+            return (heapq.nlargest if descending else heapq.nsmallest)(max(top_n, 0), rows, key=key)
+        return sorted(rows, key=key, reverse=descending)
+    if top_n is not None:
+        return rows[:max(top_n, 0)]
+    return rows
+
+
+def apply_query(
+    result: Any,
+    where: Optional[Tuple[str, ...]] = None,
+    sort_by: Optional[str] = None,
+    top_n: Optional[int] = None,
+) -> Any:
+    """Apply query_rows to the row list of a result (top-level list, or under items/data)."""
+    if isinstance(result, list):
+        return query_rows(result, where, sort_by, top_n)
+    if isinstance(result, dict):
+        key = row_key(result)
+        if isinstance(result.get(key), list):
+            return {**result, key: query_rows(result[key], where, sort_by, top_n)}
+    return result
@@ -0,0 +1,172 @@
+"""
+Gamma exposure (GEX) for the Laevitas MCP Server
+
+Open interest by strike and expiry is laid out as dense (expiry, strike) arrays and
+joined with Black-76 gammas, so the dealer gamma profile of a whole market is evaluated
+over a grid of spot prices in one vectorized pass.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
+from laevitas_pricing import parse_instrument, year_fraction, black76
+
+# Fields naming a row's open interest, for rows with one option type each
+OI_FIELDS = ("open_interest", "openInterest", "oi", "value")
+
+# (call, put) field pairs, for rows carrying both sides of a strike
+SIDE_FIELDS = (
+    ("call_oi", "put_oi"),
+    ("c_oi", "p_oi"),
+    ("call_open_interest", "put_open_interest"),
+    ("calls", "puts"),
+    ("call", "put"),
+    ("c", "p"),
+)
+
+TYPE_FIELDS = ("option_type", "optionType", "type")
+
+MATURITY_FIELDS = ("maturity", "expiry")
+
+# Default price grid around spot, as relative moves
+GRID_RANGE = 0.2
+GRID_POINTS = 81
+
+
+def first(row: Dict[str, Any], fields: Tuple[str, ...]) -> Any:
+    return next((row[f] for f in fields if row.get(f) is not None), None)
+
+
+def oi_points(rows: Any) -> List[Tuple[Optional[str], float, bool, float]]:
+    """(maturity, strike, is_call, open_interest) of open interest rows.
+
+    Rows may name an instrument ('BTC-27JUN25-100000-C'), give strike with an option type
+    and one open interest, or give strike with call and put open interest side by side.
+    maturity is None for rows aggregated over expiries; unreadable rows are skipped.
+    """
+    points = []
+    for row in rows or []:
+        if not isinstance(row, dict):
+            continue
+        try:
+            if row.get("instrument"):
+                _, maturity, strike, is_call = parse_instrument(str(row["instrument"]))
+                points.append((maturity, strike, is_call, float(first(row, OI_FIELDS))))
+                continue
+            strike = float(row["strike"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        maturity = first(row, MATURITY_FIELDS)
+        maturity = str(maturity).upper() if maturity is not None else None
+        kind = str(first(row, TYPE_FIELDS) or "").lower()
+        oi = first(row, OI_FIELDS)
+        if kind in ("call", "put", "c", "p") and oi is not None:
+            try:
+                points.append((maturity, strike, kind in ("call", "c"), float(oi)))
+            except (TypeError, ValueError):
+                pass
+            continue
+        for call_field, put_field in SIDE_FIELDS:
+            if call_field in row or put_field in row:
+                for field, is_call in ((call_field, True), (put_field, False)):
+                    try:
+                        points.append((maturity, strike, is_call, float(row.get(field) or 0)))
+                    except (TypeError, ValueError):
+                        pass
+                break
+    return points
+
+
+def oi_grid(points: List[Tuple[str, float, bool, float]]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Dense (maturities, strikes, call_oi, put_oi); the OI arrays are (expiry, strike), zero where nothing is open."""
+    maturities = sorted({p[0] for p in points}, key=year_fraction)
+    strikes = np.array(sorted({p[1] for p in points}), dtype=float)
+    rows = {m: i for i, m in enumerate(maturities)}
+    e = np.array([rows[p[0]] for p in points], dtype=int)
+    k = np.searchsorted(strikes, [p[1] for p in points])
+    is_call = np.array([p[2] for p in points], dtype=bool)
+    oi = np.array([p[3] for p in points], dtype=float)
+    call_oi = np.zeros((len(maturities), strikes.size))
+    put_oi = np.zeros((len(maturities), strikes.size))
+    np.add.at(call_oi, (e[is_call], k[is_call]), oi[is_call])
+    np.add.at(put_oi, (e[~is_call], k[~is_call]), oi[~is_call])
+    return maturities, strikes, call_oi, put_oi
+
+
+def price_grid(spot: float, low: Optional[float] = None, high: Optional[float] = None, points: int = GRID_POINTS) -> np.ndarray:
+    low = spot * (1 - GRID_RANGE) if low is None else low
+    high = spot * (1 + GRID_RANGE) if high is None else high
+    if not 0 < low < high:
+        raise ValueError("the price grid needs 0 < low < high")
+    return np.linspace(low, high, max(int(points), 2))
+
+
+def gex_profile(
+    prices: np.ndarray,
+    spot: float,
+    forwards: np.ndarray,
+    t: np.ndarray,
+    strikes: np.ndarray,
+    vols: np.ndarray,
+    call_oi: np.ndarray,
+    put_oi: np.ndarray,
+    rate: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Dealer gamma exposure at each price of a grid, in USD per 1% move.
+
+    Dealers are taken to be long the calls and short the puts that are open, so
+    GEX = sum (call_oi - put_oi) * gamma * S^2 / 100, with open interest in units of the
+    underlying. Every expiry's forward moves in proportion to the price (forward * S / spot);
+    vols (percent, shape (expiry, strike)) stay fixed per strike. Gammas are evaluated as one
+    (price, expiry, strike) array. Returns total, call and put GEX per price, and GEX at
+    spot by (expiry, strike).
+    """
+    prices = np.asarray(prices, dtype=float)
+    moved = forwards[None, :, None] * (prices / spot)[:, None, None]
+    gamma = black76(moved, strikes[None, None, :], t[None, :, None], vols[None, :, :] / 100, True, rate)["gamma"]
+    scale = prices * prices / 100
+    call = np.einsum("pek,ek->p", gamma, call_oi) * scale
+    put = -np.einsum("pek,ek->p", gamma, put_oi) * scale
+    at_spot = black76(forwards[:, None], strikes[None, :], t[:, None], vols / 100, True, rate)["gamma"]
+    return {
+        "gex": call + put,
+        "call_gex": call,
+        "put_gex": put,
+        "by_strike": at_spot * (call_oi - put_oi) * spot * spot / 100,
+    }
+
+
+def zero_crossings(prices: np.ndarray, values: np.ndarray) -> List[Dict[str, Any]]:
+    """Prices where values change sign, linearly interpolated, with the sign they flip to as price rises."""
+    crossings = []
+    sign = np.sign(values)
+    for i in np.nonzero(sign[:-1] * sign[1:] < 0)[0]:
+        x0, x1, y0, y1 = prices[i], prices[i + 1], values[i], values[i + 1]
+        crossings.append({"price": float(x0 - y0 * (x1 - x0) / (y1 - y0)), "to": "positive" if y1 > 0 else "negative"})
+    return crossings
+
+
+def zero_gamma(crossings: List[Dict[str, Any]], spot: float) -> Optional[float]:
+    """The crossing nearest spot, the usual single zero-gamma level."""
+    if not crossings:
+        return None
+    return min((c["price"] for c in crossings), key=lambda price: abs(price - spot))
+
+
+def live_points(points: List[Tuple[Optional[str], float, bool, float]], maturities: Optional[List[str]] = None, now: Optional[datetime] = None) -> List[Tuple[str, float, bool, float]]:
+    """Points of unexpired maturities (and of `maturities`, if given) with open interest."""
+    wanted = {m.upper() for m in maturities} if maturities else None
+    expiries: Dict[str, float] = {}
+    kept = []
+    for point in points:
+        maturity = point[0]
+        if maturity is None or point[3] <= 0 or (wanted is not None and maturity not in wanted):
+            continue
+        if maturity not in expiries:
+            try:
+                expiries[maturity] = year_fraction(maturity, now)
+            except ValueError:
+                expiries[maturity] = 0.0
+        if expiries[maturity] > 0:
+            kept.append(point)
+    return kept
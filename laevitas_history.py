@@ -0,0 +1,324 @@
+"""
+Helpers for the paginated /historical endpoints of the Laevitas API
+"""
+
+import re
+import json
+import asyncio
+from collections import deque, OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Tuple
+
+# Largest page the historical endpoints serve
+PAGE_LIMIT = 144
+
+# Interval assumed for range splitting when a call gives no granularity
+DEFAULT_GRANULARITY = "1h"
+
+GRANULARITY = re.compile(r"^(\d+)([mhd])$")
+
+UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+
+async def fetch_all_pages(
+    fetch_page: Callable[[int], Awaitable[bytes]],
+    concurrency: int = 8,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Fetch every page of a paginated response and merge their items in page order.
+
+    Page 1 is fetched first to read meta.total_pages; the remaining pages are fetched
+    with at most `concurrency` requests in flight and consumed in order, so the merge
+    can stop (and cancel what is still running) as soon as the row or byte budget is
+    reached. `transform` is applied to each row before it counts towards max_rows;
+    rows it maps to None are dropped.
+    """
+    def kept(rows: List[Any]) -> List[Any]:
+        return rows if transform is None else [row for row in map(transform, rows) if row is not None]
+
+    body = await fetch_page(1)
+    first = json.loads(body)
+    if not isinstance(first, dict) or not isinstance(first.get("items"), list):
+        return first
+    meta = first.get("meta") or {}
+    total_pages = int(meta.get("total_pages") or 1)
+
+    items = kept(first["items"])
+    size = len(body)
+    fetched = 1
+    error = None
+    truncated = budget_reached(len(items), size, max_rows, max_bytes)
+
+    pages = iter(range(2, total_pages + 1))
+    pending = deque()
+    if not truncated:
+        for page in pages:
+            pending.append(asyncio.ensure_future(fetch_page(page)))
+            if len(pending) >= concurrency:
+                break
+    try:
+        while pending:
+            try:
+                body = await pending.popleft()
+            except Exception as e:
+                error = f"Error: {str(e)}"
+                break
+            items.extend(kept(json.loads(body).get("items") or []))
+            size += len(body)
+            fetched += 1
+            if budget_reached(len(items), size, max_rows, max_bytes):
+                truncated = fetched < total_pages
+                break
+            page = next(pages, None)
+            if page is not None:
+                pending.append(asyncio.ensure_future(fetch_page(page)))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if max_rows is not None and len(items) > max_rows:
+        del items[max_rows:]
+        truncated = True
+    merged_meta: Dict[str, Any] = {
+        "total": meta.get("total"),
+        "total_pages": total_pages,
+        "pages_fetched": fetched,
+        "items": len(items),
+        "bytes": size,
+        "truncated": truncated or error is not None,
+    }
+    if error is not None:
+        merged_meta["error"] = error
+    return {**first, "meta": merged_meta, "items": items}
+
+
+def budget_reached(rows: int, size: int, max_rows: Optional[int], max_bytes: Optional[int]) -> bool:
+    return (max_rows is not None and rows >= max_rows) or (max_bytes is not None and size >= max_bytes)
+
+
+def parse_instant(value: str) -> Optional[datetime]:
+    """Parse a time in the formats the API accepts: '2025-05-19', '2025-05-19T10:15',
+    '2025-05-04T14' (date_h) and epoch seconds or milliseconds. Naive times are UTC."""
+    try:
+        if value.isdigit():
+            stamp = int(value)
+            return datetime.fromtimestamp(stamp / 1000 if stamp > 10**11 else stamp, tz=timezone.utc)
+        if len(value) == 13:
+            value += ":00"
+        instant = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return instant if instant.tzinfo else instant.replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def granularity_seconds(granularity: Optional[str]) -> int:
+    match = GRANULARITY.match((granularity or DEFAULT_GRANULARITY).strip().lower())
+    if not match:
+        raise ValueError(f"unknown granularity '{granularity}', expected e.g. '5m', '1h' or '1d'")
+    return int(match.group(1)) * UNITS[match.group(2)]
+
+
+def plan_windows(start: str, end: str, granularity: Optional[str], rows: int = PAGE_LIMIT) -> List[Tuple[str, str]]:
+    """Split [start, end] into consecutive windows of `rows` rows at `granularity`.
+
+    Window boundaries are aligned to multiples of the window length since the epoch, so
+    the same window is requested (and cached) identically by different calls. The first
+    and last windows keep the caller's own start and end values.
+    """
+    begin, finish = parse_instant(start), parse_instant(end)
+    if begin is None or finish is None:
+        raise ValueError(f"cannot split the range '{start}' to '{end}'")
+    # Both ends of a window are inclusive, so rows - 1 intervals fill exactly one page
+    size = granularity_seconds(granularity) * max(rows - 1, 1)
+    first = int(begin.timestamp()) // size * size + size
+    bounds = [start]
+    stamp = first
+    while stamp < finish.timestamp():
+        bounds.append(datetime.fromtimestamp(stamp, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M"))
+        stamp += size
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
+
+
+async def fetch_windows(
+    fetch_window: Callable[[str, str], Awaitable[Any]],
+    windows: List[Tuple[str, str]],
+    concurrency: int = 8,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Fetch time windows concurrently and stitch their items into one series ordered by date.
+
+    fetch_window(start, end) returns the merged pages of one window (see fetch_all_pages).
+    Windows are consumed in order, so fetching stops at the row or byte budget. Adjacent
+    windows share their boundary instant; rows of a window whose date already appeared in
+    the previous window are dropped. As in fetch_all_pages, `transform` is applied to each
+    row before it counts towards max_rows, and rows it maps to None are dropped.
+    """
+    results: List[Any] = []
+    items: List[Any] = []
+    size = 0
+    pages = 0
+    error = None
+    truncated = False
+    previous_dates: set = set()
+
+    remaining = iter(windows)
+    pending = deque()
+    for window in remaining:
+        pending.append(asyncio.ensure_future(fetch_window(*window)))
+        if len(pending) >= concurrency:
+            break
+    try:
+        while pending:
+            try:
+                result = await pending.popleft()
+            except Exception as e:
+                error = f"Error: {str(e)}"
+                break
+            if not isinstance(result, dict) or not isinstance(result.get("items"), list):
+                return result
+            results.append(result)
+            meta = result.get("meta") or {}
+            size += meta.get("bytes") or 0
+            pages += meta.get("pages_fetched") or 1
+            truncated = truncated or bool(meta.get("truncated"))
+            rows = result["items"]
+            dates = {row.get("date") for row in rows if isinstance(row, dict)}
+            rows = [row for row in rows if not isinstance(row, dict) or row.get("date") not in previous_dates]
+            items.extend(rows if transform is None else [row for row in map(transform, rows) if row is not None])
+            previous_dates = dates
+            if budget_reached(len(items), size, max_rows, max_bytes):
+                truncated = len(results) < len(windows)
+                break
+            window = next(remaining, None)
+            if window is not None:
+                pending.append(asyncio.ensure_future(fetch_window(*window)))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    items.sort(key=date_key)
+    if max_rows is not None and len(items) > max_rows:
+        del items[max_rows:]
+        truncated = True
+    merged_meta: Dict[str, Any] = {
+        "windows": len(windows),
+        "windows_fetched": len(results),
+        "pages_fetched": pages,
+        "items": len(items),
+        "bytes": size,
+        "truncated": truncated or error is not None,
+    }
+    if error is not None:
+        merged_meta["error"] = error
+    first = results[0] if results else {}
+    return {**first, "meta": merged_meta, "items": items}
+
+
+def date_key(row: Any) -> Tuple[int, Any]:
+    """Sort key for rows by their date (epoch ms or ISO string); rows without one go first."""
+    value = row.get("date") if isinstance(row, dict) else None
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    instant = parse_instant(str(value))
+    return (1, instant.timestamp() * 1000) if instant is not None else (2, str(value))
+
+
+def row_time(row: Any) -> Optional[int]:
+    """Epoch milliseconds of a row's date, or None if it has none."""
+    rank, value = date_key(row)
+    return int(value) if rank == 1 else None
+
+
+class Cursors:
+    """High-water marks (latest row date, epoch ms) of polled series, least recently used dropped first."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._cursors: "OrderedDict[str, int]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[int]:
+        cursor = self._cursors.get(key)
+        if cursor is not None:
+            self._cursors.move_to_end(key)
+        return cursor
+
+    def set(self, key: str, cursor: int):
+        self._cursors[key] = cursor
+        self._cursors.move_to_end(key)
+        while len(self._cursors) > self.max_entries:
+            self._cursors.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+
+def rows_since(
+    result: Any,
+    cursor: Optional[int],
+    max_rows: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[Any, Optional[int]]:
+    """Keep the rows of a merged result dated after `cursor`, oldest first, and return the new cursor.
+
+    With max_rows, the oldest rows are kept so the next call resumes where this one
+    stopped. The cut falls on a date boundary, as rows sharing the cursor's date are not
+    fetched again; so fewer rows may be returned, or more when the first date alone
+    holds more than max_rows. `transform` is applied to each row before it counts
+    towards max_rows; rows it maps to None are dropped, and the cursor still moves past
+    them so they are not fetched again. If pages were missing from the result (a fetch
+    error or the byte budget), only the rows dated before the last date fetched are
+    known to be complete when the pages run oldest first; those are returned and the
+    cursor moves past them. Otherwise the cursor is held where it was.
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("items"), list):
+        return result, cursor
+    meta = result.get("meta") or {}
+    rows = [row for row in result["items"] if cursor is None or (row_time(row) or 0) > cursor]
+    rows.sort(key=date_key)
+    truncated = bool(meta.get("truncated"))
+    if truncated:
+        # The last date fetched may continue on the pages that are missing
+        fetched = [t for t in map(row_time, result["items"]) if t is not None]
+        ascending = all(a <= b for a, b in zip(fetched, fetched[1:]))
+        rows = [row for row in rows if ascending and fetched and (row_time(row) or 0) < fetched[-1]]
+    held = truncated and not rows
+    kept: List[Any] = []
+    latest = None
+    # Rows kept and the cursor before the current date's rows
+    boundary: Tuple[int, Optional[int]] = (0, None)
+    previous: Any = object()
+    for row in rows:
+        stamp = row_time(row)
+        if stamp != previous:
+            if max_rows is not None and len(kept) >= max_rows:
+                truncated = True
+                break
+            boundary, previous = (len(kept), latest), stamp
+        if stamp is not None:
+            latest = stamp
+        row = row if transform is None else transform(row)
+        if row is not None:
+            kept.append(row)
+    if max_rows is not None and len(kept) > max_rows and (boundary[0] or boundary[1] is not None):
+        # Leave the last date whole for the next call
+        del kept[boundary[0]:]
+        latest = boundary[1]
+        truncated = True
+    new_cursor = cursor if held or latest is None else latest
+    merged_meta = {
+        "previous_cursor": cursor,
+        "cursor": new_cursor,
+        "cursor_held": held,
+        "new_rows": len(kept),
+        "truncated": truncated,
+    }
+    if meta.get("error"):
+        merged_meta["error"] = meta["error"]
+    return {**result, "meta": merged_meta, "items": kept}, new_cursor
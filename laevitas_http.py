@@ -0,0 +1,129 @@
+"""
+HTTP client setup for the Laevitas MCP Server
+"""
+
+import time
+import asyncio
+import logging
+import importlib.util
+from contextlib import asynccontextmanager, suppress
+from typing import Dict, Optional, Any
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    """HTTP/2 support needs the optional h2 package (pip install 'httpx[http2]')."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def make_client(
+    base_url: str,
+    headers: Dict[str, str],
+    timeout: float,
+    http2: bool = False,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+) -> httpx.AsyncClient:
+    """Create the shared client with an explicit connection pool.
+
+    With http2, concurrent requests are multiplexed over one connection per host
+    instead of each opening its own TLS connection. If h2 is not installed the client
+    falls back to HTTP/1.1 with a warning.
+    """
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+def pool_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Connections currently held by the client's pool, by HTTP version and state.
+
+    The pool is reached through private httpx/httpcore attributes; if they are missing
+    (another transport, or a changed httpx), the counts are None rather than an error.
+    """
+    try:
+        connections = list(client._transport._pool.connections)
+        stats: Dict[str, Any] = {"connections": len(connections), "http2": 0, "idle": 0}
+        for connection in connections:
+            if "HTTP/2" in connection.info():
+                stats["http2"] += 1
+            if connection.is_idle():
+                stats["idle"] += 1
+    except AttributeError:
+        return {"connections": None, "http2": None, "idle": None}
+    return stats
+
+
+class ConnectionWarmer:
+    """Open pooled connections before the first tool call and keep them from going idle.
+
+    warm() sends `connections` concurrent HEAD requests, so DNS, TCP and TLS setup is
+    paid up front and the pool holds that many live connections (one with HTTP/2).
+    While running, the same is repeated every `ping_interval` seconds, which should be
+    shorter than the pool's keepalive expiry. The response status is irrelevant.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, connections: int = 0, ping_interval: float = 25.0, path: str = "/"):
+        self.client = client
+        self.connections = connections
+        self.ping_interval = ping_interval
+        self.path = path
+        self.last_warm_seconds: Optional[float] = None
+        self.counters = {"warmups": 0, "pings": 0, "failures": 0}
+
+    async def warm(self):
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[self.client.head(self.path) for _ in range(self.connections)], return_exceptions=True
+        )
+        self.counters["pings"] += len(results)
+        self.counters["failures"] += sum(isinstance(r, Exception) for r in results)
+        self.counters["warmups"] += 1
+        self.last_warm_seconds = time.perf_counter() - start
+
+    @asynccontextmanager
+    async def running(self):
+        """Warm the pool in the background for the duration of the block."""
+        if self.connections <= 0:
+            yield
+            return
+        task = asyncio.ensure_future(self._run())
+        try:
+            yield
+        finally:
+            # Wait for a warm-up in flight to unwind, so none is left pending at shutdown
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connections": self.connections,
+            "ping_interval": self.ping_interval,
+            **self.counters,
+            "last_warm_seconds": round(self.last_warm_seconds, 4) if self.last_warm_seconds is not None else None,
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                await self.warm()
+            except Exception as e:
+                logger.warning("Connection warm-up failed: %s", e)
+            if self.ping_interval <= 0:
+                return
+            await asyncio.sleep(self.ping_interval)
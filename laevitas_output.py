@@ -0,0 +1,148 @@
+"""
+Serialization of tool results for the Laevitas MCP Server
+"""
+
+import json
+import functools
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+def to_json(result: Any) -> str:
+    """Serialize a tool result as compact JSON; error strings are returned unchanged."""
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def body_to_text(body: bytes) -> str:
+    """Pass an untransformed response body through as text instead of decoding and re-encoding it."""
+    return body.decode("utf-8")
+
+
+def to_columnar(result: Any) -> Any:
+    """Convert the row list of a historical response into {columns, data: {column: [values]}}.
+
+    Built in a single pass over the rows; rows missing a column get None. Other top-level
+    keys (e.g. meta) are kept. Results without a row list are returned unchanged.
+    """
+    if not isinstance(result, dict):
+        return result
+    key = row_key(result)
+    rows = result.get(key)
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return result
+    data = {}
+    for i, row in enumerate(rows):
+        for name, value in row.items():
+            column = data.get(name)
+            if column is None:
+                column = data[name] = [None] * i
+            column.append(value)
+        if len(row) != len(data):
+            for column in data.values():
+                if len(column) <= i:
+                    column.append(None)
+    columnar = {k: v for k, v in result.items() if k != key}
+    columnar["columns"] = list(data)
+    columnar["data"] = data
+    return columnar
+
+
+def row_key(result: Dict[str, Any]) -> str:
+    return "items" if isinstance(result.get("items"), list) else "data"
+
+
+def rows_of(result: Any) -> Optional[List[Any]]:
+    """The row list of a result (a top-level list, or under items/data), or None if it has none."""
+    if isinstance(result, dict) and isinstance(result.get(row_key(result)), list):
+        return result[row_key(result)]
+    if isinstance(result, list):
+        return result
+    return None
+
+
+def tag_rows(result: Any, column: str, value: Any) -> List[Any]:
+    """The rows of a result, each with `column` set to `value` (e.g. the market it came from).
+
+    The tag replaces a field of the row with the same name. A result without a row list
+    counts as one row; non-object rows go under 'value'.
+    """
+    rows = rows_of(result)
+    if rows is None:
+        rows = [result]
+    return [{**row, column: value} if isinstance(row, dict) else {column: value, "value": row} for row in rows]
+
+
+def compile_tree(tree: Optional[Dict[str, Any]]) -> Callable[[Any], Any]:
+    """Build a function keeping only the keys in `tree` (nested dicts of path segments).
+
+    Lists are traversed transparently; a leaf (None) keeps the whole value.
+    """
+    if tree is None:
+        return lambda value: value
+    children = [(key, compile_tree(subtree)) for key, subtree in tree.items()]
+
+    def project(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: child(value[key]) for key, child in children if key in value}
+        if isinstance(value, list):
+            return [project(item) for item in value]
+        return value
+
+    return project
+
+
+def field_tree(fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Merge dotted paths into nested dicts; a path ending at a key (None) keeps it whole."""
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        parts = [part for part in field.split(".") if part]
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1:
+                node[part] = None
+            elif part in node and node[part] is None:
+                break
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+@functools.lru_cache(maxsize=256)
+def projection(fields: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """Compile a field list such as ('date', 'items.open_interest') into a projection function.
+
+    Paths are dotted and resolved from the top of the response. In responses that wrap
+    their rows (under items or data), paths whose first segment is not a top-level key
+    are resolved in each row instead, so ('strike', 'iv') projects the rows.
+    Compiled functions are cached per field list.
+    """
+    tree = field_tree(fields)
+    top = compile_tree(tree)
+    children = {name: compile_tree(subtree) for name, subtree in tree.items()}
+    row_projections: Dict[Tuple[str, Tuple[str, ...]], Callable[[Any], Any]] = {}
+
+    def row_projection(key: str, names: Tuple[str, ...]) -> Callable[[Any], Any]:
+        compiled = row_projections.get((key, names))
+        if compiled is None:
+            subtree = {name: tree[name] for name in names}
+            if isinstance(tree.get(key), dict):
+                subtree.update(tree[key])
+            compiled = row_projections[(key, names)] = compile_tree(subtree)
+        return compiled
+
+    def project(result: Any) -> Any:
+        if not isinstance(result, dict):
+            return top(result)
+        key = row_key(result)
+        rows = result.get(key)
+        names = tuple(name for name in tree if name not in result)
+        if not isinstance(rows, list) or not names:
+            return top(result)
+        projected = {name: children[name](result[name]) for name in tree if name in result and name != key}
+        if key in tree and tree[key] is None:
+            projected[key] = rows
+        else:
+            projected[key] = row_projection(key, names)(rows)
+        return projected
+
+    return project
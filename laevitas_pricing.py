@@ -0,0 +1,417 @@
+"""
+Local option pricing for the Laevitas MCP Server
+
+Black-76 prices and Greeks on forwards (the crypto options convention), vectorized with
+NumPy so a whole chain is priced in one pass.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
+from laevitas_catalog import maturity_date
+from laevitas_history import row_time
+from laevitas_output import rows_of
+
+# Exchanges settle options at 08:00 UTC on the expiry date
+EXPIRY_HOUR = 8
+
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+
+# Instrument names such as BTC-27JUN25-100000-C or XRP-31JAN25-2.5-P
+INSTRUMENT = re.compile(r"^([A-Z0-9_]+)-(\d{1,2}[A-Z]{3}\d{2})-(\d+(?:[.d]\d+)?)-([CP])$", re.IGNORECASE)
+
+# Futures names such as BTC-27JUN25 or BTC-PERPETUAL
+FUTURE = re.compile(r"^([A-Z0-9_]+)-(\d{1,2}[A-Z]{3}\d{2}|PERPETUAL)$", re.IGNORECASE)
+
+# Default risk slide grid: relative spot moves, and vol moves in vol points
+SPOT_SHOCKS = (-0.3, -0.2, -0.15, -0.1, -0.05, 0.0, 0.05, 0.1, 0.15, 0.2, 0.3)
+VOL_SHOCKS = (-20.0, -10.0, 0.0, 10.0, 20.0)
+
+GREEKS = ("price", "delta", "gamma", "vega", "theta", "rho")
+
+# Volatility bracket searched by implied_vol (decimal)
+MIN_VOL = 1e-6
+MAX_VOL = 20.0
+
+# Markets quoting BTC and ETH options in the underlying rather than in USD
+COIN_QUOTED_MARKETS = {"deribit", "okx"}
+COIN_QUOTED_CURRENCIES = {"BTC", "ETH"}
+
+SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF to double precision (Hart's rational approximation, as given by West)."""
+    x = np.asarray(x, dtype=float)
+    a = np.abs(x)
+    e = np.exp(-0.5 * a * a)
+    num = ((((((3.52624965998911e-02 * a + 0.700383064443688) * a + 6.37396220353165) * a
+              + 33.912866078383) * a + 112.079291497871) * a + 221.213596169931) * a + 220.206867912376)
+    den = (((((((8.83883476483184e-02 * a + 1.75566716318264) * a + 16.064177579207) * a
+               + 86.7807322029461) * a + 296.564248779674) * a + 637.333633378831) * a
+            + 793.826512519948) * a + 440.413735824752)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fraction = a + 1 / (a + 2 / (a + 3 / (a + 4 / (a + 0.65))))
+        tail = np.where(a < 7.07106781186547, e * num / den, e / fraction / 2.506628274631)
+    tail = np.where(a > 37, 0.0, tail)
+    return np.where(x > 0, 1 - tail, tail)
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def black76(
+    forward: Any,
+    strike: Any,
+    t: Any,
+    vol: Any,
+    is_call: Any,
+    rate: Any = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Black-76 price and Greeks for arrays of options (inputs broadcast together).
+
+    vol is a decimal (0.55 for 55%) and t is in years. Prices are in the forward's
+    currency. delta and gamma are with respect to the forward, vega is per vol point
+    (0.01), theta per calendar day and rho per 1% of rate. Expired options (t <= 0)
+    are worth their discounted intrinsic value with zero time Greeks.
+    """
+    forward, strike, t, vol, rate = (np.asarray(v, dtype=float) for v in (forward, strike, t, vol, rate))
+    is_call = np.asarray(is_call, dtype=bool)
+    forward, strike, t, vol, is_call, rate = np.broadcast_arrays(forward, strike, t, vol, is_call, rate)
+    live = (t > 0) & (vol > 0)
+    tau = np.where(live, t, 1.0)
+    sigma = np.where(live, vol, 1.0)
+    sqrt_t = np.sqrt(tau)
+    discount = np.exp(-rate * np.maximum(t, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(forward / strike) + 0.5 * sigma * sigma * tau) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    sign = np.where(is_call, 1.0, -1.0)
+    nd1 = norm_cdf(sign * d1)
+    nd2 = norm_cdf(sign * d2)
+    pdf = norm_pdf(d1)
+
+    intrinsic = np.maximum(sign * (forward - strike), 0.0)
+    price = np.where(live, discount * sign * (forward * nd1 - strike * nd2), discount * intrinsic)
+    delta = np.where(live, discount * sign * nd1, discount * sign * (intrinsic > 0))
+    gamma = np.where(live, discount * pdf / (forward * sigma * sqrt_t), 0.0)
+    vega = np.where(live, discount * forward * pdf * sqrt_t, 0.0)
+    theta = np.where(live, -discount * forward * pdf * sigma / (2 * sqrt_t) + rate * price, 0.0)
+    rho = -np.maximum(t, 0) * price
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": gamma,
+        "vega": vega / 100,
+        "theta": theta / 365,
+        "rho": rho / 100,
+    }
+
+
+def parse_instrument(name: str) -> Tuple[str, str, float, bool]:
+    """Split an instrument name into (currency, maturity, strike, is_call)."""
+    match = INSTRUMENT.match(name.strip())
+    if not match:
+        raise ValueError(f"invalid instrument '{name}', expected e.g. 'BTC-27JUN25-100000-C'")
+    currency, maturity, strike, kind = match.groups()
+    return currency.upper(), maturity.upper(), float(strike.replace("d", ".")), kind.upper() == "C"
+
+
+def expiry_time(maturity: str) -> datetime:
+    expiry = maturity_date(maturity.upper())
+    if expiry is None:
+        raise ValueError(f"invalid maturity '{maturity}', expected e.g. '27JUN25'")
+    return datetime(expiry.year, expiry.month, expiry.day, EXPIRY_HOUR, tzinfo=timezone.utc)
+
+
+def year_fraction(maturity: str, now: Optional[datetime] = None) -> float:
+    """Years from now to the 08:00 UTC expiry of a maturity code (negative once expired)."""
+    now = now or datetime.now(timezone.utc)
+    return (expiry_time(maturity) - now).total_seconds() / SECONDS_PER_YEAR
+
+
+def price_legs(
+    legs: List[Dict[str, Any]],
+    forward: Optional[float] = None,
+    rate: float = 0.0,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Price a multi-leg strategy; each leg's Greeks are per contract and scaled by its quantity.
+
+    A leg names its option either as instrument ('BTC-27JUN25-100000-C') or with type
+    ('call'/'put'), strike and maturity ('27JUN25') or years. vol is in percent, as
+    Laevitas reports implied volatility. quantity is signed (negative for short) and
+    defaults to 1; forward defaults to the strategy's.
+    """
+    if not legs:
+        raise ValueError("legs must list at least one option")
+    forwards, strikes, times, vols, calls, quantities = [], [], [], [], [], []
+    for i, leg in enumerate(legs):
+        if not isinstance(leg, dict):
+            raise ValueError(f"leg {i} must be an object")
+        if leg.get("instrument"):
+            _, maturity, strike, is_call = parse_instrument(str(leg["instrument"]))
+        else:
+            kind = str(leg.get("type") or "").lower()
+            if kind not in ("call", "put", "c", "p"):
+                raise ValueError(f"leg {i} needs instrument, or type 'call' or 'put'")
+            is_call = kind in ("call", "c")
+            maturity = leg.get("maturity")
+            strike = leg.get("strike")
+            if strike is None:
+                raise ValueError(f"leg {i} needs a strike")
+        if leg.get("years") is not None:
+            t = float(leg["years"])
+        elif maturity:
+            t = year_fraction(str(maturity), now)
+        else:
+            raise ValueError(f"leg {i} needs a maturity or years")
+        leg_forward = leg.get("forward", forward)
+        if leg_forward is None or leg.get("vol") is None:
+            raise ValueError(f"leg {i} needs a forward and a vol")
+        forwards.append(float(leg_forward))
+        strikes.append(float(strike))
+        times.append(t)
+        vols.append(float(leg["vol"]) / 100)
+        calls.append(is_call)
+        quantities.append(float(leg.get("quantity", 1)))
+
+    quantity = np.array(quantities)
+    greeks = black76(forwards, strikes, times, vols, calls, rate)
+    rows = []
+    for i, leg in enumerate(legs):
+        row = {
+            "instrument": leg.get("instrument"),
+            "type": "call" if calls[i] else "put",
+            "strike": strikes[i],
+            "years": round(times[i], 6),
+            "forward": forwards[i],
+            "vol": float(leg["vol"]),
+            "quantity": quantities[i],
+        }
+        row.update({name: float(greeks[name][i]) for name in GREEKS})
+        row["price_coin"] = row["price"] / forwards[i]
+        rows.append(row)
+    total = {name: float(np.dot(quantity, greeks[name])) for name in GREEKS}
+    return {"legs": rows, "total": total}
+
+
+def undiscounted_otm(sigma: np.ndarray, forward: np.ndarray, strike: np.ndarray, t: np.ndarray, sign: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Undiscounted Black price, vega and volga (d vega / d sigma) of calls (sign 1) or puts (-1)."""
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(forward / strike) + 0.5 * sigma * sigma * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    price = sign * (forward * norm_cdf(sign * d1) - strike * norm_cdf(sign * d2))
+    vega = forward * norm_pdf(d1) * sqrt_t
+    return price, vega, vega * d1 * d2 / sigma
+
+
+def implied_vol(
+    price: Any,
+    forward: Any,
+    strike: Any,
+    t: Any,
+    is_call: Any,
+    rate: Any = 0.0,
+    tol: float = 1e-10,
+    max_iter: int = 50,
+) -> np.ndarray:
+    """Black-76 implied volatility (decimal) of arrays of option prices; NaN where none exists.
+
+    Each option is solved through its out-of-the-money counterpart (put-call parity),
+    whose price is numerically better conditioned. The Corrado-Miller closed form gives
+    the starting point; Halley steps then converge in a few iterations, and a step that
+    leaves the bracket known to hold the root falls back to bisection. Only unconverged
+    options are iterated further. Prices outside the no-arbitrage bounds get NaN.
+    """
+    price, forward, strike, t, rate = (np.asarray(v, dtype=float) for v in (price, forward, strike, t, rate))
+    is_call = np.asarray(is_call, dtype=bool)
+    price, forward, strike, t, is_call, rate = np.broadcast_arrays(price, forward, strike, t, is_call, rate)
+    shape = price.shape
+    price, forward, strike, t, is_call, rate = (a.ravel() for a in (price, forward, strike, t, is_call, rate))
+
+    undiscounted = price * np.exp(rate * np.maximum(t, 0))
+    otm_call = strike >= forward
+    sign = np.where(otm_call, 1.0, -1.0)
+    parity = np.where(is_call, 1.0, -1.0) * (forward - strike)
+    target = np.where(is_call == otm_call, undiscounted, undiscounted - parity)
+    with np.errstate(invalid="ignore"):
+        valid = (t > 0) & (forward > 0) & (strike > 0) & (target > 0) & (target < np.where(otm_call, forward, strike))
+    vol = np.full(price.shape, np.nan)
+    index = np.flatnonzero(valid)
+    if index.size == 0:
+        return vol.reshape(shape)
+    f, k, tt, s, goal = forward[index], strike[index], t[index], sign[index], target[index]
+
+    # Corrado-Miller, on the call price
+    call = np.where(s > 0, goal, goal + (f - k))
+    half = call - (f - k) / 2
+    root = np.sqrt(np.maximum(half * half - (f - k) ** 2 / np.pi, 0.0))
+    sigma = np.sqrt(2 * np.pi) / (f + k) * (half + root) / np.sqrt(tt)
+    lo = np.full(index.size, MIN_VOL)
+    hi = np.full(index.size, MAX_VOL)
+    sigma = np.where(np.isfinite(sigma) & (sigma > lo) & (sigma < hi), sigma, 0.5)
+
+    active = np.arange(index.size)
+    for _ in range(max_iter):
+        x = sigma[active]
+        model, vega, volga = undiscounted_otm(x, f[active], k[active], tt[active], s[active])
+        diff = model - goal[active]
+        done = (np.abs(diff) <= tol * goal[active]) | (hi[active] - lo[active] <= tol * x)
+        lo[active] = np.where(diff < 0, x, lo[active])
+        hi[active] = np.where(diff > 0, x, hi[active])
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            step = diff / vega
+            step = step / (1 - 0.5 * step * volga / vega)
+            nxt = x - step
+        bisect = ~np.isfinite(nxt) | (nxt <= lo[active]) | (nxt >= hi[active])
+        sigma[active] = np.where(done, x, np.where(bisect, 0.5 * (lo[active] + hi[active]), nxt))
+        active = active[~done]
+        if active.size == 0:
+            break
+    # Prices beyond what MAX_VOL can reach stay unsolved
+    sigma[active] = np.nan
+    vol[index] = sigma
+    return vol.reshape(shape)
+
+
+def add_implied_vol(result: Any, now: Optional[datetime] = None) -> Any:
+    """Add iv (percent) to each option trade of a result, solved from its own price.
+
+    Rows need price, index_price (used as the forward), strike, maturity, option_type
+    and date; others get iv None. Prices of BTC and ETH options on markets quoting in
+    the underlying (COIN_QUOTED_MARKETS) are converted to USD with index_price.
+    """
+    rows = rows_of(result)
+    if rows is None:
+        return result
+    expiries: Dict[str, Optional[float]] = {}
+    picked, prices, forwards, strikes, times, calls = [], [], [], [], [], []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        row["iv"] = None
+        try:
+            price, forward, strike = float(row["price"]), float(row["index_price"]), float(row["strike"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        maturity = str(row.get("maturity") or "").upper()
+        if maturity not in expiries:
+            try:
+                expiries[maturity] = expiry_time(maturity).timestamp() * 1000
+            except ValueError:
+                expiries[maturity] = None
+        stamp = row_time(row) if row.get("date") is not None else (now or datetime.now(timezone.utc)).timestamp() * 1000
+        kind = str(row.get("option_type") or "").lower()
+        if expiries[maturity] is None or stamp is None or kind not in ("call", "put", "c", "p"):
+            continue
+        if str(row.get("market") or "").lower() in COIN_QUOTED_MARKETS and str(row.get("currency") or "").upper() in COIN_QUOTED_CURRENCIES:
+            price *= forward
+        picked.append(row)
+        prices.append(price)
+        forwards.append(forward)
+        strikes.append(strike)
+        times.append((expiries[maturity] - stamp) / 1000 / SECONDS_PER_YEAR)
+        calls.append(kind in ("call", "c"))
+    if picked:
+        vols = implied_vol(prices, forwards, strikes, times, calls)
+        for row, vol in zip(picked, vols.tolist()):
+            row["iv"] = round(vol * 100, 4) if vol == vol else None
+    return result
+
+
+def parse_position(name: str) -> Tuple[str, str, Optional[float], Optional[bool]]:
+    """Split an option or futures name into (currency, maturity, strike, is_call); futures have no strike."""
+    match = FUTURE.match(name.strip())
+    if match:
+        return match.group(1).upper(), match.group(2).upper(), None, None
+    return parse_instrument(name)
+
+
+def smile_vols(rows: Any, strikes: List[float]) -> np.ndarray:
+    """Mark IVs (percent) at `strikes`, linearly interpolated over the listed strikes (flat beyond)."""
+    points = sorted(
+        (float(row["strike"]), float(row["mark_iv"]))
+        for row in rows
+        if isinstance(row, dict) and row.get("strike") is not None and row.get("mark_iv") not in (None, 0)
+    )
+    if not points:
+        return np.full(len(strikes), np.nan)
+    listed, ivs = np.array(points).T
+    return np.interp(np.asarray(strikes, dtype=float), listed, ivs)
+
+
+def curve_forward(rows: Any, maturity: str, now: Optional[datetime] = None) -> Optional[float]:
+    """Forward for a maturity from futures curve rows ({maturity, value}), interpolated in time.
+
+    A listed maturity is used as is; otherwise the curve is interpolated linearly in time
+    to expiry and held flat beyond its ends. PERPETUAL only matches itself.
+    """
+    values = {str(row.get("maturity")).upper(): row.get("value") for row in rows if isinstance(row, dict)}
+    value = values.get(maturity.upper())
+    if value is not None:
+        return float(value)
+    if maturity.upper() == "PERPETUAL":
+        return None
+    points = []
+    for name, value in values.items():
+        if value is None or maturity_date(name) is None:
+            continue
+        points.append((year_fraction(name, now), float(value)))
+    if not points:
+        return None
+    times, forwards = np.array(sorted(points)).T
+    return float(np.interp(year_fraction(maturity, now), times, forwards))
+
+
+def risk_slide(
+    forward: Any,
+    strike: Any,
+    t: Any,
+    vol: Any,
+    is_call: Any,
+    quantity: Any,
+    is_option: Any,
+    spot_shocks: Any = SPOT_SHOCKS,
+    vol_shocks: Any = VOL_SHOCKS,
+    days: float = 0.0,
+    rate: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """Portfolio PnL and Greeks over a spot x vol shock grid, as one (legs, spots, vols) evaluation.
+
+    Every forward moves by the same relative spot shock; vol shocks are in vol points added
+    to each leg's vol (percent, floored at 0.01). days moves the valuation date forward.
+    Futures legs (is_option False) are marked against their current forward, so they are
+    worth (shocked forward - forward) x quantity, with a delta of one, and add no notional
+    to value. Returns (spots, vols) arrays of pnl against today's value and of the
+    quantity-weighted Greeks.
+    """
+    forward, strike, t, vol, quantity = (np.asarray(v, dtype=float) for v in (forward, strike, t, vol, quantity))
+    is_call, is_option = np.asarray(is_call, dtype=bool), np.asarray(is_option, dtype=bool)
+    spots = 1 + np.asarray(spot_shocks, dtype=float)
+    vols = np.asarray(vol_shocks, dtype=float)
+    strike = np.where(is_option, strike, 1.0)
+
+    base = black76(forward, strike, t, vol / 100, is_call, rate)["price"]
+    base = np.where(is_option, base, 0.0)
+    shocked = black76(
+        forward[:, None, None] * spots[None, :, None],
+        strike[:, None, None],
+        (t - days / 365)[:, None, None],
+        np.maximum(vol[:, None, None] + vols[None, None, :], 0.01) / 100,
+        is_call[:, None, None],
+        rate,
+    )
+    option = is_option[:, None, None]
+    moved = forward[:, None, None] * (spots[None, :, None] - 1) * np.ones((1, 1, vols.size))
+    shocked["price"] = np.where(option, shocked["price"], moved)
+    shocked["delta"] = np.where(option, shocked["delta"], 1.0)
+    for name in ("gamma", "vega", "theta", "rho"):
+        shocked[name] = np.where(option, shocked[name], 0.0)
+    slide = {"pnl": np.einsum("l,lsv->sv", quantity, shocked["price"] - base[:, None, None])}
+    for name in ("delta", "gamma", "vega", "theta"):
+        slide[name] = np.einsum("l,lsv->sv", quantity, shocked[name])
+    slide["value"] = np.dot(quantity, base)
+    return slide
@@ -0,0 +1,132 @@
+"""
+Retries of transient upstream failures for the Laevitas MCP Server
+"""
+
+import time
+import random
+import asyncio
+import contextvars
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Any, Callable, Awaitable
+import httpx
+
+# Statuses worth retrying: the request may succeed unchanged a moment later
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+# Connect errors, timeouts and dropped connections
+RETRYABLE_EXCEPTIONS = (httpx.TransportError,)
+
+# Monotonic time by which the current tool call must finish, set by deadline_scope()
+call_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("call_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float):
+    """Give every upstream call made inside the block (including spawned tasks) a shared deadline.
+
+    Nested scopes never extend the deadline of an enclosing one (e.g. a batch item's budget).
+    """
+    deadline = time.monotonic() + seconds
+    outer = call_deadline.get()
+    token = call_deadline.set(deadline if outer is None else min(deadline, outer))
+    try:
+        yield
+    finally:
+        call_deadline.reset(token)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Retry idempotent requests on transient failures with capped exponential backoff.
+
+    The delay before retry n is drawn uniformly from [0, min(max_delay, base_delay * 2**n)]
+    ("full jitter"), or is the server's Retry-After if that is longer. No retry is started
+    that would end past the tool call's deadline.
+    """
+
+    def __init__(self, attempts: int = 4, base_delay: float = 0.25, max_delay: float = 8.0, deadline: float = 60.0):
+        self.attempts = max(attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.counters = {"retries": 0, "recovered": 0, "exhausted": 0, "deadline_exceeded": 0}
+        self.reasons: Dict[str, int] = {}
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def run(self, method: str, call: Callable[[float], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Run call(timeout) until it succeeds, fails permanently, or retries run out.
+
+        Returns the last response (the caller checks its status) or raises the last
+        retryable exception.
+        """
+        deadline = call_deadline.get() or time.monotonic() + self.deadline
+        retryable = method.upper() == "GET"
+        attempt = 0
+        while True:
+            attempt += 1
+            error: Optional[Exception] = None
+            response: Optional[httpx.Response] = None
+            retry_after = None
+            try:
+                response = await call(max(deadline - time.monotonic(), 0.001))
+            except RETRYABLE_EXCEPTIONS as e:
+                error = e
+                reason = type(e).__name__
+            else:
+                if response.status_code not in RETRYABLE_STATUSES:
+                    if attempt > 1:
+                        self.counters["recovered"] += 1
+                    return response
+                reason = str(response.status_code)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if not retryable:
+                return self._give_up(response, error)
+            if attempt >= self.attempts:
+                self.counters["exhausted"] += 1
+                return self._give_up(response, error)
+            delay = self.backoff(attempt - 1, retry_after)
+            if time.monotonic() + delay >= deadline:
+                self.counters["deadline_exceeded"] += 1
+                return self._give_up(response, error)
+            self.counters["retries"] += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "deadline_seconds": self.deadline,
+            **self.counters,
+            "reasons": dict(self.reasons),
+        }
+
+    @staticmethod
+    def _give_up(response: Optional[httpx.Response], error: Optional[Exception]) -> httpx.Response:
+        if error is not None:
+            raise error
+        return response
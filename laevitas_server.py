@@ -4,16 +4,41 @@ Laevitas MCP Server
 
 import os
 import json
-from typing import Dict, List, Optional, Any
+import time
+import asyncio
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any, Tuple, Callable, AsyncIterator
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-import httpx
+from pydantic import ValidationError
+import numpy as np
+from laevitas_cache import ResponseCache, SingleFlight, normalize_params, cache_key, parse_range_end
+from laevitas_history import fetch_all_pages, fetch_windows, plan_windows, parse_instant, rows_since, Cursors, PAGE_LIMIT
+from laevitas_store import SeriesStore, fetch_with_store, series_key
+from laevitas_pricing import price_legs, add_implied_vol, parse_position, smile_vols, curve_forward, risk_slide, year_fraction, SPOT_SHOCKS, VOL_SHOCKS
+from laevitas_surface import Surface, SurfaceCache, maturity_codes, tenor_years
+from laevitas_gex import oi_points, live_points, oi_grid, price_grid, gex_profile, zero_crossings, zero_gamma, GRID_POINTS
+from laevitas_output import to_json, body_to_text, to_columnar, projection, tag_rows, rows_of
+from laevitas_tools import EndpointSpec, register_tools
+from laevitas_catalog import get_catalog
+from laevitas_throttle import TokenBucket, AdaptiveLimiter, Throttle
+from laevitas_retry import RetryPolicy, deadline_scope
+from laevitas_http import make_client, pool_stats, ConnectionWarmer
+from laevitas_stream import collect_rows, single_chunk
+from laevitas_filter import row_filter, sort_key, apply_query
 
 # Load environment variables
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Keep pre-warmed connections to the API open while the server runs."""
+    async with warmer.running():
+        yield {}
+
 # Initialize FastMCP server
-mcp = FastMCP("laevitas")
+mcp = FastMCP("laevitas", lifespan=lifespan)
 
 # Load API key
 LAEVITAS_API_KEY = os.getenv("LAEVITAS_API_KEY")
@@ -23,4595 +48,867 @@ if not LAEVITAS_API_KEY:
 # Base URL for Laevitas API
 BASE_URL = "https://api.laevitas.ch"
 
-# HTTP client
-client = httpx.AsyncClient(
-    base_url=BASE_URL,
+# HTTP client (LAEVITAS_HTTP2=1 multiplexes concurrent requests over one connection)
+REQUEST_TIMEOUT = 30.0
+client = make_client(
+    BASE_URL,
     headers={"apiKey": LAEVITAS_API_KEY},
-    timeout=30.0
+    timeout=REQUEST_TIMEOUT,
+    http2=os.getenv("LAEVITAS_HTTP2", "0").lower() in ("1", "true", "yes"),
+    max_connections=int(os.getenv("LAEVITAS_MAX_CONNECTIONS", "20")),
+    max_keepalive_connections=int(os.getenv("LAEVITAS_MAX_KEEPALIVE", "10")),
+    keepalive_expiry=float(os.getenv("LAEVITAS_KEEPALIVE_EXPIRY", "30")),
 )
 
-async def make_request(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
-    """Make a request to the Laevitas API."""
-    try:
-        response = await client.request(method, endpoint, params=params)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-
-@mcp.tool()
-async def getatmimpliedvolatilitytimelapse(market: str, currency: str) -> str:
-    """ ATM Implied Volatility Time Lapse for a Specific Market and Currency
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/atm_iv_ts/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getgexdataforalloptions(market: str, currency: str) -> str:
-    """ GEX (Gamma Exposure) Data for All Options on a Specific Market and Currency
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/gex_date_all/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionmaturities(market: str, currency: str) -> str:
-    """ Option Maturities
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/maturities/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsopeninterestbyexpiry(market: str, currency: str) -> str:
-    """ Options Open Interest by Expiry
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/oi_expiry/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsopeninterestbystrike(market: str, currency: str) -> str:
-    """ Options Open Interest by Strike
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/oi_strike_all/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsopeninterestbytype(market: str, currency: str) -> str:
-    """ Options Open Interest by Type
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/oi_type/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettoptradedoptions(market: str, currency: str) -> str:
-    """ Top Traded Options
-    
-    Required parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/options/top_traded_option/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {}
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsvolumebyexpiry(market: str, currency: str) -> str:
-    """
-    Options Volume by Expiry
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - maturity: Expiry date
-        - c: Volume of call options
-        - p: Volume of put options
-        - notional_c: Notional value of call options
-        - notional_p: Notional value of put options
-        - premium_c: Premium value of call options
-        - premium_p: Premium value of put options
-    """
-    endpoint_path = f"/analytics/options/v_expiry/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsvolumebystrike(market: str, currency: str) -> str:
-    """
-    Options Volume by Strike
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - c: Volume of call options
-        - p: Volume of put options
-        - notional_c: Notional value of call options
-        - notional_p: Notional value of put options
-    """
-    endpoint_path = f"/analytics/options/v_strike_all/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsvolumebysell(market: str, currency: str) -> str:
-    """
-    Options Volume by Buy/Sell
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - c_buy: Volume of call options bought
-        - c_sell: Volume of call options sold
-        - p_buy: Volume of put options bought
-        - p_sell: Volume of put options sold
-        - c_buy_premium: Premium paid for call options bought
-        - c_sell_premium: Premium received from call options sold
-        - p_buy_premium: Premium paid for put options bought
-        - p_sell_premium: Premium received from put options sold
-        - c_buy_notional: Notional value of call options bought
-        - c_sell_notional: Notional value of call options sold
-        - p_buy_notional: Notional value of put options bought
-        - p_sell_notional: Notional value of put options sold
-    """
-    endpoint_path = f"/analytics/options/volume_buy_sell_all/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsgexbydate(market: str, currency: str, maturity: str) -> str:
-    """
-    Options GEX by Date
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - optionType: Option type ('call' or 'put')
-        - gex: GEX value
-    """
-    endpoint_path = f"/analytics/options/gex_date/{market}/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsimpliedvolatilitybystrike(market: str, currency: str, strike: str) -> str:
-    """
-    Options Implied Volatility (IV) by Strike
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - strike: Strike price (e.g., '10000')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - date: Date of IV data
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/iv_strike/{market}/{currency}/{strike}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsopeninterestbystrike(market: str, currency: str, maturity: str) -> str:
-    """
-    Options Open Interest (OI) by Strike
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - c: Open interest for call options
-        - p: Open interest for put options
-        - notional_c: Notional value of call options
-        - notional_p: Notional value of put options
-        - premium_c: Premium value of call options
-        - premium_p: Premium value of put options
-        - intrinsic: Intrinsic value of options
-    """
-    endpoint_path = f"/analytics/options/oi_strike/{market}/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsopeninterestnetchangeforallstrikes(market: str, currency: str, hours: str) -> str:
-    """
-    Options Open Interest Net Change for All Strikes
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - hours: Time period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - C: Net change in open interest for call options
-        - C_premium: Net change in premium value for call options
-        - C_notional: Net change in notional value for call options
-        - P: Net change in open interest for put options
-        - P_premium: Net change in premium value for put options
-        - P_notional: Net change in notional value for put options
-    """
-    endpoint_path = f"/analytics/options/oi_net_change_all/{market}/{currency}/{hours}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def gettopinstrumentswithoptionsopeninterestchange(market: str, currency: str, hours: str) -> str:
-    """
-    Top Instruments with Options Open Interest Change
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - hours: Time period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - open_interest: Current open interest
-        - oi_change_notional: Net change in notional value
-        - oi_change_premium: Net change in premium value
-        - instrument: Instrument identifier
-    """
-    endpoint_path = f"/analytics/options/top_instrument_oi_change/{market}/{currency}/{hours}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsvolumebysellactivity(market: str, currency: str, maturity: str) -> str:
-    """
-    Options Volume by Buy/Sell Activity
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - c_buy: Volume of call options bought
-        - c_sell: Volume of call options sold
-        - p_buy: Volume of put options bought
-        - p_sell: Volume of put options sold
-        - c_buy_premium: Premium paid for call options bought
-        - c_sell_premium: Premium received from call options sold
-        - p_buy_premium: Premium paid for put options bought
-        - p_sell_premium: Premium received from put options sold
-        - c_buy_notional: Notional value of call options bought
-        - c_sell_notional: Notional value of call options sold
-        - p_buy_notional: Notional value of put options bought
-        - p_sell_notional: Notional value of put options sold
-    """
-    endpoint_path = f"/analytics/options/volume_buy_sell/{market}/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptions24hvolumebystrike(market: str, currency: str, maturity: str) -> str:
-    """
-    Options 24h Volume By Strike
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - c: Volume of call options
-        - p: Volume of put options
-        - notional_c: Notional value of call options
-        - notional_p: Notional value of put options
-        - premium_c: Premium value of call options
-        - premium_p: Premium value of put options
-    """
-    endpoint_path = f"/analytics/options/v_strike/{market}/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionstradesummary(market: str, currency: str, hours: str) -> str:
-    """
-    Options Trade Summary
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - hours: Time period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing trade summary details for different strategies
-    """
-    endpoint_path = f"/analytics/options/summary_trades/{market}/{currency}/{hours}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsgreeks(market: str, currency: str, maturity: str, type: str) -> str:
-    """
-    Options Greeks data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    - type: Option type (e.g., 'C' for call)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - underlying_price: Price of underlying asset
-        - delta: Delta value
-        - gamma: Gamma value
-        - theta: Theta value
-        - vega: Vega value
-    """
-    endpoint_path = f"/analytics/options/greeks/{market}/{currency}/{maturity}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsivall(market: str, currency: str, maturity: str, type: str) -> str:
-    """
-    Options IV data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    - type: Option type (e.g., 'C' for call)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - mark_iv: Mark implied volatility
-        - bid_iv: Bid implied volatility
-        - ask_iv: Ask implied volatility
-        - delta: Delta value
-    """
-    endpoint_path = f"/analytics/options/iv_all/{market}/{currency}/{maturity}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getivtable(market: str, currency: str) -> str:
-    """
-    Implied Volatility Table
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing implied volatility data for different maturities
-    """
-    endpoint_path = f"/analytics/options/iv_table/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoinetchange(market: str, currency: str, maturity: str, hours: str) -> str:
-    """
-    Open Interest Net Change
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '24DEC26')
-    - hours: Time period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - strike: Strike price
-        - C: Net change in open interest for call options
-        - C_premium: Premium value of call options
-        - C_notional: Notional value of call options
-        - P: Net change in open interest for put options
-        - P_premium: Premium value of put options
-        - P_notional: Notional value of put options
-    """
-    endpoint_path = f"/analytics/options/oi_net_change/{market}/{currency}/{maturity}/{hours}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionssnapshot(market: str, currency: str) -> str:
-    """
-    Options Snapshot
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing detailed information about individual options contracts
-    """
-    endpoint_path = f"/analytics/options/snapshot/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsinstruments(option_type: Optional[str] = None, strike: Optional[str] = None, maturity: Optional[str] = None, currency: Optional[str] = None, market: Optional[str] = None) -> str:
-    """
-    Options Instruments List
-    
-    Optional query parameters:
-    - option_type: Option type (e.g., 'C')
-    - strike: Strike price
-    - maturity: Maturity date (e.g., '24DEC26')
-    - currency: Currency identifier (e.g., 'BTC')
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - maturity: Maturity date
-        - strike: Strike price
-        - option_type: Option type
-        - instrument: Instrument identifier
-    """
-    endpoint_path = "/analytics/options/Instruments"
-    query_params = {}
-    if option_type:
-        query_params["option_type"] = option_type
-    if strike:
-        query_params["strike"] = strike
-    if maturity:
-        query_params["maturity"] = maturity
-    if currency:
-        query_params["currency"] = currency
-    if market:
-        query_params["market"] = market
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def getoptionsoibreakdown() -> str:
-    """
-    Options Open Interest Breakdown
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - notional: Notional value breakdown by exchange
-        - open_value: Open value breakdown by exchange
-    """
-    endpoint_path = "/analytics/options/oi_breakdown"
-    return await make_request("GET", endpoint_path)
+# Connections opened at startup (0 disables) and re-pinged so they don't expire while idle
+warmer = ConnectionWarmer(
+    client,
+    connections=int(os.getenv("LAEVITAS_PREWARM_CONNECTIONS", "0")),
+    ping_interval=float(os.getenv("LAEVITAS_PING_INTERVAL", "25")),
+)
 
+# Client-side rate limit (requests per second and burst) and adaptive concurrency limit
+throttle = Throttle(
+    TokenBucket(
+        rate=float(os.getenv("LAEVITAS_RATE_LIMIT", "10")),
+        burst=float(os.getenv("LAEVITAS_RATE_BURST", "20")),
+    ),
+    AdaptiveLimiter(
+        initial=int(os.getenv("LAEVITAS_CONCURRENCY", "8")),
+        min_limit=int(os.getenv("LAEVITAS_CONCURRENCY_MIN", "1")),
+        max_limit=int(os.getenv("LAEVITAS_CONCURRENCY_MAX", "32")),
+    ),
+)
 
-@mcp.tool()
-async def getoptionsvolumebreakdown() -> str:
-    """
-    Options Volume Breakdown
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - notional: Notional value breakdown by exchange
-        - open_value: Open value breakdown by exchange
-    """
-    endpoint_path = "/analytics/options/volume_breakdown"
-    return await make_request("GET", endpoint_path)
+# Retries of GETs that failed transiently, all within a per tool call deadline
+retry = RetryPolicy(
+    attempts=int(os.getenv("LAEVITAS_RETRY_ATTEMPTS", "4")),
+    base_delay=float(os.getenv("LAEVITAS_RETRY_BASE_DELAY", "0.25")),
+    max_delay=float(os.getenv("LAEVITAS_RETRY_MAX_DELAY", "8")),
+    deadline=float(os.getenv("LAEVITAS_CALL_DEADLINE", "60")),
+)
 
+# Response cache (in-process LRU, plus an on-disk tier when LAEVITAS_CACHE_DIR is set)
+CACHE_DIR = os.getenv("LAEVITAS_CACHE_DIR")
+if CACHE_DIR:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+cache = ResponseCache(
+    max_entries=int(os.getenv("LAEVITAS_CACHE_MAX_ENTRIES", "512")),
+    max_bytes=int(os.getenv("LAEVITAS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    disk_path=os.path.join(CACHE_DIR, "responses.sqlite") if CACHE_DIR else None,
+    disk_max_bytes=int(os.getenv("LAEVITAS_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))),
+    analytics_ttl=float(os.getenv("LAEVITAS_CACHE_ANALYTICS_TTL", "15")),
+    historical_ttl=float(os.getenv("LAEVITAS_CACHE_HISTORICAL_TTL", "60")),
+    instruments_ttl=float(os.getenv("LAEVITAS_CACHE_INSTRUMENTS_TTL", "21600")),
+)
 
-@mcp.tool()
-async def getoptionsoibreakdownbycurrency() -> str:
-    """
-    Options Open Interest Breakdown by Currency
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - notional: Notional value breakdown by currency
-        - open_value: Open value breakdown by currency
-    """
-    endpoint_path = "/analytics/options/oi_breakdown_by_currency"
-    return await make_request("GET", endpoint_path)
+# fetch_all pagination: pages in flight at once, and the response size at which to stop
+FETCH_ALL_CONCURRENCY = int(os.getenv("LAEVITAS_FETCH_ALL_CONCURRENCY", "8"))
+FETCH_ALL_MAX_BYTES = int(os.getenv("LAEVITAS_FETCH_ALL_MAX_BYTES", str(4 * 1024 * 1024)))
+
+# Local time-series store for split_range calls (in LAEVITAS_CACHE_DIR unless set explicitly)
+STORE_PATH = os.getenv("LAEVITAS_STORE_PATH") or (os.path.join(CACHE_DIR, "series.sqlite") if CACHE_DIR else None)
+store = SeriesStore(STORE_PATH) if STORE_PATH else None
+
+# batch: most calls per invocation, and the default time budget of each call in seconds
+BATCH_MAX_CALLS = int(os.getenv("LAEVITAS_BATCH_MAX_CALLS", "50"))
+BATCH_CALL_TIMEOUT = float(os.getenv("LAEVITAS_BATCH_CALL_TIMEOUT", str(retry.deadline)))
+
+# all_markets: seconds to wait for each market before leaving it out
+FAN_OUT_TIMEOUT = float(os.getenv("LAEVITAS_FAN_OUT_TIMEOUT", "15"))
+
+# Fitted volatility surfaces, reused for this many seconds
+surfaces = SurfaceCache(ttl=float(os.getenv("LAEVITAS_SURFACE_TTL", "60")))
+surface_builds = SingleFlight()
+
+# High-water marks of since_last polls, per endpoint and arguments
+cursors = Cursors()
+
+# Check market, currency, maturity and strike arguments against the catalog before calling out
+VALIDATE_PARAMS = os.getenv("LAEVITAS_VALIDATE", "1").lower() not in ("0", "false", "no")
+
+# Identical GETs in flight at the same time share one upstream call
+inflight = SingleFlight()
+
+async def fetch_upstream(method: str, endpoint: str, params: Dict[str, str], key: str) -> bytes:
+    """Fetch a response body from the Laevitas API and store it in the cache."""
+    response = await retry.run(
+        method,
+        lambda timeout: throttle.send(
+            lambda: client.request(method, endpoint, params=params, timeout=min(REQUEST_TIMEOUT, timeout))
+        ),
+    )
+    response.raise_for_status()
+    body = response.content
+    cache.set(key, body, cache.ttl_for(method, endpoint, params))
+    return body
+
+async def request_body(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+    """Return the raw response body for a request, from the cache when possible."""
+    params = normalize_params(params)
+    key = cache_key(method, endpoint, params)
+    body = cache.get(key)
+    if body is None:
+        if method.upper() == "GET":
+            body = await inflight.do(key, lambda: fetch_upstream(method, endpoint, params, key))
+        else:
+            body = await fetch_upstream(method, endpoint, params, key)
+    return body
+
+async def request_rows(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, max_rows: Optional[int] = None, transform: Optional[Callable[[Any], Any]] = None) -> Tuple[Any, bool]:
+    """Return the decoded response for a request, keeping at most max_rows rows, and whether rows were cut off.
+
+    transform is applied to each row as it is decoded; rows it maps to None are dropped.
+
+    Responses not in the cache are streamed and decoded incrementally, and the download
+    is abandoned once max_rows rows have arrived; such partial bodies are not cached.
+    Bodies read to the end are cached under the usual TTL rules. A GET whose full body is
+    already being fetched waits for it instead of streaming a second copy.
+    """
+    params = normalize_params(params)
+    key = cache_key(method, endpoint, params)
+    body = cache.get(key)
+    if body is None and method.upper() == "GET" and inflight.pending(key):
+        body = await inflight.do(key, lambda: fetch_upstream(method, endpoint, params, key))
+    if body is not None:
+        result, truncated = await collect_rows(single_chunk(body), max_rows, transform)
+    else:
+        response = await retry.run(
+            method,
+            lambda timeout: throttle.send(
+                lambda: client.send(
+                    client.build_request(method, endpoint, params=params, timeout=min(REQUEST_TIMEOUT, timeout)),
+                    stream=True,
+                ),
+                stream=True,
+            ),
+        )
+        chunks: List[bytes] = []
+        complete = False
+
+        async def read() -> AsyncIterator[bytes]:
+            nonlocal complete
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                yield chunk
+            complete = True
+
+        try:
+            response.raise_for_status()
+            result, truncated = await collect_rows(read(), max_rows, transform)
+        finally:
+            await response.aclose()
+        if complete:
+            cache.set(key, b"".join(chunks), cache.ttl_for(method, endpoint, params))
+    return result, truncated
+
+async def request_json(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """Return the decoded JSON response for a request."""
+    return json.loads(await request_body(method, endpoint, params))
+
+def format_instant(stamp: int) -> str:
+    """Render epoch milliseconds in the API's 'YYYY-MM-DDTHH:MM' form."""
+    return datetime.fromtimestamp(stamp / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M")
+
+async def fetch_range(method: str, endpoint: str, params: Dict[str, Any], max_rows: Optional[int] = None, transform: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Fetch a start..end range as aligned windows of about one page each, concurrently.
+
+    Every page request of every window shares one FETCH_ALL_CONCURRENCY budget. With the
+    local store enabled, /historical ranges are served from it and only the intervals
+    it is missing are fetched. transform is applied to each row before it counts
+    towards max_rows; rows it maps to None are dropped.
+    """
+    if not params.get("start") or not params.get("end"):
+        raise ValueError("split_range needs both start and end")
+    slots = asyncio.Semaphore(FETCH_ALL_CONCURRENCY)
+
+    async def fetch_page(window: Dict[str, Any], page: int) -> bytes:
+        async with slots:
+            return await request_body(method, endpoint, {**window, "page": page})
+
+    async def fetch_window(start: str, end: str) -> Any:
+        window = {**params, "start": start, "end": end}
+        return await fetch_all_pages(lambda page: fetch_page(window, page), concurrency=FETCH_ALL_CONCURRENCY)
+
+    async def fetch_interval(start: str, end: str, max_rows: Optional[int] = None, max_bytes: Optional[int] = None, transform: Optional[Callable[[Any], Any]] = None) -> Any:
+        return await fetch_windows(
+            fetch_window,
+            plan_windows(start, end, params.get("granularity")),
+            concurrency=FETCH_ALL_CONCURRENCY,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+            transform=transform,
+        )
+
+    start, end = parse_instant(str(params["start"])), parse_instant(str(params["end"]))
+    if store is None or "historical/" not in endpoint or start is None or end is None:
+        return await fetch_interval(str(params["start"]), str(params["end"]), max_rows, FETCH_ALL_MAX_BYTES, transform)
+    # A date or date_h end covers the whole day or hour, as the API reads it
+    range_end = parse_range_end({"end": str(params["end"])})
+    first = int(start.timestamp() * 1000)
+    last = int(range_end.timestamp() * 1000) - 1 if range_end > end else int(end.timestamp() * 1000)
+
+    def bound(stamp: int) -> str:
+        # The range's own ends are requested as the caller gave them
+        return str(params["start"]) if stamp == first else str(params["end"]) if stamp == last else format_instant(stamp)
+
+    return await fetch_with_store(
+        store,
+        series_key(endpoint, params),
+        first,
+        last,
+        lambda lo, hi, rows, size: fetch_interval(bound(lo), bound(hi), rows, size),
+        max_rows=max_rows,
+        max_bytes=FETCH_ALL_MAX_BYTES,
+        concurrency=FETCH_ALL_CONCURRENCY,
+        transform=transform,
+    )
+
+async def fetch_since_last(method: str, endpoint: str, params: Dict[str, Any], max_rows: Optional[int] = None, transform: Optional[Callable[[Any], Any]] = None, implied_vol: bool = False) -> Any:
+    """Fetch only the rows newer than the previous since_last call for the same series.
+
+    The range starts at the remembered cursor (epoch ms) when that is later than the
+    caller's start, so just the tail pages are requested; the first call for a series
+    returns the whole range and sets the cursor. transform filters the new rows before
+    max_rows cuts them (see rows_since); with implied_vol, iv is added first so the
+    filter can use it.
+    """
+    key = series_key(endpoint, params)
+    cursor = cursors.get(key)
+    query = dict(params)
+    start = parse_instant(str(params["start"])) if params.get("start") else None
+    if cursor is not None and (start is None or cursor > start.timestamp() * 1000):
+        query["start"] = str(cursor)
+    result = await fetch_all_pages(
+        lambda page: request_body(method, endpoint, {**query, "page": page}),
+        concurrency=FETCH_ALL_CONCURRENCY,
+        max_bytes=FETCH_ALL_MAX_BYTES,
+    )
+    if implied_vol:
+        result = add_implied_vol(result)
+    result, new_cursor = rows_since(result, cursor, max_rows, transform)
+    if new_cursor is not None:
+        cursors.set(key, new_cursor)
+    return result
+
+async def make_request(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, fetch_all: bool = False, split_range: bool = False, since_last: bool = False, implied_vol: bool = False, max_rows: Optional[int] = None, format: Optional[str] = None, fields: Optional[List[str]] = None, where: Optional[List[str]] = None, sort_by: Optional[str] = None, top_n: Optional[int] = None) -> str:
+    """Make a request to the Laevitas API and return the response as compact JSON text.
+    
+    Responses that need no transformation are passed through without being decoded.
+    With fetch_all, every page of a paginated endpoint is fetched concurrently and the
+    items are merged into a single response (bounded by max_rows and FETCH_ALL_MAX_BYTES).
+    split_range does the same over aligned time windows of start..end (see fetch_range),
+    and since_last returns only rows newer than the previous since_last call.
+    Otherwise max_rows streams the response and stops reading after that many rows.
+    implied_vol adds the iv of each option trade row.
+    where filters the rows (while they stream in, when max_rows is given), sort_by and
+    top_n rank them, fields keeps only the listed (dotted) keys, and format='columnar'
+    returns the rows as {columns, data: {column: [values]}}.
+    """
+    if format not in (None, "rows", "columnar"):
+        return f"Error: unknown format '{format}', expected 'rows' or 'columnar'"
+    truncated = False
+    where = tuple(where or ())
+    ranked = sort_by is not None or top_n is not None
+    try:
+        # Compile the query up front so a malformed one fails before any request
+        row_filter(where)
+        if sort_by:
+            sort_key(sort_by)
+        paged = fetch_all or split_range or since_last
+        # A filter that may use iv can only run once the rows are decoded, so max_rows then cuts after it
+        deferred = bool(implied_vol and where and max_rows is not None and not since_last)
+        if deferred:
+            ranked = True
+        if ranked and max_rows is not None:
+            top_n = min(top_n if top_n is not None else max_rows, max_rows)
+        # Sorting must see every row, so paged fetches are then cut only by top_n, after sorting
+        paged_rows = None if sort_by is not None or deferred else max_rows
+        with deadline_scope(retry.deadline):
+            if paged:
+                params = {k: v for k, v in (params or {}).items() if k != "page"}
+                if params.get("limit") is None:
+                    params["limit"] = PAGE_LIMIT
+            if since_last:
+                result = await fetch_since_last(method, endpoint, params, paged_rows, row_filter(where) if where else None, implied_vol)
+                where, implied_vol = (), False
+            elif split_range:
+                # Filter as windows arrive, so max_rows counts matching rows as with fetch_all
+                result = await fetch_range(
+                    method,
+                    endpoint,
+                    params,
+                    paged_rows,
+                    row_filter(where) if where and not implied_vol else None,
+                )
+                if not implied_vol:
+                    where = ()
+            elif fetch_all:
+                # Filter as pages arrive, so max_rows counts matching rows as on the streaming path
+                result = await fetch_all_pages(
+                    lambda page: request_body(method, endpoint, {**params, "page": page}),
+                    concurrency=FETCH_ALL_CONCURRENCY,
+                    max_rows=paged_rows,
+                    max_bytes=FETCH_ALL_MAX_BYTES,
+                    transform=row_filter(where) if where and not implied_vol else None,
+                )
+                if not implied_vol:
+                    where = ()
+            elif max_rows is not None and not ranked:
+                result, truncated = await request_rows(method, endpoint, params, max_rows, row_filter(where) if where else None)
+                where = ()
+            elif format == "columnar" or fields or where or ranked or implied_vol:
+                result = await request_json(method, endpoint, params)
+            else:
+                return body_to_text(await request_body(method, endpoint, params))
+        if implied_vol:
+            result = add_implied_vol(result)
+        return to_json(shape_result(result, truncated, format, fields, where, sort_by, top_n))
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
-@mcp.tool()
-async def getoptionsvolumebreakdownbycurrency() -> str:
-    """
-    Options Volume Breakdown by Currency
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - notional: Notional value breakdown by currency
-        - open_value: Open value breakdown by currency
+def shape_result(result: Any, truncated: bool = False, format: Optional[str] = None, fields: Optional[List[str]] = None, where: Tuple[str, ...] = (), sort_by: Optional[str] = None, top_n: Optional[int] = None) -> Any:
+    """Apply the row query, field projection and output format to a decoded result."""
+    if where or sort_by is not None or top_n is not None:
+        result = apply_query(result, where, sort_by, top_n)
+    if fields:
+        result = projection(tuple(fields))(result)
+    if truncated and isinstance(result, dict):
+        result["truncated"] = True
+    if format == "columnar":
+        result = to_columnar(result)
+    return result
+
+
+async def fetch_all_markets(spec: EndpointSpec, args: Dict[str, Any], options: Dict[str, Any]) -> str:
+    """Serve an all_markets call: the same call on every listed market, merged into one table.
+
+    Each market is fetched with the call's pagination and row options (so where, sort_by
+    and top_n already cut its rows); markets that fail or exceed FAN_OUT_TIMEOUT are
+    reported and left out. Ranking, max_rows, fields and format then apply to the merged rows.
+    """
+    venues = get_catalog().venues(spec.path, spec.markets, args.get("currency"))
+    format, fields = options.pop("format", None), options.pop("fields", None)
+    max_rows, sort_by, top_n = options.get("max_rows"), options.get("sort_by"), options.get("top_n")
+
+    async def fetch(market: str) -> str:
+        call = {**args, "market": market}
+        try:
+            return await asyncio.wait_for(
+                make_request("GET", spec.format_path(call), spec.query(call), **options), FAN_OUT_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return f"Error: no response within {FAN_OUT_TIMEOUT:g}s"
+
+    texts = await asyncio.gather(*[fetch(market) for market in venues])
+    markets, rows, truncated = [], [], False
+    for market, text in zip(venues, texts):
+        if text.startswith("Error:"):
+            markets.append({"market": market, "status": "error", "error": text[len("Error: "):]})
+            continue
+        try:
+            result = json.loads(text)
+        except ValueError:
+            markets.append({"market": market, "status": "error", "error": "response is not JSON"})
+            continue
+        tagged = tag_rows(result, "market", market)
+        truncated = truncated or (isinstance(result, dict) and bool(result.get("truncated")))
+        markets.append({"market": market, "status": "ok", "rows": len(tagged)})
+        rows.extend(tagged)
+    if sort_by is not None or top_n is not None:
+        rows = apply_query(rows, (), sort_by, top_n)
+    if max_rows is not None and len(rows) > max_rows:
+        del rows[max_rows:]
+        truncated = True
+    # The per-market status is kept whatever fields selects
+    result = shape_result({"items": rows}, truncated, format, fields)
+    return to_json({"markets": markets, **result} if isinstance(result, dict) else result)
+
+
+async def call_endpoint(spec: EndpointSpec, args: Dict[str, Any]) -> str:
+    """Serve a call to a catalog tool."""
+    if VALIDATE_PARAMS:
+        error = get_catalog().check_params(spec.path, args)
+        if error:
+            return error
+    options = {name: args[name] for name in spec.options}
+    if options.pop("all_markets", False):
+        return await fetch_all_markets(spec, args, options)
+    if spec.markets and args.get("market") is None:
+        return "Error: market is required unless all_markets is set"
+    return await make_request("GET", spec.format_path(args), spec.query(args), **options)
+
+
+# One tool per endpoint in laevitas_catalog.json, by name
+tools = register_tools(mcp, call_endpoint)
+
+
+async def batch_item(call: Any, timeout: float) -> Tuple[str, str]:
+    """Run one batch call; returns its status and its entry of the combined result as JSON text.
+
+    Arguments are validated and coerced by the tool's argument model, as for a direct
+    call. Tool results are embedded as they are, without decoding them; results that do
+    not start like a JSON object or array (e.g. a plain-text upstream body) are embedded
+    as JSON strings.
+    """
+    name = call.get("tool") if isinstance(call, dict) else None
+    tool = tools.get(name)
+    head = '{"tool":' + json.dumps(name)
+    start = time.perf_counter()
+    args = (call.get("args") or {}) if tool is not None else {}
+    if tool is None:
+        status, text = "error", f"Error: unknown tool '{name}'"
+    elif not isinstance(args, dict):
+        status, text = "error", "Error: args must be an object"
+    else:
+        try:
+            arguments = tool.spec.arguments.model_validate(args)
+        except ValidationError as e:
+            problems = "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            status, text = "error", f"Error: invalid arguments: {problems}"
+        else:
+            try:
+                with deadline_scope(timeout):
+                    text = await asyncio.wait_for(tool(**dict(arguments)), timeout)
+                status = "error" if text.startswith("Error:") else "ok"
+            except asyncio.TimeoutError:
+                status, text = "timeout", f"Error: no result within {timeout:g}s"
+    seconds = round(time.perf_counter() - start, 4)
+    if status == "ok":
+        if text.lstrip()[:1] not in ("{", "["):
+            text = json.dumps(text)
+        return status, f'{head},"status":"ok","seconds":{seconds},"result":{text}}}'
+    error = text[len("Error: "):] if text.startswith("Error: ") else text
+    return status, f'{head},"status":"{status}","seconds":{seconds},"error":{json.dumps(error)}}}'
+
+
+@mcp.tool()
+async def batch(calls: List[Dict[str, Any]], timeout: Optional[float] = None) -> str:
+    """
+    Run several Laevitas tool calls concurrently in one invocation
+    
+    Calls share the response cache, rate limit and retries of individual tool calls; a
+    failing or slow call does not affect the others.
+    
+    Args:
+        calls: Tool calls as {"tool": <tool name>, "args": {<argument>: <value>}}, e.g.
+            [{"tool": "getfuturesmarketsnapshot", "args": {"market": "deribit"}},
+             {"tool": "getfuturesmarketsnapshot", "args": {"market": "binance", "top_n": 5}}]
+        timeout: Time budget of each call in seconds (default LAEVITAS_BATCH_CALL_TIMEOUT)
+    
+    Returns:
+    - results: One entry per call, in order, with tool, status ('ok', 'error' or 'timeout'),
+      seconds, and result (the tool's response) or error
+    - ok, errors: Number of calls that succeeded and failed
+    """
+    if len(calls) > BATCH_MAX_CALLS:
+        return f"Error: {len(calls)} calls exceed the batch limit of {BATCH_MAX_CALLS}"
+    timeout = timeout if timeout and timeout > 0 else BATCH_CALL_TIMEOUT
+    items = await asyncio.gather(*[batch_item(call, timeout) for call in calls])
+    ok = sum(status == "ok" for status, _ in items)
+    return f'{{"results":[{",".join(entry for _, entry in items)}],"ok":{ok},"errors":{len(items) - ok}}}'
+
+
+@mcp.tool()
+async def get_calculateoptionprice(legs: List[Dict[str, Any]], forward: Optional[float] = None, rate: float = 0.0) -> str:
+    """
+    Price an option strategy and its Greeks locally (Black-76 on the forward), without an API call
+    
+    Args:
+        legs: Options of the strategy, each either
+            {"instrument": "BTC-27JUN25-100000-C", "vol": 55, "quantity": 1} or
+            {"type": "put", "strike": 90000, "maturity": "27JUN25", "vol": 60, "quantity": -2}
+            - vol: Implied volatility in percent, e.g. mark_iv from the options tools
+            - quantity: Contracts, negative when short (default 1)
+            - forward: Forward price for this leg's expiry (default: the strategy's forward)
+            - years: Time to expiry in years, instead of maturity (expiries are at 08:00 UTC)
+        forward: Forward (or index) price of the underlying in USD
+        rate: Continuously compounded interest rate as a decimal (default 0)
+    
+    Returns:
+    - legs: Per leg, per contract: price (USD), price_coin (in the underlying), delta, gamma,
+      vega (per vol point), theta (per day) and rho (per 1% rate)
+    - total: Quantity-weighted sum of price and Greeks over all legs
     """
-    endpoint_path = "/analytics/options/volume_breakdown_by_currency"
-    return await make_request("GET", endpoint_path)
+    try:
+        return to_json(price_legs(legs, forward, rate))
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
-@mcp.tool()
-async def getexpiredoptionexpiries(market: str, currency: str, maturity: Optional[str] = None) -> str:
+async def slide_inputs(positions: List[Dict[str, Any]], market: str, currency: Optional[str], forward: Optional[float]) -> Dict[str, Any]:
+    """Resolve each position's forward and vol, fetching only the smiles and curve that are needed.
+
+    Vols missing from a position come from the mark IVs of its maturity's smile
+    (getoptionsivall), forwards from the futures curve (getfuturescurvedata), fetched
+    concurrently through the cache. Raises ValueError naming what could not be resolved.
+    """
+    legs = []
+    for i, position in enumerate(positions):
+        if not isinstance(position, dict) or not position.get("instrument"):
+            raise ValueError(f"position {i} needs an instrument, e.g. 'BTC-27JUN25-100000-C' or 'BTC-27JUN25'")
+        symbol, maturity, strike, is_call = parse_position(str(position["instrument"]))
+        currency = currency or symbol
+        if symbol != currency.upper():
+            raise ValueError(f"position {i} is on {symbol}, not {currency.upper()}; slide one currency at a time")
+        legs.append({
+            "instrument": str(position["instrument"]).upper(),
+            "maturity": maturity,
+            "strike": strike,
+            "is_call": is_call,
+            "quantity": float(position.get("quantity", 1)),
+            "forward": position.get("forward", forward),
+            "vol": position.get("vol"),
+        })
+    if not legs:
+        raise ValueError("positions must list at least one instrument")
+    currency = currency.upper()
+
+    smiles = sorted({(leg["maturity"], "C" if leg["is_call"] else "P") for leg in legs if leg["strike"] is not None and leg["vol"] is None})
+    need_curve = any(leg["forward"] is None for leg in legs)
+    requests = [request_json("GET", f"/analytics/options/iv_all/{market}/{currency}/{maturity}/{kind}") for maturity, kind in smiles]
+    if need_curve:
+        requests.append(request_json("GET", f"/analytics/futures/futures_curve/{currency}/{market}"))
+    results = await asyncio.gather(*requests, return_exceptions=True)
+    curve = results.pop() if need_curve else None
+
+    for (maturity, kind), result in zip(smiles, results):
+        group = [leg for leg in legs if leg["vol"] is None and leg["maturity"] == maturity and leg["is_call"] == (kind == "C")]
+        rows = rows_of(result) if not isinstance(result, Exception) else None
+        vols = smile_vols(rows or [], [leg["strike"] for leg in group])
+        for leg, vol in zip(group, vols.tolist()):
+            if vol == vol:
+                leg["vol"], leg["vol_source"] = vol, "smile"
+    curve_rows = rows_of(curve) if curve is not None and not isinstance(curve, Exception) else None
+    for leg in legs:
+        if leg["forward"] is None and curve_rows:
+            leg["forward"] = curve_forward(curve_rows, leg["maturity"])
+            leg["forward_source"] = "curve"
+    missing = [leg["instrument"] for leg in legs if leg["forward"] is None or (leg["strike"] is not None and leg["vol"] is None)]
+    if missing:
+        raise ValueError(f"no forward or vol for {', '.join(missing)} on {market}; pass forward and vol for them")
+    return {"currency": currency, "legs": legs}
+
+
+@mcp.tool()
+async def get_calculateportfolioriskslide(
+    positions: List[Dict[str, Any]],
+    market: str = "deribit",
+    currency: Optional[str] = None,
+    spot_shocks: Optional[List[float]] = None,
+    vol_shocks: Optional[List[float]] = None,
+    days: float = 0.0,
+    forward: Optional[float] = None,
+    rate: float = 0.0,
+) -> str:
     """
-    Expired Option Expiries
+    Risk slide of a whole portfolio: PnL and Greeks over a grid of spot and vol shocks, computed locally
     
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
+    Unlike get_calculateriskslide, which takes one instrument per call, every position is
+    revalued at every grid point in one vectorized pass.
     
-    Optional query parameters:
-    - maturity: Expired maturity date in DDMMYY format (e.g., '31DEC21')
+    Args:
+        positions: Options and futures, e.g. [{"instrument": "BTC-27JUN25-100000-C", "quantity": -5},
+            {"instrument": "BTC-27JUN25", "quantity": 2}]. Optional per position: vol (percent) and
+            forward; by default vols come from the market's mark IV smile (getoptionsivall,
+            interpolated across strikes) and forwards from its futures curve (getfuturescurvedata)
+        market: Market whose smiles and futures curve price the positions (default 'deribit')
+        currency: Underlying of the positions (default: taken from the instrument names)
+        spot_shocks: Relative moves of every forward (default -0.3 to 0.3)
+        vol_shocks: Moves of every vol in vol points (default -20, -10, 0, 10, 20)
+        days: Days to move the valuation date forward (default 0)
+        forward: Forward used for positions without their own, instead of the futures curve
+        rate: Continuously compounded interest rate as a decimal (default 0)
     
     Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - Date: Maturity date
-        - Strike: Strike price
-        - OptionType: Option type
-        - mark_price: Mark price
-        - mark_price_usd: Mark price in USD
-        - position: Position value
-        - index_price: Index price at expiry
+    - value: Portfolio value today in USD; futures are marked at their forward, so they add zero
+    - spot_shocks, vol_shocks: The grid axes
+    - pnl, delta, gamma, vega, theta: Grids indexed [spot shock][vol shock]; pnl is against
+      today's value, Greeks are quantity-weighted as in get_calculateoptionprice
+    - legs: Inputs used per position (forward, vol and where they came from)
     """
-    endpoint_path = f"/analytics/options/expired_expiries/{market}/{currency}"
-    query_params = {}
-    if maturity:
-        query_params["maturity"] = maturity
-    return await make_request("GET", endpoint_path, query_params)
+    try:
+        with deadline_scope(retry.deadline):
+            inputs = await slide_inputs(positions, market.lower(), currency, forward)
+        legs = inputs["legs"]
+        spots = SPOT_SHOCKS if spot_shocks is None else spot_shocks
+        vols = VOL_SHOCKS if vol_shocks is None else vol_shocks
+        options = [leg["strike"] is not None for leg in legs]
+        slide = risk_slide(
+            [float(leg["forward"]) for leg in legs],
+            [leg["strike"] if option else 0.0 for leg, option in zip(legs, options)],
+            [year_fraction(leg["maturity"]) if option else 0.0 for leg, option in zip(legs, options)],
+            [float(leg["vol"]) if option else 0.0 for leg, option in zip(legs, options)],
+            [bool(leg["is_call"]) for leg in legs],
+            [leg["quantity"] for leg in legs],
+            options,
+            spots,
+            vols,
+            days,
+            rate,
+        )
+        result = {"currency": inputs["currency"], "market": market, "value": float(slide.pop("value"))}
+        result.update({"spot_shocks": list(spots), "vol_shocks": list(vols), "days": days})
+        result.update({name: grid.tolist() for name, grid in slide.items()})
+        result["legs"] = [
+            {k: leg.get(k) for k in ("instrument", "quantity", "forward", "forward_source", "vol", "vol_source")}
+            for leg in legs
+        ]
+        return to_json(result)
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
-@mcp.tool()
-async def get_customchange(name: str, market: str, currency: str, end: Optional[str] = None, start: Optional[str] = None) -> str:
+async def build_surface(market: str, currency: str) -> Surface:
+    """Fetch a market's listed maturities, futures curve and per-strike mark IVs, and fit a surface.
+
+    Each expiry's smile comes from getoptionsivall, its forward from getfuturescurvedata
+    (interpolated in time for expiries without a future); requests run concurrently, and
+    the fit runs in a worker thread.
+    """
+    start = time.perf_counter()
+    listed, curve = await asyncio.gather(
+        request_json("GET", f"/analytics/options/maturities/{market}/{currency}"),
+        request_json("GET", f"/analytics/futures/futures_curve/{currency}/{market}"),
+        return_exceptions=True,
+    )
+    maturities = maturity_codes(listed) if not isinstance(listed, Exception) else []
+    maturities = maturities or list(get_catalog().maturities(market, currency))
+    maturities = [m for m in maturities if year_fraction(m) > 0]
+    curve_rows = rows_of(curve) if not isinstance(curve, Exception) else None
+    if not maturities:
+        raise ValueError(f"no live {currency} option maturities listed on {market}")
+    if not curve_rows:
+        raise ValueError(f"no {currency} futures curve on {market} to take forwards from")
+    smiles = await asyncio.gather(
+        *[request_json("GET", f"/analytics/options/iv_all/{market}/{currency}/{maturity}/C") for maturity in maturities],
+        return_exceptions=True,
+    )
+    slices = []
+    for maturity, smile in zip(maturities, smiles):
+        forward = curve_forward(curve_rows, maturity)
+        rows = [row for row in (rows_of(smile) or []) if isinstance(row, dict)] if not isinstance(smile, Exception) else []
+        if forward is None or not rows:
+            continue
+        quotes = [(row.get("strike"), row.get("mark_iv")) for row in rows if row.get("strike") is not None and row.get("mark_iv")]
+        slices.append((maturity, year_fraction(maturity), forward, [q[0] for q in quotes], [q[1] for q in quotes]))
+    # Fitting takes CPU time, so it runs off the event loop to keep other calls moving
+    surface = await asyncio.to_thread(Surface, slices)
+    surfaces.set((market, currency), surface, time.perf_counter() - start)
+    return surface
+
+
+async def cached_surface(market: str, currency: str, refresh: bool = False) -> Surface:
+    """The cached surface of a market and currency, fitted (once for concurrent callers) if stale."""
+    surface = None if refresh else surfaces.get((market, currency))
+    if surface is None:
+        surface = await surface_builds.do(f"{market}/{currency}", lambda: build_surface(market, currency))
+    return surface
+
+
+@mcp.tool()
+async def getvolsurface(
+    currency: str,
+    market: str = "deribit",
+    strikes: Optional[List[float]] = None,
+    tenors: Optional[List[str]] = None,
+    model: str = "svi",
+    refresh: bool = False,
+) -> str:
     """
-    Custom Change Data
+    Implied volatility surface of a market and currency, fitted with SVI per expiry and SSVI overall
     
-    Required path parameters:
-    - name: Data type identifier (e.g., 'atmivts_historical', 'heatmap_change')
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BTC')
+    The surface is built from the market's per-strike mark IVs (getoptionsivall) and futures
+    curve, then cached (LAEVITAS_SURFACE_TTL), so further queries at any strike and tenor are
+    answered locally without calling the API.
     
-    Optional query parameters:
-    - end: End date in YYYY-MM-DD format (e.g., '2025-05-19')
-    - start: Start date in YYYY-MM-DD format (e.g., '2025-05-12')
+    Args:
+        currency: Underlying, e.g. 'BTC'
+        market: Options market (default 'deribit')
+        strikes: Strikes to query, e.g. [80000, 100000, 120000]
+        tenors: Tenors to query, as maturity codes ('27JUN25') or lengths ('7d', '3m', '1y')
+        model: 'svi' (per-expiry fits, interpolated in total variance; default) or 'ssvi'
+            (one arbitrage-free fit across expiries)
+        refresh: Refit even if a cached surface is still fresh
     
     Returns:
-    - date: Timestamp of data collection
-    - data: Object containing historical data with applied changes between start and end dates
+    - built_at, age_seconds: When the cached surface was fitted
+    - calendar_ok: Whether total variance never decreases with expiry across the SVI slices
+    - slices: Per expiry: maturity, years, forward, atm_iv, SVI parameters (a, b, rho, m, sigma),
+      points fitted, rmse_iv (vol points) and butterfly_ok (Gatheral's density condition)
+    - ssvi: rho, eta, gamma and rmse_iv of the global fit
+    - query: With strikes and tenors: the model, tenors in years, forwards used and iv in percent
+      indexed [tenor][strike]
     """
-    endpoint_path = f"/analytics/options/custom_change/{name}/{market}/{currency}"
-    query_params = {}
-    if end:
-        query_params["end"] = end
-    if start:
-        query_params["start"] = start
-    return await make_request("GET", endpoint_path, query_params)
-
+    if bool(strikes) != bool(tenors):
+        return "Error: give both strikes and tenors to query the surface"
+    try:
+        market, currency = market.lower(), currency.upper()
+        if VALIDATE_PARAMS:
+            error = get_catalog().check_params("/analytics/options/", {"market": market, "currency": currency})
+            if error:
+                return error
+        with deadline_scope(retry.deadline):
+            surface = await cached_surface(market, currency, refresh)
+        result = surface.summary()
+        if strikes and tenors:
+            years = [tenor_years(tenor) for tenor in tenors]
+            result["query"] = {
+                "model": model,
+                "tenors": tenors,
+                "years": [round(t, 6) for t in years],
+                "forwards": surface.forward(years).tolist(),
+                "strikes": strikes,
+                "iv": surface.iv(strikes, years, model).tolist(),
+            }
+        return to_json(result)
+    except Exception as e:
+        return f"Error: {str(e)}"
 
-@mcp.tool()
-async def getmodelskewcharts(currency: str, maturity: str, type: str) -> str:
-    """
-    Model Skew Charts
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date in DDMMYY format (e.g., '24DEC26')
-    - type: Chart type ('delta' or 'strike')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - delta/strike: Delta value or strike price
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/model_charts/skew/{currency}/{maturity}/{type}"
-    return await make_request("GET", endpoint_path)
 
+async def open_interest(market: str, currency: str) -> List[Tuple[str, float, bool, float]]:
+    """Open interest points by maturity and strike from getoptionsopeninterestbystrike.
 
-@mcp.tool()
-async def getmodelvolatilityruncharts(currency: str, maturity: str) -> str:
-    """
-    Model Volatility Run Charts
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date in DDMMYY format (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - expiry: Expiration date
-        - forward: Forward price
-        - atm_spot_iv: ATM spot implied volatility
-        - skew_10d/15d/25d/35d: Skew values at different deltas
-        - rr_10d/15d/25d/35d: Risk reversal values at different deltas
-        - fly_10d/15d/25d/35d: Butterfly values at different deltas
+    If its rows are aggregated over expiries, each listed maturity's strikes are fetched
+    instead (getoptionsoibystrike), concurrently through the cache.
     """
-    endpoint_path = f"/analytics/options/model_charts/vol_run/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
+    points = oi_points(rows_of(await request_json("GET", f"/analytics/options/oi_strike_all/{market}/{currency}")))
+    if points and all(point[0] is not None for point in points):
+        return points
+    listed = await request_json("GET", f"/analytics/options/maturities/{market}/{currency}")
+    maturities = [m for m in (maturity_codes(listed) or get_catalog().maturities(market, currency)) if year_fraction(m) > 0]
+    results = await asyncio.gather(
+        *[request_json("GET", f"/analytics/options/oi_strike/{market}/{currency}/{maturity}") for maturity in maturities],
+        return_exceptions=True,
+    )
+    points = []
+    for maturity, result in zip(maturities, results):
+        if not isinstance(result, Exception):
+            points.extend((point[0] or maturity, *point[1:]) for point in oi_points(rows_of(result)))
+    return points
 
 
 @mcp.tool()
-async def getmodelskewcharttimelapse(currency: str, maturity: str, type: str) -> str:
-    """
-    Model Skew Chart Time Lapse
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date in DDMMYY format (e.g., '24DEC26')
-    - type: Chart type ('delta' or 'strike')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing time-lapse data for different periods:
-        - Today/Yesterday/2 Days Ago/1 Week Ago/2 Weeks Ago/3 Weeks Ago/1 Month Ago
-        Each period contains array of objects with:
-        - delta/strike: Delta value or strike price
-        - iv: Implied volatility value
+async def getgexprofile(
+    currency: str,
+    market: str = "deribit",
+    maturities: Optional[List[str]] = None,
+    spot: Optional[float] = None,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+    points: int = GRID_POINTS,
+    model: str = "svi",
+    rate: float = 0.0,
+) -> str:
     """
-    endpoint_path = f"/analytics/options/model_charts/skew/{currency}/{maturity}/{type}/time_lapse"
-    return await make_request("GET", endpoint_path)
+    Dealer gamma exposure (GEX) profile over a grid of spot prices, with zero-gamma and gamma-flip levels, computed locally
+    
+    Open interest by strike and expiry (getoptionsopeninterestbystrike) is joined with Black-76
+    gammas at the IVs of the cached volatility surface (as getvolsurface), and every price of
+    the grid is evaluated in one vectorized pass, so moving spot needs no further API calls.
+    Dealers are taken to be long calls and short puts; vols stay fixed per strike as spot moves.
+    
+    Args:
+        currency: Underlying, e.g. 'BTC'
+        market: Options market (default 'deribit')
+        maturities: Only these maturities, e.g. ['27JUN25'] (default: all live ones)
+        spot: Reference spot (default: the front forward of the surface)
+        low, high: Price grid bounds (default spot -20% and +20%)
+        points: Prices on the grid (default 81)
+        model: Surface model for the IVs, 'svi' (default) or 'ssvi'
+        rate: Continuously compounded interest rate as a decimal (default 0)
+    
+    Returns:
+    - spot, gex_at_spot: Reference spot and total GEX there, in USD per 1% move
+    - zero_gamma: Grid price nearest spot where total GEX crosses zero, or null
+    - flips: Every zero crossing on the grid, with the sign GEX flips to as price rises
+    - prices, gex, call_gex, put_gex: The GEX profile over the price grid
+    - by_expiry: GEX at spot per maturity, with its call and put open interest
+    - by_strike: GEX at spot per strike (summed over maturities)
+    """
+    if model not in ("svi", "ssvi"):
+        return f"Error: unknown model '{model}', expected 'svi' or 'ssvi'"
+    try:
+        market, currency = market.lower(), currency.upper()
+        if VALIDATE_PARAMS:
+            error = get_catalog().check_params("/analytics/options/", {"market": market, "currency": currency})
+            if error:
+                return error
+        with deadline_scope(retry.deadline):
+            oi, surface = await asyncio.gather(open_interest(market, currency), cached_surface(market, currency))
+        live = live_points(oi, maturities)
+        if not live:
+            return f"Error: no open interest for live {currency} options on {market}" + (f" in {', '.join(maturities)}" if maturities else "")
+        expiries, strikes, call_oi, put_oi = oi_grid(live)
+        t = np.array([year_fraction(m) for m in expiries])
+        forwards = surface.forward(t)
+        spot = float(spot or surface.forward(0.0))
+        prices = price_grid(spot, low, high, points)
+        profile = gex_profile(prices, spot, forwards, t, strikes, surface.iv(strikes, t, model), call_oi, put_oi, rate)
+        flips = zero_crossings(prices, profile["gex"])
+        by_strike = profile["by_strike"]
+        return to_json({
+            "currency": currency,
+            "market": market,
+            "model": model,
+            "spot": spot,
+            "gex_at_spot": float(by_strike.sum()),
+            "zero_gamma": zero_gamma(flips, spot),
+            "flips": flips,
+            "prices": prices.tolist(),
+            "gex": profile["gex"].tolist(),
+            "call_gex": profile["call_gex"].tolist(),
+            "put_gex": profile["put_gex"].tolist(),
+            "by_expiry": [
+                {"maturity": m, "forward": float(forwards[i]), "call_oi": float(call_oi[i].sum()), "put_oi": float(put_oi[i].sum()), "gex": float(by_strike[i].sum())}
+                for i, m in enumerate(expiries)
+            ],
+            "by_strike": [
+                {"strike": float(k), "gex": float(g)}
+                for k, g, open_ in zip(strikes, by_strike.sum(axis=0), (call_oi + put_oi).sum(axis=0))
+                if open_ > 0
+            ],
+        })
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
 @mcp.tool()
-async def getmodelforwardcurvechart(currency: str) -> str:
-    """
-    Model Forward Curve Chart
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - forward: Forward price
-        - ttm: Time to maturity
-    """
-    endpoint_path = f"/analytics/options/model_charts/forward_curve/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getmodeltermstructureatmchart(currency: str) -> str:
-    """
-    Model Term Structure ATM Chart
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - tenor: Array of objects with ttm and iv values
-        - expiry: Array of objects with expiry date and iv values
-    """
-    endpoint_path = f"/analytics/options/model_charts/term_structure_atm/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getmodeltermstructureatmcharttimelapse(currency: str) -> str:
-    """
-    Model Term Structure ATM Chart Time Lapse
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing time-lapse data for different periods:
-        - Today/Yesterday/2 Days Ago/1 Week Ago/2 Weeks Ago/3 Weeks Ago/1 Month Ago
-        Each period contains:
-        - tenor: Array of objects with ttm and iv values
-        - expiry: Array of objects with expiry date and iv values
-    """
-    endpoint_path = f"/analytics/options/model_charts/term_structure_atm/{currency}/time_lapse"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getmodeltermstructurechart(currency: str, type: str) -> str:
-    """
-    Model Term Structure Chart
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - type: Chart type ('delta' or 'strike')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - delta/strike: Array of objects with expiry date and iv values
-    """
-    endpoint_path = f"/analytics/options/model_charts/term_structure/{currency}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsskewbycurrencyandmaturity(currency: str, maturity: str) -> str:
-    """
-    Options Skew by Currency and Maturity
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date in DDMMYY format (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - strike: Strike price
-        - delta: Delta value
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/skew_currency/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsskewbymarketandmaturity(market: str, maturity: str) -> str:
-    """
-    Options Skew by Market and Maturity
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - maturity: Maturity date in DDMMYY format (e.g., '24DEC26')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - strike: Strike price
-        - delta: Delta value
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/skew_market/{market}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsivbycurrency(currency: str) -> str:
-    """
-    Options IV by Currency
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - maturity: Maturity date
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/iv_currency/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsivbymarket(market: str) -> str:
-    """
-    Options IV by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - maturity: Maturity date
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/iv_market/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getethbtcatmivtermstructure() -> str:
-    """
-    ETH-BTC ATM IV Term Structure
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing time-lapse data for different periods:
-        - Today/Yesterday/2 Days Ago/1 Week Ago/2 Weeks Ago/3 Weeks Ago/1 Month Ago
-        Each period contains:
-        - maturity: Maturity date of the option contract
-        - iv: At-the-money implied volatility value
-    """
-    endpoint_path = "/analytics/options/eth-btc_atm_iv_term_structure"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoptionsskewbymarketandcurrency(market: str, currency: str) -> str:
-    """
-    Options Skew by Market and Currency
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'deribit')
-    - currency: Currency identifier (e.g., 'BNB')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - currency: Currency identifier
-        - strike: Strike price
-        - delta: Delta value
-        - iv: Implied volatility value
-    """
-    endpoint_path = f"/analytics/options/skew/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getoichangebystrike(currency: str, market: str, date_range: Optional[str] = None, maturity: Optional[str] = None, min_strike: Optional[str] = None, max_strike: Optional[str] = None) -> str:
-    """
-    Open Interest Change by Strike
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - market: Market identifier (e.g., 'Deribit')
-    
-    Optional query parameters:
-    - date_range: Date range in hours (e.g., '24')
-    - maturity: Maturity period (e.g., 'all')
-    - min_strike: Minimum strike price (e.g., '40000')
-    - max_strike: Maximum strike price (e.g., '50000')
-    
-    Returns:
-    - Array of objects containing:
-        - date: Timestamp in milliseconds
-        - strike: Strike price
-        - open_interest: Open interest value
-        - total_notional_change: Total notional change
-        - open_interest_change: Change in open interest
-        - open_interest_change_percent: Percentage change in open interest
-        - strike_index: Strike price index
-        - date_index: Date index
-        - intensity: Intensity of open interest change
-    """
-    endpoint_path = f"/analytics/options/options_strategy/oi_change_by_strike/{currency}/{market}"
-    query_params = {}
-    if date_range:
-        query_params["date_range"] = date_range
-    if maturity:
-        query_params["maturity"] = maturity
-    if min_strike:
-        query_params["min_strike"] = min_strike
-    if max_strike:
-        query_params["max_strike"] = max_strike
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def gettopoptionsstrategies(currency: str, hours_interval: str, single_trade: str) -> str:
-    """
-    Top Options Strategies
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - hours_interval: Interval in hours (e.g., '24')
-    - single_trade: Single trade indicator (true/false or 1/0)
-    
-    Returns:
-    - Array of objects containing:
-        - date: Timestamp in milliseconds
-        - oi_change: Change in open interest
-        - iv: Implied volatility
-        - amount: Strategy amount
-        - index_price: Current index price
-        - instrument_name: Options instrument name
-        - maturity: Maturity date
-        - strike: Strike price
-        - direction: Trade direction (buy/sell)
-        - total_notional: Total notional value
-        - total_premium: Total premium
-        - total_premium_usd: Total premium in USD
-        - strategy_name: Strategy name
-        - block_trade_id: Block trade identifier
-        - level: Trade level relative to bid
-        - mark_price: Mark price
-        - ask_price: Ask price
-        - bid_price: Bid price
-        - ask_size: Ask size
-        - bid_size: Bid size
-        - delta: Delta value
-        - gamma: Gamma value
-        - vega: Vega value
-        - theta: Theta value
-    """
-    endpoint_path = f"/analytics/options/options_strategy/top_options_strategies/{currency}/{hours_interval}/{single_trade}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getstrategylegbubblechart(currency: str, strategy: Optional[str] = None, maturity: Optional[str] = None, hours_interval: Optional[str] = None, size_filter: Optional[str] = None, single_trade: Optional[str] = None) -> str:
-    """
-    Strategy Leg Bubble Chart
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Optional query parameters:
-    - strategy: Trading strategy (e.g., 'all')
-    - maturity: Maturity period (e.g., 'all')
-    - hours_interval: Interval in hours (e.g., '24')
-    - size_filter: Size filter value (e.g., '0')
-    - single_trade: Single trade indicator (true/false or 1/0)
-    
-    Returns:
-    - Array of objects containing:
-        - date: Timestamp in milliseconds
-        - oi_change: Change in open interest
-        - iv: Implied volatility
-        - amount: Strategy amount
-        - index_price: Current index price
-        - instrument_name: Options instrument name
-        - maturity: Maturity date
-        - strike: Strike price
-        - direction: Trade direction (buy/sell)
-        - total_notional: Total notional value
-        - total_premium: Total premium
-        - total_premium_usd: Total premium in USD
-        - strategy_name: Strategy name
-        - block_trade_id: Block trade identifier
-        - level: Trade level relative to bid
-        - mark_price: Mark price
-        - ask_price: Ask price
-        - bid_price: Bid price
-        - ask_size: Ask size
-        - bid_size: Bid size
-        - delta: Delta value
-        - gamma: Gamma value
-        - vega: Vega value
-        - theta: Theta value
-    """
-    endpoint_path = f"/analytics/options/options_strategy/strategy_leg_bubble_chart/{currency}"
-    query_params = {}
-    if strategy:
-        query_params["strategy"] = strategy
-    if maturity:
-        query_params["maturity"] = maturity
-    if hours_interval:
-        query_params["hours_interval"] = hours_interval
-    if size_filter:
-        query_params["size_filter"] = size_filter
-    if single_trade:
-        query_params["single_trade"] = single_trade
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def getopeninterestchangesummary(currency: str, period: str) -> str:
-    """
-    Open Interest Change Summary
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - markets: Array of market names
-        - ticker: Ticker symbol
-        - open_interest: Total open interest value
-        - open_interest_notional: Notional value of open interest
-        - open_interest_change_usd: Change in open interest in USD
-        - open_interest_notional_change: Change in notional value
-    """
-    endpoint_path = f"/analytics/options/open_interest_change_summary/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getopeninterestchange(market: str, currency: str, period: str) -> str:
-    """
-    Open Interest Change
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Ticker symbol
-        - open_interest: Total open interest value
-        - open_interest_notional: Notional value of open interest
-        - open_interest_change_usd: Change in open interest in USD
-        - open_interest_notional_change: Change in notional value
-    """
-    endpoint_path = f"/analytics/options/open_interest_change/{market}/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getanalyticoptionsorbitaltvol(currency: str) -> str:
-    """
-    Options Orbit Alternative Volatility
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'AAVE')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - 10D FLY: 10-day volatility fly
-        - 10D RR: 10-day risk reversal
-        - 25D FLY: 25-day volatility fly
-        - 25D RR: 25-day risk reversal
-        - ATM: At-the-money volatility
-        - tenor: Tenor value
-    """
-    endpoint_path = f"/analytics/options/orbit_alt_vol/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturesinstrumentdata() -> str:
-    """
-    Futures Instrument Data
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - type: Instrument type
-        - currency: Currency identifier
-        - instrument: Instrument name/identifier
-        - expiry: Expiry date
-    """
-    endpoint_path = "/analytics/futures/instruments"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getalternativecurrencydata() -> str:
-    """
-    Alternative Currency Data
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of alternative currency identifiers
-    """
-    endpoint_path = "/analytics/futures/alt_currency"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getperpetualfundingdata(currency: str) -> str:
-    """
-    Perpetual Funding Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - symbol: Contract symbol
-        - funding: Funding rate
-        - yield: Yield value
-        - next_fr: Next funding rate
-    """
-    endpoint_path = f"/analytics/futures/perpetual_funding/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturesyielddata(currency: str) -> str:
-    """
-    Futures Yield Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - maturity: Maturity date
-        - value: Yield value
-    """
-    endpoint_path = f"/analytics/futures/futures_yield/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturesbasisdata(currency: str) -> str:
-    """
-    Futures Basis Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - maturity: Maturity date
-        - value: Basis value
-    """
-    endpoint_path = f"/analytics/futures/futures_basis/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturescurvedata(currency: str, market: str) -> str:
-    """
-    Futures Curve Data for Currency and Market
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - maturity: Maturity date
-        - value: Curve value
-    """
-    endpoint_path = f"/analytics/futures/futures_curve/{currency}/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturescurvedataforcurrency(currency: str) -> str:
-    """
-    Futures Curve Data for Currency
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - maturity: Maturity date
-        - value: Curve value
-    """
-    endpoint_path = f"/analytics/futures/futures_curve/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getopeninterestgainersandlosersforfuturesmarkets(currency: str, option: str, param: str) -> str:
-    """
-    Open Interest Gainers and Losers for Futures Markets
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - option: Option type (e.g., 'all')
-    - param: Change interval in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - open_interest_change: Change in open interest
-        - open_interest_change_perc: Percentage change in open interest
-        - open_interest_notional_change: Change in notional open interest
-        - open_interest_notional_change_perc: Percentage change in notional open interest
-    """
-    endpoint_path = f"/analytics/futures/markets_oi_gainers_and_losers/{currency}/{option}/{param}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturesmarketsnapshot(market: str) -> str:
-    """
-    Futures Market Snapshot
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing market data with keys as market symbols and values as objects with:
-        - expiration_date: Contract expiration date
-        - bid: Bid price
-        - bid_amount: Bid amount
-        - ask: Ask price
-        - ask_amount: Ask amount
-        - volume: Trading volume
-        - volume_usd: Trading volume in USD
-        - open_interest: Open interest
-        - datetime: Data collection timestamp
-        - underlyer: Underlying asset
-        - basis: Basis value
-        - underlyer_spot: Spot price of underlying
-    """
-    endpoint_path = f"/analytics/futures/snapshot/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getperpetualfundingdatawithtype(currency: str, type: str) -> str:
-    """
-    Perpetual Funding Data with Type
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - type: Market type (e.g., 'c' for Centralized)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - symbol: Contract symbol
-        - funding: Funding rate
-        - yield: Yield value
-        - next_fr: Next funding rate
-    """
-    endpoint_path = f"/analytics/futures/perpetual_funding/{currency}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getopeninterestbreakdowndata(currency: str, type: str) -> str:
-    """
-    Open Interest Breakdown Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - type: Market type (e.g., 'c' for Centralized)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - all: Open interest for all types
-            - usd: USD values by market
-            - notional: Notional values by market
-        - future: Open interest for futures
-            - usd: USD values by market
-            - notional: Notional values by market
-        - perpetual: Open interest for perpetuals
-            - usd: USD values by market
-            - notional: Notional values by market
-    """
-    endpoint_path = f"/analytics/futures/oi_breakdown/{currency}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getvolumebreakdowndata(currency: str, type: str) -> str:
-    """
-    Volume Breakdown Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - type: Market type (e.g., 'c' for Centralized)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing:
-        - all: Volume for all types
-            - usd: USD values by market
-            - notional: Notional values by market
-        - future: Volume for futures
-            - usd: USD values by market
-            - notional: Notional values by market
-        - perpetual: Volume for perpetuals
-            - usd: USD values by market
-            - notional: Notional values by market
-    """
-    endpoint_path = f"/analytics/futures/volume_breakdown/{currency}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getopeninterestgainersandlosersdata(currency: str, option: str, param: str, type: str) -> str:
-    """
-    Open Interest Gainers and Losers Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - option: Option type (e.g., 'all')
-    - param: Change interval in hours (e.g., '1')
-    - type: Market type (e.g., 'c' for Centralized)
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - open_interest_change: Change in open interest
-        - open_interest_change_perc: Percentage change in open interest
-        - open_interest_notional_change: Change in notional open interest
-        - open_interest_notional_change_perc: Percentage change in notional open interest
-    """
-    endpoint_path = f"/analytics/futures/markets_oi_gainers_and_losers/{currency}/{option}/{param}/{type}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getaggregatedfuturesummarydata(currency: str) -> str:
-    """
-    Aggregated Future Summary Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Future symbol
-        - currency: Currency identifier
-        - expiry: Expiry date
-        - price: Price value
-        - open_interest: Open interest value
-        - open_interest_notional: Notional open interest
-        - volume: Volume value
-        - volume_notional: Notional volume
-        - yield: Yield value
-        - basis: Basis value
-        - open_interest_volume: Open interest volume
-        - markets: Array of market identifiers
-    """
-    endpoint_path = f"/analytics/futures/aggregated_future_summary/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getaggregatedoptionsummarydata(currency: str) -> str:
-    """
-    Aggregated Option Summary Data
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Option symbol
-        - currency: Currency identifier
-        - expiry: Expiry date
-        - price: Price value
-        - open_interest: Open interest value
-        - open_interest_notional: Notional open interest
-        - volume: Volume value
-        - volume_notional: Notional volume
-        - yield: Yield value
-        - basis: Basis value
-        - open_interest_volume: Open interest volume
-        - markets: Array of market identifiers
-    """
-    endpoint_path = f"/analytics/futures/aggregated_option_summary/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfutureopeninterestchangesummary(currency: str, period: str) -> str:
-    """
-    Future Open Interest Change Summary
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - markets: Array of market identifiers
-        - ticker: Ticker symbol
-        - open_interest: Total open interest
-        - open_interest_notional: Notional open interest
-        - open_interest_change_usd: Change in USD
-        - open_interest_notional_change: Change in notional value
-    """
-    endpoint_path = f"/analytics/futures/open_interest_change_summary/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfutureopeninterestchange(market: str, currency: str, period: str) -> str:
-    """
-    Future Open Interest Change
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Ticker symbol
-        - open_interest: Total open interest
-        - open_interest_notional: Notional open interest
-        - open_interest_change_usd: Change in USD
-        - open_interest_notional_change: Change in notional value
-    """
-    endpoint_path = f"/analytics/futures/open_interest_change/{market}/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_futures(market: str, currency: str, maturity: str) -> str:
-    """
-    Futures Live Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    - maturity: Maturity date (e.g., '29DEC23')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - base_currency: Base currency
-        - margin: Margin type
-        - index_price: Index price
-        - price: Current price
-        - basis: Basis value
-        - apy: Annual percentage yield
-        - open_interest: Open interest
-        - open_interest_coin: Open interest in coin
-        - oi_volume24h: 24h open interest volume
-        - volume24h: 24h trading volume
-        - volume24h_coin: 24h trading volume in coin
-        - bid: Bid price
-        - ask: Ask price
-        - bid_amount: Bid amount
-        - ask_amount: Ask amount
-        - liquidations: Object containing:
-            - short: Short liquidations
-            - long: Long liquidations
-    """
-    endpoint_path = f"/analytics/derivs/futures/{market}/{currency}/{maturity}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_perpetuals(market: str, currency: str) -> str:
-    """
-    Perpetual Swaps Live Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - base_currency: Base currency
-        - margin: Margin type
-        - market_cap: Market capitalization
-        - index_price: Index price
-        - price: Current price
-        - basis: Basis value
-        - funding: Current funding rate
-        - next_funding: Next funding rate
-        - apy: Annual percentage yield
-        - open_interest: Open interest
-        - open_interest_coin: Open interest in coin
-        - oi_volume24h: 24h open interest volume
-        - volume24h: 24h trading volume
-        - volume24h_coin: 24h trading volume in coin
-        - bid: Bid price
-        - ask: Ask price
-        - bid_amount: Bid amount
-        - ask_amount: Ask amount
-        - liquidations: Object containing:
-            - short: Short liquidations
-            - long: Long liquidations
-        - long_short_ratio: Long/short ratio
-        - realized_vol: Object containing realized volatility for different periods
-        - avg_apr: Object containing average APR for different periods
-    """
-    endpoint_path = f"/analytics/derivs/perpetuals/{market}/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_summary_c(currency: str) -> str:
-    """
-    Aggregated Perps Summary for Currency
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - currency: Currency identifier
-        - price: Current price
-        - change: Price change
-        - market_cap: Market capitalization
-        - realized_vol: Realized volatility
-        - open_interest: Open interest
-        - open_interest_notional: Notional open interest
-        - volume: Trading volume
-        - oi_volume_24h: 24h open interest volume
-        - markets: Array of market identifiers
-        - funding: Funding rate
-        - yield: Yield value
-    """
-    endpoint_path = f"/analytics/derivs/summary/{currency}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_summary() -> str:
-    """
-    Aggregated Perps Summary for All Currencies
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - currency: Currency identifier
-        - price: Current price
-        - change: Price change
-        - market_cap: Market capitalization
-        - realized_vol: Realized volatility
-        - open_interest: Open interest
-        - open_interest_notional: Notional open interest
-        - volume: Trading volume
-        - oi_volume_24h: 24h open interest volume
-        - markets: Array of market identifiers
-        - funding: Funding rate
-        - yield: Yield value
-    """
-    endpoint_path = "/analytics/derivs/summary"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_oi_gainers(market: str, type: str, period: str) -> str:
-    """
-    Open Interest Gainers
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - type: Type of instrument (e.g., 'future')
-    - period: Change interval in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - open_interest_change: Change in open interest
-        - open_interest_change_notional: Change in notional open interest
-        - open_interest_change_percentage: Percentage change in open interest
-    """
-    endpoint_path = f"/analytics/derivs/oi_gainers/{market}/{type}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def get_price_gainers(market: str, type: str, period: str) -> str:
-    """
-    Price Gainers
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - type: Type of instrument (e.g., 'future')
-    - period: Change interval in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - priceChange: Price change value
-    """
-    endpoint_path = f"/analytics/derivs/price_gainers/{market}/{type}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getperpetualssnapshotdatabymarket(market: str) -> str:
-    """
-    Perpetuals Snapshot Data by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Object containing perpetual contract data with keys as contract symbols and values as objects with:
-        - bid: Bid price
-        - bid_amount: Bid amount
-        - ask: Ask price
-        - ask_amount: Ask amount
-        - volume: Trading volume
-        - volume_usd: Trading volume in USD
-        - open_interest: Open interest
-        - datetime: Data collection timestamp
-        - underlyer: Underlying asset
-        - underlyer_spot: Spot price of underlying
-        - basis: Basis value
-        - fr: Current funding rate
-        - next_fr: Next funding rate
-    """
-    endpoint_path = f"/analytics/derivs/perpetuals_snapshot/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getperpetualsdatabymarket(market: str) -> str:
-    """
-    Perpetuals Data by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - base_currency: Base currency
-        - margin: Margin type
-        - market_cap: Market capitalization
-        - index_price: Index price
-        - price: Current price
-        - basis: Basis value
-        - funding: Current funding rate
-        - next_funding: Next funding rate
-        - apy: Annual percentage yield
-        - open_interest: Open interest
-        - open_interest_coin: Open interest in coin
-        - oi_volume24h: 24h open interest volume
-        - volume24h: 24h trading volume
-        - volume24h_coin: 24h trading volume in coin
-        - bid: Bid price
-        - ask: Ask price
-        - bid_amount: Bid amount
-        - ask_amount: Ask amount
-        - liquidations: Object containing:
-            - short: Short liquidations
-            - long: Long liquidations
-        - long_short_ratio: Long/short ratio
-        - realized_vol: Object containing realized volatility for different periods
-        - avg_apr: Object containing average APR for different periods
-    """
-    endpoint_path = f"/analytics/derivs/perpetuals/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getfuturesdatabymarket(market: str) -> str:
-    """
-    Futures Data by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - base_currency: Base currency
-        - margin: Margin type
-        - index_price: Index price
-        - price: Current price
-        - basis: Basis value
-        - apy: Annual percentage yield
-        - open_interest: Open interest
-        - open_interest_coin: Open interest in coin
-        - oi_volume24h: 24h open interest volume
-        - volume24h: 24h trading volume
-        - volume24h_coin: 24h trading volume in coin
-        - bid: Bid price
-        - ask: Ask price
-        - bid_amount: Bid amount
-        - ask_amount: Ask amount
-        - liquidations: Object containing:
-            - short: Short liquidations
-            - long: Long liquidations
-    """
-    endpoint_path = f"/analytics/derivs/futures/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getaltoptiondatabymarket(market: str) -> str:
-    """
-    Alternative Options Data by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - market: Market identifier
-        - symbol: Contract symbol
-        - margin: Margin type
-        - index_price: Index price
-        - underlying_price: Underlying asset price
-        - atm_vol: At-the-money volatility
-        - _25_delta_risk_reversal: 25-delta risk reversal
-        - _25_delta_butterfly: 25-delta butterfly
-        - open_interest: Open interest
-        - open_interest_notional: Notional open interest
-        - volume24h_call: 24h call volume
-        - volume24h_call_notional: 24h call volume notional
-        - volume24h_put: 24h put volume
-        - volume24h_put_notional: 24h put volume notional
-        - volume24h: 24h total volume
-        - volume24h_notional: 24h total volume notional
-        - basis: Basis value
-        - expiry: Expiry date
-    """
-    endpoint_path = f"/analytics/derivs/alt_option/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def gettopfundingdata(market: str) -> str:
-    """
-    Top Funding Data by Market
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - funding: Funding rate
-        - yield: Yield value
-    """
-    endpoint_path = f"/analytics/derivs/top_funding/{market}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getderivsopeninterestchangesummary(currency: str, period: str) -> str:
-    """
-    Perpetual Open Interest Change Summary
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - markets: Array of market identifiers
-        - open_interest: Total open interest
-        - open_interest_notional: Notional open interest
-        - open_interest_change_usd_percentage: Percentage change in USD
-        - open_interest_change_usd: Change in USD
-        - open_interest_notional_change_usd_percentage: Percentage change in notional USD
-        - open_interest_notional_change_usd: Change in notional USD
-    """
-    endpoint_path = f"/analytics/derivs/perpetual/open_interest_change_summary/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def getderivsopeninterestchange(market: str, currency: str, period: str) -> str:
-    """
-    Perpetual Open Interest Change
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    - period: Change period in hours (e.g., '1')
-    
-    Returns:
-    - date: Timestamp of data collection
-    - data: Array of objects containing:
-        - symbol: Contract symbol
-        - open_interest: Total open interest
-        - open_interest_notional: Notional open interest
-        - open_interest_change_usd: Change in USD
-        - open_interest_notional_change: Change in notional value
-    """
-    endpoint_path = f"/analytics/derivs/perpetual/open_interest_change/{market}/{currency}/{period}"
-    return await make_request("GET", endpoint_path)
-
-
-@mcp.tool()
-async def gethistoricalderivssnapshot(market: str, currency: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Derivatives Snapshot Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return (each page = 1 minute of data)
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of minutes in time range
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - volume: Trading volume
-        - volume_usd: Trading volume in USD
-        - underlyer: Underlying asset
-        - bid: Bid price
-        - bid_amount: Amount at bid price
-        - ask: Ask price
-        - ask_amount: Amount at ask price
-        - underlyer_spot: Spot price of underlying
-        - next_fr: Next funding rate
-        - basis: Basis point
-        - datetime: Precise recording time
-        - fr: Current funding rate
-        - open_interest: Total open interest
-        - instrument_name: Derivative instrument name
-    """
-    endpoint_path = f"/historical/derivs/snapshot/{market}/{currency}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def getderivativesliquidationdata(market: str, symbol: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Contract Liquidations
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - symbol: Symbol identifier (e.g., 'BTC_USDC-PERPETUAL')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - side: Trade side (long/short)
-        - usd_amount: Trading volume in USD
-    """
-    endpoint_path = f"/historical/derivs/liquidation/{market}/{symbol}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def getderivativesliquidationbycurrencydata(market: str, currency: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Contract Liquidations by Currency
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'AGGREGATED')
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - side: Trade side (long/short)
-        - usd_amount: Trading volume in USD
-    """
-    endpoint_path = f"/historical/derivs/liquidation_by_currency/{market}/{currency}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def gethistoricalderivssummary(currency: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Derivatives Summary
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - price: Contract price
-        - open_interest: Total open interest
-        - volume: Trading volume
-        - funding: Funding rate
-        - next_fr: Next funding rate
-        - yield: Contract yield
-        - liquidations_long: Long position liquidations
-        - liquidations_short: Short position liquidations
-        - market_cap: Market capitalization
-        - oi_volume24h: 24h open interest volume
-    """
-    endpoint_path = f"/historical/derivs/summary/{currency}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def gettotalvolumeforperpetuals(start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """
-    Total Trading Volume for Perpetuals
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    - legacy: Use old endpoint logic ('true'/'false')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - BTC: Total Bitcoin perpetual volume
-        - ETH: Total Ethereum perpetual volume
-        - Other: Total other perpetual volume
-    """
-    endpoint_path = "/historical/derivs/perpetual/total_volume_by_currency"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity,
-        "legacy": legacy
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def gettotaloiforperpetuals(start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """
-    Total Open Interest for Perpetuals
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    - legacy: Use old endpoint logic ('true'/'false')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - BTC: Total Bitcoin perpetual open interest
-        - ETH: Total Ethereum perpetual open interest
-        - Other: Total other perpetual open interest
-    """
-    endpoint_path = "/historical/derivs/perpetual/total_open_interest_by_currency"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity,
-        "legacy": legacy
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def gethistoricalfuturesdata(market: str, symbol: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Futures Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - symbol: Symbol identifier (e.g., 'BTC-26SEP25')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - expiry: Contract expiry date
-        - price: Contract price
-        - index: Index value
-        - basis: Basis point
-        - yield: Contract yield
-        - volume: Trading volume
-        - open_interest: Total open interest
-        - oi_volume24h: 24h open interest volume
-    """
-    endpoint_path = f"/historical/derivs/futures/{market}/{symbol}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-@mcp.tool()
-async def gethistoricalperpetualderivativesdata(market: str, symbol: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Perpetual Derivatives Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - symbol: Symbol identifier (e.g., 'BTC-PERPETUAL')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - price: Contract price
-        - index: Index value
-        - basis: Basis point
-        - funding: Funding rate
-        - yield: Contract yield
-        - volume: Trading volume
-        - open_interest: Total open interest
-        - oi_volume24h: 24h open interest volume
-        - long_short_ratio: Long/short ratio
-        - next_funding: Next funding rate
-    """
-    endpoint_path = f"/historical/derivs/perpetuals/{market}/{symbol}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def get_calculateriskslide(market: str, currency: str, instrument: Optional[str] = None) -> str:
-    """Calculates the risk slide for a given instrument in the specified market and currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    instrument: ['BTC-26SEP25-110000-C', 'XRP-31JAN25-2.5-C', 'SOL-31JAN25-245-C', 'BNB-31JAN25-760-C', 'ETH-26SEP25-4000-C', 'PAXG-27JUN25-2720-C', 'DOGE-27DEC24-0.304-C', 'XRP-27DEC24-2.12-C', 'SOL-27DEC24-240-C', 'BNB-3JAN25-630-C', 'ETH-26SEP25-3200-C', 'BTC-26SEP25-80000-C', 'XRP-3JAN25-2.3-C', 'NEAR-31JAN25-6-C', 'FIL-31JAN25-6.5-C', 'TON-31JAN25-6.4-C', 'SOL-3JAN25-200-C', 'BCH-31JAN25-500-C', 'ETH-28MAR25-4200-C', 'BTC-28MAR25-102000-C', 'ETH-26SEP25-4600-C', 'BTC-26SEP25-120000-C', 'DOGE-31JAN25-0.365-C', 'KAS-31JAN25-0.145-C', 'XRP-31JAN25-2.38-C', 'TON-31JAN25-5.9-C', 'FIL-31JAN25-6.4-C', 'NEAR-31JAN25-6.6-C', 'ICP-31JAN25-12.25-C', 'LINK-31JAN25-27.6-C', 'ORDI-31JAN25-30-C', 'SOL-31JAN25-190-C', 'BCH-31JAN25-535-C', 'BNB-31JAN25-710-C', 'ETH-26SEP25-4000-C', 'BTC-26SEP25-110000-C', 'ETH-26SEP25-6000-C', 'BTC-26SEP25-95000-C']
-    """
-    # Build the endpoint path
-    endpoint_path = "/pricer/risk_slide/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['instrument'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getriskslideinstruments(market: str) -> str:
-    """list of instruments available for risk slide calculations in the specified market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-
-    """
-    # Build the endpoint path
-    endpoint_path = "/pricer/risk_slide_instruments/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in [] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def get_calculateriskslidev2(market: str, currency: str, instrument: Optional[str] = None) -> str:
-    """Calculates the risk slide for a given instrument in the specified market and currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    instrument: ['BTC-26SEP25-110000-C', 'XRP-31JAN25-2.5-C', 'SOL-31JAN25-245-C', 'BNB-31JAN25-760-C', 'ETH-26SEP25-4000-C', 'PAXG-27JUN25-2720-C', 'DOGE-27DEC24-0.304-C', 'XRP-27DEC24-2.12-C', 'SOL-27DEC24-240-C', 'BNB-3JAN25-630-C', 'ETH-26SEP25-3200-C', 'BTC-26SEP25-80000-C', 'XRP-3JAN25-2.3-C', 'NEAR-31JAN25-6-C', 'FIL-31JAN25-6.5-C', 'TON-31JAN25-6.4-C', 'SOL-3JAN25-200-C', 'BCH-31JAN25-500-C', 'ETH-28MAR25-4200-C', 'BTC-28MAR25-102000-C', 'ETH-26SEP25-4600-C', 'BTC-26SEP25-120000-C', 'DOGE-31JAN25-0.365-C', 'KAS-31JAN25-0.145-C', 'XRP-31JAN25-2.38-C', 'TON-31JAN25-5.9-C', 'FIL-31JAN25-6.4-C', 'NEAR-31JAN25-6.6-C', 'ICP-31JAN25-12.25-C', 'LINK-31JAN25-27.6-C', 'ORDI-31JAN25-30-C', 'SOL-31JAN25-190-C', 'BCH-31JAN25-535-C', 'BNB-31JAN25-710-C', 'ETH-26SEP25-4000-C', 'BTC-26SEP25-110000-C', 'ETH-26SEP25-6000-C', 'BTC-26SEP25-95000-C']
-    """
-    # Build the endpoint path
-    endpoint_path = "/pricer/v2/risk_slide/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['instrument'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getriskslideinstrumentsv2(market: str) -> str:
-    """list of instruments available for risk slide calculations in the specified market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-
-    """
-    # Build the endpoint path
-    endpoint_path = "/pricer/v2/risk_slide_instruments/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in [] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def get_calculateoptionprice() -> str:
-    """Calculates the price and various Greek values for a given option strategy based on the provided input parameters
-    
-    Path parameters:
-
-    
-    Query parameters:
-
-    """
-    # Build the endpoint path
-    endpoint_path = "/pricer/price"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in [] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def get_analyticspotpairs(market: str) -> str:
-    """Provides analytics on available spot pairs per market.
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-
-    """
-    # Build the endpoint path
-    endpoint_path = "/analytics/spot/spot_pairs/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in [] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-
-@mcp.tool()
-async def gethistoricaltotalnotionalpremiumopeninterestbymarket(market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Retrieves historical total notional value and open value by market for a specific market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total/oi_by_market/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaltotalnotionalpremiumvolumebymarket(market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Retrieves historical total notional volume and premium volume data for a specific market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total/volume_by_market/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsdvol(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Delta Volatility (Dvol) Data by Market and Currency in Options Market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/dvol/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsvix(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Volatility Index (VIX) Data by Market and Currency in Options Market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/vix/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsoitotal(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Total Open Interest (OI) by Market and Currency in Options Market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/oi_total/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsoipcratio(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Put-Call (PC) Ratio in Options Market by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/oi_pc_ratio/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsvolumetotal(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Total Historical Volume in Options Market by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/volume_total/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsatmiv(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical ATM Implied Volatility by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/atm_iv/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsmaxpain(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Max Pain Data by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/max_pain/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsgexindex(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical GEX Index Data by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/gex_index/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsvolumepcratio(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Put/Call Ratio Data by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/volume_pc_ratio/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypegammabands(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Gamma Bands by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/gamma_bands/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettotaloibycurrency(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ total Open Interest by Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total/oi_by_currency/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstotalvolumebycurrency(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Volume Data by Currency in Options Market
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total/volume_by_currency/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypeivbidask(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Implied Volatility Bid and Ask by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/iv_bid_ask/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstyperiskreversalmodel(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Risk Reversal Model Data by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/risk_reversal_model/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstyperiskreversal(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Risk Reversal Data by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/risk_reversal/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypeskewmodel(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Skew Model Data by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/skew_model/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypeskew(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Skew Data by Market, Currency and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/skew/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypebutterflymodel(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Butterfly Model Data by Market, Currency, and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/butterfly_model/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypebutterfly(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Butterfly Data by Market, Currency, and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/butterfly/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionstypeatmivmodel(market: str, currency: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical ATM IV Model Data by Market, Currency, and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/type/atm_iv_model/{market}/{currency}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsmaturityatmiv(market: str, currency: str, maturity: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical At-The-Money Implied Volatility (ATM IV) for a Specific Maturity by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    maturity: ['10MAY25', '11MAY25', '16MAY25', '23MAY25', '25JUL25', '26DEC25', '26SEP25', '27JUN25', '27MAR26', '30MAY25', '8MAY25', '9MAY25']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/maturity/atm_iv_h/{market}/{currency}/{maturity}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{maturity}", maturity)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsmaturityoivolume(market: str, currency: str, maturity: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Open Interest (OI) and Volume for a Specific Maturity by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    maturity: ['10MAY25', '11MAY25', '16MAY25', '23MAY25', '25JUL25', '26DEC25', '26SEP25', '27JUN25', '27MAR26', '30MAY25', '8MAY25', '9MAY25']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/maturity/oi_volume/{market}/{currency}/{maturity}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{maturity}", maturity)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsorbitaltvol(currency: str, maturity_name: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Historical Options Orbit Alternative Volatility Data for a Specific Maturity by Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    maturity_name: ['atmivts_historical', 'heatmap_change', 'historical_buy_sell_volume', 'iv_table_change', 'oi_gainers_and_losers', 'oi_net_change', 'time_skew']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/orbit_alt_vol/{currency}/{maturity_name}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{maturity_name}", maturity_name)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsivrv(market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Implied Volatility (IV) and Realized Volatility (RV) Data by Market and Currency in Options Market
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/iv_rv/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsspreadtypeskew(market: str, type: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Skew Data for a Specific Spread (ETH - BTC) by Market and Type
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    type: ['C', 'P']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/spread/type/skew/{market}/{type}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsmaturitytotaloi(market: str, currency: str, maturity: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Total Open Interest (OI) for a Specific Maturity by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    maturity: ['10MAY25', '11MAY25', '16MAY25', '23MAY25', '25JUL25', '26DEC25', '26SEP25', '27JUN25', '27MAR26', '30MAY25', '8MAY25', '9MAY25']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/maturity/total_oi/{market}/{currency}/{maturity}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{maturity}", maturity)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsmaturitytotalvolume(market: str, currency: str, maturity: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Total Volume for a Specific Maturity by Market and Currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    maturity: ['10MAY25', '11MAY25', '16MAY25', '23MAY25', '25JUL25', '26DEC25', '26SEP25', '27JUN25', '27MAR26', '30MAY25', '8MAY25', '9MAY25']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/maturity/total_volume/{market}/{currency}/{maturity}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{maturity}", maturity)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsactualvolbutterflymodel(market: str, currency: str, type: str, days: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Options Actual Volatility with Butterfly Model for a Specific Type and Number of Days
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    days: ['180', '30', '365', '60', '7', '90']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/actual_vol/butterfly_model/{market}/{currency}/{type}/{days}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    endpoint_path = endpoint_path.replace("{days}", days)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsactualvolskewmodel(market: str, currency: str, type: str, days: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Options Actual Volatility with Skew Model for a Specific Type and Number of Days
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    days: ['180', '30', '365', '60', '7', '90']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/actual_vol/skew_model/{market}/{currency}/{type}/{days}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    endpoint_path = endpoint_path.replace("{days}", days)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getoptionsactualvolriskreversalmodel(market: str, currency: str, type: str, days: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Options Actual Volatility with Risk Reversal Model for a Specific Type and Number of Days
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    type: ['C', 'P']
-    days: ['180', '30', '365', '60', '7', '90']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/actual_vol/risk_reversal_model/{market}/{currency}/{type}/{days}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{type}", type)
-    endpoint_path = endpoint_path.replace("{days}", days)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getv2historicaltrades(market: str, currency: str, date: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, blockTradeId: Optional[str] = None, sortBy: Optional[str] = None) -> str:
-    """Get historical trades for a specific market and currency
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    date: YYYY-MM-DD format
-    limit: Integer (records per page)
-    page: Integer (page number)
-    blockTradeId: Block trade identifier
-    sortBy: Field to sort by
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/v2/trades/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['date', 'limit', 'page', 'blockTradeId', 'sortBy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettotalvolumeforoptions(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Get total trading volume for options
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total_volume_by_currency"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettotaloiforoptions(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Get total open interest (OI) for options
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/options/total_open_interest_by_currency"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesrealizedvolatility(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Realized Volatility for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/realized_volatility/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesoiweightedfunding(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Open Interest Weighted Funding for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/oi_weighted_funding/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesoiweightedvolumefunding(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Open Interest Weighted Volume Funding for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/oi_weighted_volume_funding/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesoiweightedbasisfunding(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Open Interest Weighted Basis for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/oi_weighted_basis/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturestotaloi(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Total Open Interest for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_oi/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturestotaloibymargin(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Total Open Interest by Margin for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_oi_by_margin/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturestotalvolume(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Total Volume for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_volume/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturestotalvolumebymargin(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Total Volume by Margin for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_volume_by_margin/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesaltcoinsummary(currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Altcoin Summary for a Specific Currency
-    
-    Path parameters:
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/alt_summary/{currency}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getfuturesmarketindexdata(index: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Market Index Data for a Specific Index
-    
-    Path parameters:
-    index: ['defi', 'digital_asset', 'exchange', 'layer1', 'layer2', 'memecoin', 'nft_gaming', 'oracle_data', 'privacy']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/market_index/{index}"
-    endpoint_path = endpoint_path.replace("{index}", index)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalindicespricedata(index: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Indices Price Data
-    
-    Path parameters:
-    index: ['defi', 'digital_asset', 'exchange', 'layer1', 'layer2', 'memecoin', 'nft_gaming', 'oracle_data', 'privacy']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/indices_price/{index}"
-    endpoint_path = endpoint_path.replace("{index}", index)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalfuturesannualizedbasisdata(currency: str, days: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Futures Annualized Basis Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    days: ['180', '30', '365', '60', '7', '90']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/futures_annualized_basis/{currency}/{days}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{days}", days)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalperpetualfundingexchangedata(currency: str, option: str, market: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """ Historical Perpetual Funding Exchange Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    option: ['all', 'future', 'perpetual']
-    
-    Query parameters:
-    market: []
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/perpetual_funding_exchange/{currency}/{option}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{option}", option)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['market', 'start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaltotalopeninterestbyexchangedata(currency: str, option: str, market: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """ Historical Total Open Interest by Exchange Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    option: ['all', 'future', 'perpetual']
-    
-    Query parameters:
-    market: []
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_oi_by_exchange/{currency}/{option}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{option}", option)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['market', 'start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaltotalvolumebyexchangedata(currency: str, option: str, market: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """ Historical Total Volume by Exchange Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    option: ['all', 'future', 'perpetual']
-    
-    Query parameters:
-    market: []
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_volume_by_exchange/{currency}/{option}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{option}", option)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['market', 'start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalperpetualyielddata(currency: str, market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Perpetual Yield Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/perpetual_yield/{currency}/{market}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalperpetualfundingdata(currency: str, market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Perpetual Funding Data
-    
-    Path parameters:
-    currency: Any valid token symbol
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/perpetual_funding/{currency}/{market}"
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaltotalglobalopeninterestactivitydata(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Total Global Open Interest Activity Data
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/oi_total_global_activity"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaltotalglobalvolumeactivitydata(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Total Global Volume Activity Data
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/volume_total_global_activity"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalexchangedata(market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Exchange Data
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/aggregate_exchange_data/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalglobalfuturesactivitydata(market: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """ Historical Global Future Activity Data
-    
-    Path parameters:
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/global_activity_futures/{market}"
-    endpoint_path = endpoint_path.replace("{market}", market)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettotalvolumeforfutures(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Get total trading volume for futures
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_volume_by_currency"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gettotaloiforfutures(start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None, legacy: Optional[str] = None) -> str:
-    """Get total open interest (OI) for futures
-    
-    Path parameters:
-
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    legacy: Boolean (true/false)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/futures/total_open_interest_by_currency"
-
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity', 'legacy'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalderivssummary(currency: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Derivatives Summary
-    
-    Required path parameters:
-    - currency: Currency identifier (e.g., 'BTC')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - price: Contract price
-        - open_interest: Total open interest
-        - volume: Trading volume
-        - funding: Funding rate
-        - next_fr: Next funding rate
-        - yield: Contract yield
-        - liquidations_long: Long position liquidations
-        - liquidations_short: Short position liquidations
-        - market_cap: Market capitalization
-        - oi_volume24h: 24h open interest volume
-    """
-    endpoint_path = f"/historical/derivs/summary/{currency}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def gethistoricalfuturesdata(market: str, symbol: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Futures Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - symbol: Symbol identifier (e.g., 'BTC-26SEP25')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - expiry: Contract expiry date
-        - price: Contract price
-        - index: Index value
-        - basis: Basis point
-        - yield: Contract yield
-        - volume: Trading volume
-        - open_interest: Total open interest
-        - oi_volume24h: 24h open interest volume
-    """
-    endpoint_path = f"/historical/derivs/futures/{market}/{symbol}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def gethistoricalperpetualderivativesdata(market: str, symbol: str, start: str, end: str, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """
-    Historical Perpetual Derivatives Data
-    
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - symbol: Symbol identifier (e.g., 'BTC-PERPETUAL')
-    
-    Required query parameters:
-    - start: Start date of search range (e.g., '2025-05-12', '2025-05-12T10:15', '1747011600000')
-    - end: End date of search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000')
-    
-    Optional query parameters:
-    - limit: Maximum number of results per page (max 144)
-    - page: Page number to return
-    - granularity: Interval between dates ('5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d')
-    
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - date: Data recording timestamp
-        - price: Contract price
-        - index: Index value
-        - basis: Basis point
-        - funding: Funding rate
-        - yield: Contract yield
-        - volume: Trading volume
-        - open_interest: Total open interest
-        - oi_volume24h: 24h open interest volume
-        - long_short_ratio: Long/short ratio
-        - next_funding: Next funding rate
-    """
-    endpoint_path = f"/historical/derivs/perpetuals/{market}/{symbol}"
-    query_params = {
-        "start": start,
-        "end": end,
-        "limit": limit,
-        "page": page,
-        "granularity": granularity
-    }
-    return await make_request("GET", endpoint_path, query_params)
-
-
-@mcp.tool()
-async def getorderbookbymarkettypesymbol(marketType: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """Fetch historical simple order books for specific market type 
-    
-    Path parameters:
-    marketType: ['future', 'perpetual', 'spot']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/orderbooks/{marketType}/{currency}"
-    endpoint_path = endpoint_path.replace("{marketType}", marketType)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getorderbookbymarkettypemarketcurrency(marketType: str, market: str, currency: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """Fetch historical simple order books for specific market and currency 
-    
-    Path parameters:
-    marketType: ['future', 'perpetual', 'spot']
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    currency: Any valid token symbol
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/orderbooks/{marketType}/{market}/{currency}"
-    endpoint_path = endpoint_path.replace("{marketType}", marketType)
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{currency}", currency)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def getorderbookbymarkettypemarketsymbol(marketType: str, market: str, symbol: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None, granularity: Optional[str] = None) -> str:
-    """Fetch historical simple order books for specific market and symbol 
-    
-    Path parameters:
-    marketType: ['future', 'perpetual', 'spot']
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    symbol: ['BTC_USDCETUAL', 'BTC-27JUN25', 'BTCETUAL', 'ETHETUAL', 'BTCDOMUSDT', 'BTCUSD_250627', 'BTCUSD_250926', 'BTCUSD_PERP', 'BTCUSDC', 'TBTCF0:USTF0', 'ETHUSD', 'ETHUSDT', 'BTCPERP', 'BTCUSD', 'BTCUSDM25', 'BTCUSDT', 'BTCUSDT-26DEC25', 'BTC-USD', 'BTC-USDT', 'ETH-USD', 'ETH-USDT', 'ETHFI-USDT', 'BTC-USD', 'BTC-USDC', 'BTC-USDT', 'ETH-USD', 'ETHFI-USDT']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    granularity: ['1m', '5m', '15m', '30m', '1h', '4h', '12h', '1d']
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/orderbooks/by_symbol/{marketType}/{market}/{symbol}"
-    endpoint_path = endpoint_path.replace("{marketType}", marketType)
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{symbol}", symbol)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page', 'granularity'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricalspotohlc(symbol: str, market: str, period: str, start: Optional[str] = None, end: Optional[str] = None, limit: Optional[str] = None, page: Optional[str] = None) -> str:
-    """Get Historical Spot OHLC Data
-    
-    Path parameters:
-    symbol: ['BTC_USDCETUAL', 'BTC-27JUN25', 'BTCETUAL', 'ETHETUAL', 'BTCDOMUSDT', 'BTCUSD_250627', 'BTCUSD_250926', 'BTCUSD_PERP', 'BTCUSDC', 'TBTCF0:USTF0', 'ETHUSD', 'ETHUSDT', 'BTCPERP', 'BTCUSD', 'BTCUSDM25', 'BTCUSDT', 'BTCUSDT-26DEC25', 'BTC-USD', 'BTC-USDT', 'ETH-USD', 'ETH-USDT', 'ETHFI-USDT', 'BTC-USD', 'BTC-USDC', 'BTC-USDT', 'ETH-USD', 'ETHFI-USDT']
-    market: ['deribit', 'binance', 'bybit', 'coincall', 'okx']
-    period: ['1', '2', '4', '8', '12', '18', '24', '48', '168', '336', '504', '720', '8760', 'ytd']
-    
-    Query parameters:
-    start: YYYY-MM-DD format or Unix timestamp
-    end: YYYY-MM-DD format or Unix timestamp
-    limit: Integer (records per page)
-    page: Integer (page number)
-    """
-    # Build the endpoint path
-    endpoint_path = "/historical/spot/{market}/{symbol}/{period}"
-    endpoint_path = endpoint_path.replace("{symbol}", symbol)
-    endpoint_path = endpoint_path.replace("{market}", market)
-    endpoint_path = endpoint_path.replace("{period}", period)
-    
-    # Build query parameters
-    query_params = {
-        k: v for k, v in locals().items() 
-        if k in ['start', 'end', 'limit', 'page'] and v is not None
-    }
-    
-    # Make the request
-    result = await make_request('GET', endpoint_path, query_params)
-    return str(result)
-
-
-@mcp.tool()
-async def gethistoricaloptionstrades(
-    market: str,
-    currency: str,
-    date: str,
-    limit: Optional[int] = None,
-    page: Optional[int] = None
-) -> str:
-    """
-    Retrieves historical options trade data for a specific currency in a given market.
-
-    Required path parameters:
-    - market: Market identifier (e.g., 'DERIBIT')
-    - currency: Currency identifier (e.g., 'BTC')
-
-    Required query parameters:
-    - date: The date of the search range (e.g., '2025-05-19', '2025-05-19T10:15', '1747618500000'). This date will always be changed to start of day.
-
-    Optional query parameters:
-    - limit: The maximum number of results to return per page (max 144)
-    - page: The page of results to return
-
-    Returns:
-    - meta: Object containing pagination info:
-        - total: Total number of items
-        - page: Current page number
-        - items: Number of items on current page
-        - total_pages: Total number of pages
-    - items: Array of objects containing:
-        - id: Unique identifier of the trade
-        - market: The market where the trade took place
-        - currency: The currency involved in the trade
-        - option_type: The type of the option (call or put)
-        - maturity: The maturity date of the option
-        - date: The date when the trade was recorded
-        - index_price: The price of the underlying index at the time of the trade
-        - strike: The strike price of the option
-        - mark_price: The market price of the option
-        - implied_vol: The implied volatility of the option
-        - trade_seq: The sequence number of the trade
-        - trade_id: Unique identifier of the trade
-        - liquidation: Indicator of whether the trade was a liquidation (1) or not (0)
-        - block_trade_id: Identifier of a block trade if applicable
-        - tick_direction: Direction of the price tick
-        - price: The price at which the trade occurred
-        - direction: Direction of the trade (0 for buy, 1 for sell)
-        - amount: The amount traded
-    """
-    endpoint_path = f"/historical/options/trades/{market}/{currency}"
-    query_params = {
-        "date": date,
-        "limit": limit,
-        "page": page
-    }
-    # Remove None values from query_params
-    query_params = {k: v for k, v in query_params.items() if v is not None}
-    return await make_request("GET", endpoint_path, query_params)
+async def getdiagnostics() -> str:
+    """
+    Client-side diagnostics for this MCP server
+    
+    Returns:
+    - cache: Response cache counters
+        - hits: Lookups served from the cache (memory_hits + disk_hits)
+        - misses: Lookups that went upstream
+        - evictions: Entries dropped to stay within the size budget
+        - expirations: Entries dropped because their TTL elapsed
+        - entries: Entries currently held in memory
+        - bytes: Size of the in-memory entries
+    - inflight: Request coalescing counters
+        - leaders: Upstream calls started
+        - coalesced: Calls that joined an identical call already in flight
+        - in_flight: Upstream calls currently running
+    - throttle: Client-side rate limiting
+        - sent, rate_limited (429), server_errors (5xx), timeouts: Upstream request outcomes
+        - bucket: Token bucket rate, burst, tokens left and requests delayed waiting for a token
+        - concurrency: Adaptive (AIMD) limit on requests in flight, with its increases and decreases
+    - retry: Retries of transient failures (429, 5xx, connect errors, timeouts) on GETs
+        - retries: Retries made, with their causes in reasons
+        - recovered: Requests that succeeded after at least one retry
+        - exhausted: Requests that failed on every attempt
+        - deadline_exceeded: Requests not retried because the tool call deadline was near
+    - pool: Connections held by the HTTP client (total, HTTP/2, idle)
+        - warmer: Startup warm-up and keepalive pings (warmups, pings, failures)
+    - cursors: Series with a since_last cursor
+    - surfaces: Volatility surface cache (TTL, surfaces held, hits, builds and time spent fitting)
+    - store: Local time-series store (series, rows, rows served from it, gaps fetched upstream), or null
+    - catalog: Catalog load time (from the JSON file or its snapshot) against the cold start budget,
+      and rejected_calls, calls refused by local parameter validation without a request
+    """
+    return json.dumps({"cache": cache.stats(), "inflight": inflight.stats(), "throttle": throttle.stats(), "retry": retry.stats(), "pool": {**pool_stats(client), "warmer": warmer.stats()}, "cursors": len(cursors), "surfaces": surfaces.stats(), "store": store.stats() if store else None, "catalog": get_catalog().stats()})
 
 
 if __name__ == "__main__":
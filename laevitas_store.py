@@ -0,0 +1,224 @@
+"""
+Local time-series store for the historical endpoints of the Laevitas API
+"""
+
+import json
+import asyncio
+import sqlite3
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Any, Callable, Awaitable, Tuple
+from urllib.parse import urlencode
+from laevitas_cache import SETTLE_WINDOW
+from laevitas_history import budget_reached, date_key, row_time
+
+# Query parameters that select a time range or a page rather than a series
+RANGE_PARAMS = {"start", "end", "page", "limit"}
+
+
+def series_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Identify a series by its endpoint (with path params filled in) and remaining query params, e.g. granularity."""
+    series = {k: str(v) for k, v in sorted(params.items()) if k not in RANGE_PARAMS and v is not None}
+    return f"{endpoint}?{urlencode(series)}"
+
+
+class SeriesStore:
+    """Append-only SQLite store of historical rows, with the time intervals known to be complete.
+
+    Intervals are inclusive epoch-millisecond ranges. Only settled data (older than the
+    cache's settle window) is stored, so a stored interval never needs refetching.
+    """
+
+    def __init__(self, path: str):
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS series (id INTEGER PRIMARY KEY, key TEXT UNIQUE);
+            CREATE TABLE IF NOT EXISTS coverage (series INTEGER, start INTEGER, end INTEGER);
+            CREATE INDEX IF NOT EXISTS coverage_series ON coverage (series, start);
+            CREATE TABLE IF NOT EXISTS rows (series INTEGER, date INTEGER, body TEXT);
+            CREATE INDEX IF NOT EXISTS rows_series_date ON rows (series, date);
+            """
+        )
+        self._db.commit()
+        self._ids: Dict[str, int] = {}
+        self.counters = {"stored_rows_served": 0, "gaps_fetched": 0, "intervals_stored": 0}
+
+    def settled_before(self) -> int:
+        """Epoch ms up to which upstream data no longer changes."""
+        return int((datetime.now(timezone.utc) - SETTLE_WINDOW).timestamp() * 1000)
+
+    def missing(self, key: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """The parts of [start, end] not covered by stored intervals."""
+        gaps = []
+        cursor, covered = start, False
+        for lo, hi in self._db.execute(
+            "SELECT start, end FROM coverage WHERE series = ? AND end >= ? AND start <= ? ORDER BY start",
+            (self._series(key), start, end),
+        ):
+            if lo > cursor:
+                gaps.append((cursor, lo))
+            if hi >= cursor:
+                cursor, covered = hi, True
+        if cursor < end or not covered:
+            gaps.append((cursor, end))
+        return gaps
+
+    def add(self, key: str, start: int, end: int, rows: List[Any]):
+        """Replace the rows of [start, end] and mark the interval complete."""
+        if end < start:
+            return
+        series = self._series(key)
+        timed = [(row_time(row), row) for row in rows]
+        self._db.execute("DELETE FROM rows WHERE series = ? AND date BETWEEN ? AND ?", (series, start, end))
+        self._db.executemany(
+            "INSERT INTO rows (series, date, body) VALUES (?, ?, ?)",
+            [
+                (series, t, json.dumps(row, separators=(",", ":"), ensure_ascii=False))
+                for t, row in timed
+                if t is not None and start <= t <= end
+            ],
+        )
+        # Merge with every interval overlapping or touching [start, end]
+        for lo, hi in self._db.execute(
+            "SELECT start, end FROM coverage WHERE series = ? AND end >= ? AND start <= ?", (series, start, end)
+        ).fetchall():
+            start, end = min(start, lo), max(end, hi)
+        self._db.execute("DELETE FROM coverage WHERE series = ? AND end >= ? AND start <= ?", (series, start, end))
+        self._db.execute("INSERT INTO coverage (series, start, end) VALUES (?, ?, ?)", (series, start, end))
+        self._db.commit()
+        self.counters["intervals_stored"] += 1
+
+    def count(self, key: str, start: int, end: int, transform: Optional[Callable[[Any], Any]] = None) -> int:
+        """Rows stored in [start, end]; with transform, only those it does not map to None."""
+        if transform is not None:
+            return sum(
+                transform(json.loads(body)) is not None
+                for (body,) in self._db.execute(
+                    "SELECT body FROM rows WHERE series = ? AND date BETWEEN ? AND ?", (self._series(key), start, end)
+                )
+            )
+        count, = self._db.execute(
+            "SELECT COUNT(*) FROM rows WHERE series = ? AND date BETWEEN ? AND ?", (self._series(key), start, end)
+        ).fetchone()
+        return count
+
+    def read(self, key: str, start: int, end: int) -> List[Any]:
+        rows = [
+            json.loads(body)
+            for (body,) in self._db.execute(
+                "SELECT body FROM rows WHERE series = ? AND date BETWEEN ? AND ? ORDER BY date, rowid",
+                (self._series(key), start, end),
+            )
+        ]
+        self.counters["stored_rows_served"] += len(rows)
+        return rows
+
+    def stats(self) -> Dict[str, Any]:
+        series, = self._db.execute("SELECT COUNT(*) FROM series").fetchone()
+        rows, = self._db.execute("SELECT COUNT(*) FROM rows").fetchone()
+        return {"series": series, "rows": rows, **self.counters}
+
+    def _series(self, key: str) -> int:
+        series = self._ids.get(key)
+        if series is None:
+            self._db.execute("INSERT OR IGNORE INTO series (key) VALUES (?)", (key,))
+            series, = self._db.execute("SELECT id FROM series WHERE key = ?", (key,)).fetchone()
+            self._ids[key] = series
+        return series
+
+
+async def fetch_with_store(
+    store: SeriesStore,
+    key: str,
+    start: int,
+    end: int,
+    fetch_interval: Callable[[int, int, Optional[int], Optional[int]], Awaitable[Any]],
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    concurrency: int = 8,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Serve [start, end] from the store, fetching only the intervals it is missing.
+
+    fetch_interval(start, end, max_rows, max_bytes) returns the stitched result of one
+    missing interval (see fetch_windows). Gaps are fetched concurrently (at most
+    `concurrency` at once) and consumed in date order, so fetching stops once the rows
+    up to the latest gap reach max_rows or the bytes fetched reach max_bytes; the result
+    then ends at that gap. Complete results are stored up to the settled cutoff; rows
+    past it, or of intervals that came back incomplete or with rows lacking a readable
+    date, are returned without storing (and such intervals are fetched again next time).
+    The store keeps every row; `transform` applies to the rows returned, before they
+    count towards max_rows, and rows it maps to None are dropped.
+    """
+    gaps = store.missing(key, start, end)
+    cutoff = store.settled_before()
+    fresh: List[Any] = []
+    meta: Dict[str, Any] = {"gaps": len(gaps), "gaps_fetched": 0, "truncated": False, "undated_rows": 0}
+    first: Dict[str, Any] = {}
+    size = 0
+    through = end
+
+    def launch(lo: int, hi: int) -> "asyncio.Future[Any]":
+        # Rows stored before the gap already count towards the budget; filtered rows are counted here
+        budget = None if max_rows is None or transform is not None else max(max_rows - store.count(key, start, lo - 1) - len(fresh), 1)
+        return asyncio.ensure_future(fetch_interval(lo, hi, budget, None if max_bytes is None else max(max_bytes - size, 1)))
+
+    remaining = iter(gaps)
+    pending: Deque[Tuple[int, int, "asyncio.Future[Any]"]] = deque()
+    for lo, hi in remaining:
+        pending.append((lo, hi, launch(lo, hi)))
+        if len(pending) >= concurrency:
+            break
+    try:
+        while pending:
+            lo, hi, task = pending.popleft()
+            result = await task
+            if not isinstance(result, dict) or not isinstance(result.get("items"), list):
+                return result
+            store.counters["gaps_fetched"] += 1
+            meta["gaps_fetched"] += 1
+            first = first or {k: v for k, v in result.items() if k not in ("meta", "items")}
+            gap_meta = result.get("meta") or {}
+            size += gap_meta.get("bytes") or 0
+            rows = result["items"]
+            undated = sum(row_time(row) is None for row in rows)
+            meta["undated_rows"] += undated
+            kept = rows
+            if gap_meta.get("truncated"):
+                meta["truncated"] = True
+                if gap_meta.get("error"):
+                    meta["error"] = gap_meta["error"]
+            elif not undated:
+                store.add(key, lo, min(hi, cutoff), rows)
+                kept = [row for row in rows if (row_time(row) or 0) > cutoff]
+            fresh.extend(kept if transform is None else [row for row in map(transform, kept) if row is not None])
+            done = gap_meta.get("truncated") or budget_reached(store.count(key, start, hi, transform) + len(fresh), size, max_rows, max_bytes)
+            if done:
+                # The result ends where the fetched rows do, so it has no holes
+                if gap_meta.get("truncated"):
+                    through = max((t for t in map(row_time, rows) if t is not None), default=lo)
+                elif pending or next(remaining, None) is not None:
+                    meta["truncated"] = True
+                    through = hi
+                break
+            gap = next(remaining, None)
+            if gap is not None:
+                pending.append((*gap, launch(*gap)))
+    finally:
+        for _, _, task in pending:
+            task.cancel()
+    stored = store.read(key, start, through)
+    meta["stored_rows"] = len(stored)
+    # Gaps start and end on instants that are already stored
+    stored_times = {row_time(row) for row in stored}
+    if transform is not None:
+        stored = [row for row in map(transform, stored) if row is not None]
+    items = stored + [row for row in fresh if row_time(row) is None or row_time(row) not in stored_times]
+    items.sort(key=date_key)
+    if max_rows is not None and len(items) > max_rows:
+        del items[max_rows:]
+        meta["truncated"] = True
+    meta["items"] = len(items)
+    meta["bytes"] = size
+    return {**first, "meta": meta, "items": items}
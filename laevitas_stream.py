@@ -0,0 +1,196 @@
+"""
+Incremental decoding of large JSON responses for the Laevitas MCP Server
+"""
+
+import re
+import json
+import codecs
+from typing import Dict, List, Optional, Any, Callable, AsyncIterator, Tuple
+
+# Keys under which object responses hold their row list
+ROW_KEYS = ("items", "data")
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that can follow a complete value
+DELIMITERS = frozenset(",:]} \t\n\r")
+
+# Undecoded text is compacted once this much of the buffer has been consumed
+COMPACT_AT = 1 << 20
+
+
+class RowParser:
+    """Incremental parser for a row array, or an object holding one under items/data.
+
+    Text is fed as it arrives. Each complete row is decoded on its own and handed to
+    `on_row`, so the undecoded text held is about one row plus one chunk; other
+    top-level values are decoded as a whole into `head`. `on_row` returns False to stop
+    parsing (e.g. once enough rows are collected). Bodies of any other shape are
+    buffered and decoded at the end.
+    """
+
+    def __init__(self, on_row: Callable[[Any], bool]):
+        self.on_row = on_row
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.state = "start"
+        self.head: Dict[str, Any] = {}
+        self.rows: Optional[List[Any]] = None
+        self.value: Any = None
+        self.closed = False
+        self.stopped = False
+        self._retry_at = 0
+
+    def feed(self, text: str):
+        self.buffer += text
+        if len(self.buffer) < self._retry_at:
+            return
+        while not self.stopped and self.state != "end" and self._step():
+            pass
+        if self.pos >= COMPACT_AT or self.pos * 2 > len(self.buffer):
+            self.buffer = self.buffer[self.pos:]
+            self._retry_at -= self.pos
+            self.pos = 0
+
+    def close(self) -> Any:
+        """Finish parsing and return the decoded response, with the rows collected so far."""
+        self.closed = True
+        self._retry_at = 0
+        self.feed("")
+        if self.state == "whole":
+            return json.loads(self.buffer)
+        if self.state != "end" and not self.stopped:
+            raise ValueError("Incomplete JSON response")
+        return self.value
+
+    def _skip(self) -> Optional[str]:
+        self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else None
+
+    def _decode(self) -> Tuple[bool, Any]:
+        """Decode the value at pos; (False, None) if its text has not fully arrived yet.
+
+        A number may be cut short by a chunk boundary ('0.' decodes as 0, '1e' as 1), so a
+        value counts as complete only once a delimiter follows it or the body is closed.
+        """
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            if self.closed:
+                raise
+            self._retry_at = len(self.buffer) + max(len(self.buffer) - self.pos, 1)
+            return False, None
+        if not self.closed and (end == len(self.buffer) or self.buffer[end] not in DELIMITERS):
+            self._retry_at = len(self.buffer) + 1
+            return False, None
+        self.pos = end
+        return True, value
+
+    def _step(self) -> bool:
+        """Advance by one token or value; False when more text is needed."""
+        state = self.state
+        if state == "whole":
+            return False
+        char = self._skip()
+        if char is None:
+            return False
+        if state == "start":
+            if char == "[":
+                self.rows = self.value = []
+                self.state = "rows"
+            elif char == "{":
+                self.value = self.head
+                self.state = "key"
+            else:
+                self.state = "whole"
+                return False
+            self.pos += 1
+        elif state == "key":
+            if char == "}":
+                self.pos += 1
+                self.state = "end"
+                return True
+            if char == ",":
+                self.pos += 1
+                return True
+            start = self.pos
+            done, key = self._decode()
+            if not done:
+                return False
+            if self._skip() != ":":
+                if self._skip() is None and not self.closed:
+                    self.pos = start
+                    return False
+                raise ValueError("Expected ':' in JSON object")
+            self.pos += 1
+            self.state = ("value", key)
+        elif state[0] == "value":
+            key = state[1]
+            if char == "[" and key in ROW_KEYS and self.rows is None:
+                self.rows = self.head[key] = []
+                self.pos += 1
+                self.state = "rows"
+            else:
+                done, value = self._decode()
+                if not done:
+                    return False
+                self.head[key] = value
+                self.state = "key"
+        elif state == "rows":
+            if char == "]":
+                self.pos += 1
+                self.state = "end" if self.value is self.rows else "key"
+                return True
+            if char == ",":
+                self.pos += 1
+                return True
+            done, row = self._decode()
+            if not done:
+                return False
+            if not self.on_row(row):
+                self.stopped = True
+        return True
+
+
+def single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    async def chunks():
+        yield body
+    return chunks()
+
+
+async def collect_rows(
+    chunks: AsyncIterator[bytes],
+    max_rows: Optional[int] = None,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[Any, bool]:
+    """Decode a response body as it arrives, keeping at most `max_rows` rows.
+
+    `transform` is applied to each row as it is decoded; rows it maps to None are
+    dropped. Returns the decoded response and whether rows were cut off, in which case
+    reading stops early and top-level keys after the rows are not included.
+    """
+    rows: List[Any] = []
+
+    def on_row(row: Any) -> bool:
+        if transform is not None:
+            row = transform(row)
+            if row is None:
+                return True
+        if max_rows is not None and len(rows) >= max_rows:
+            return False
+        rows.append(row)
+        return True
+
+    parser = RowParser(on_row)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        parser.feed(decoder.decode(chunk))
+        if parser.stopped:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+    result = parser.close()
+    if parser.rows is not None:
+        parser.rows[:] = rows
+    return result, parser.stopped
@@ -0,0 +1,273 @@
+"""
+Implied volatility surfaces for the Laevitas MCP Server
+
+Each expiry's smile is fitted with raw SVI and the whole surface with SSVI, both on total
+implied variance w = iv^2 * t against log-moneyness k = ln(K / F). Fitted surfaces are
+cached per (market, currency), so IV queries at any strike and tenor are answered
+locally until the entry expires.
+"""
+
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
+from laevitas_catalog import maturity_date
+from laevitas_output import rows_of
+from laevitas_pricing import year_fraction
+
+# Tenors such as '30d', '2w', '3m' or '1y'
+TENOR = re.compile(r"^(\d+(?:\.\d+)?)\s*([dwmy])$", re.IGNORECASE)
+
+TENOR_UNITS = {"d": 1 / 365, "w": 7 / 365, "m": 1 / 12, "y": 1.0}
+
+# Fewest quotes a smile needs to be fitted
+MIN_POINTS = 5
+
+# Log-moneyness range on which the no-arbitrage conditions are checked
+CHECK_K = np.linspace(-1.5, 1.5, 61)
+
+
+def tenor_years(tenor: str, now: Optional[datetime] = None) -> float:
+    """Years to a tenor given as a maturity code ('27JUN25') or a length ('30d', '3m', '1y')."""
+    match = TENOR.match(tenor.strip())
+    if match:
+        return float(match.group(1)) * TENOR_UNITS[match.group(2).lower()]
+    return year_fraction(tenor, now)
+
+
+def maturity_codes(result: Any) -> List[str]:
+    """Maturity codes listed by getoptionmaturities (as strings, or rows with a maturity key)."""
+    codes = []
+    for row in rows_of(result) or []:
+        code = row.get("maturity") if isinstance(row, dict) else row
+        if isinstance(code, str) and maturity_date(code.upper()) is not None:
+            codes.append(code.upper())
+    return list(dict.fromkeys(codes))
+
+
+def svi(params: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Raw SVI total variance a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2)); params (..., 5)."""
+    a, b, rho, m, sigma = (params[..., i] for i in range(5))
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def svi_density(params: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Gatheral's g(k); the smile is free of butterfly arbitrage where g >= 0."""
+    a, b, rho, m, sigma = (params[..., i] for i in range(5))
+    x = k - m
+    root = np.sqrt(x * x + sigma * sigma)
+    w = a + b * (rho * x + root)
+    w1 = b * (rho + x / root)
+    w2 = b * sigma * sigma / root ** 3
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (1 - k * w1 / (2 * w)) ** 2 - w1 * w1 / 4 * (1 / w + 0.25) + w2 / 2
+
+
+def fit_svi(k: np.ndarray, w: np.ndarray, rounds: int = 3) -> Tuple[np.ndarray, float]:
+    """Fit raw SVI to total variances; returns (a, b, rho, m, sigma) and the RMSE in w.
+
+    Quasi-explicit method: for fixed (m, sigma) the model is linear in the other three
+    parameters, so every (m, sigma) of a grid is solved at once as a batch of 3x3 least
+    squares, projected onto the constraints (|rho| < 1, b (1 + |rho|) <= 2 as Lee's
+    moment bound requires, non-negative minimum variance). The grid is then narrowed
+    around the best pair.
+    """
+    span = max(k.max() - k.min(), 0.05)
+    m_grid = np.linspace(k.min() - 0.25 * span, k.max() + 0.25 * span, 25)
+    s_grid = np.geomspace(1e-3, 2.0, 25)
+    best = None
+    for _ in range(rounds):
+        m, s = (g.ravel()[:, None] for g in np.meshgrid(m_grid, s_grid, indexing="ij"))
+        y = (k[None, :] - m) / s
+        root = np.sqrt(y * y + 1)
+        features = np.stack([np.ones_like(y), y, root], axis=-1)
+        normal = np.einsum("pni,pnj->pij", features, features) + 1e-12 * np.eye(3)
+        rhs = np.einsum("pni,n->pi", features, w)
+        c, d, e = np.moveaxis(np.linalg.solve(normal, rhs[..., None])[..., 0], -1, 0)
+        e = np.clip(e, 1e-10, None)
+        d = np.clip(d, -0.999 * e, 0.999 * e)
+        # b (1 + |rho|) <= 2, with b = e / sigma and rho = d / e
+        scale = np.minimum(1.0, 2 * s[:, 0] / (e + np.abs(d)))
+        e, d = e * scale, d * scale
+        c = np.mean(w[None, :] - d[:, None] * y - e[:, None] * root, axis=1)
+        c = np.maximum(c, -np.sqrt(e * e - d * d))
+        residual = c[:, None] + d[:, None] * y + e[:, None] * root - w[None, :]
+        sse = np.sum(residual * residual, axis=1)
+        i = int(np.argmin(sse))
+        if best is None or sse[i] < best[0]:
+            sigma = s[i, 0]
+            best = (sse[i], np.array([c[i], e[i] / sigma, d[i] / e[i], m[i, 0], sigma]))
+        step_m = m_grid[1] - m_grid[0]
+        m_grid = np.linspace(best[1][3] - 2 * step_m, best[1][3] + 2 * step_m, 25)
+        ratio = s_grid[1] / s_grid[0]
+        s_grid = np.geomspace(best[1][4] / ratio ** 2, best[1][4] * ratio ** 2, 25)
+    return best[1], float(np.sqrt(best[0] / k.size))
+
+
+def ssvi(theta: np.ndarray, k: np.ndarray, rho: Any, eta: Any, gamma: Any) -> np.ndarray:
+    """SSVI total variance with the power-law phi(theta) = eta / (theta^gamma (1 + theta)^(1 - gamma))."""
+    phi = eta / (theta ** gamma * (1 + theta) ** (1 - gamma))
+    x = phi * k
+    return theta / 2 * (1 + rho * x + np.sqrt((x + rho) ** 2 + 1 - rho * rho))
+
+
+def fit_ssvi(theta: np.ndarray, k: np.ndarray, w: np.ndarray, rounds: int = 3) -> Tuple[np.ndarray, float]:
+    """Fit SSVI's (rho, eta, gamma) to quotes (k, w) whose expiries have ATM variance theta.
+
+    A coarse grid search is narrowed around the best point each round. The grid is
+    limited to eta (1 + |rho|) <= 2 with gamma <= 1/2, which together with a non-decreasing
+    theta rules out butterfly and calendar arbitrage (Gatheral-Jacquier).
+    """
+    rho_grid, eta_grid, gamma_grid = np.linspace(-0.95, 0.95, 39), np.geomspace(0.02, 2.0, 30), np.linspace(0.1, 0.5, 5)
+    best = None
+    for _ in range(rounds):
+        rho, eta, gamma = (g.ravel() for g in np.meshgrid(rho_grid, eta_grid, gamma_grid, indexing="ij"))
+        keep = eta * (1 + np.abs(rho)) <= 2
+        rho, eta, gamma = rho[keep], eta[keep], gamma[keep]
+        model = ssvi(theta[None, :], k[None, :], rho[:, None], eta[:, None], gamma[:, None])
+        sse = np.sum((model - w[None, :]) ** 2, axis=1)
+        i = int(np.argmin(sse))
+        if best is None or sse[i] < best[0]:
+            best = (sse[i], np.array([rho[i], eta[i], gamma[i]]))
+        r, e, g = best[1]
+        step_r, ratio, step_g = rho_grid[1] - rho_grid[0], eta_grid[1] / eta_grid[0], gamma_grid[1] - gamma_grid[0]
+        rho_grid = np.clip(np.linspace(r - 2 * step_r, r + 2 * step_r, 21), -0.999, 0.999)
+        eta_grid = np.geomspace(e / ratio ** 2, e * ratio ** 2, 21)
+        gamma_grid = np.clip(np.linspace(g - 2 * step_g, g + 2 * step_g, 9), 1e-3, 0.5)
+    return best[1], float(np.sqrt(best[0] / k.size))
+
+
+class Surface:
+    """A fitted surface: one SVI slice per expiry plus a global SSVI fit.
+
+    slices are (maturity, years, forward, strikes, ivs) with ivs in percent; expiries with
+    fewer than MIN_POINTS quotes are left out.
+    """
+
+    def __init__(self, slices: List[Tuple[str, float, float, List[float], List[float]]], built_at: Optional[float] = None):
+        usable = []
+        for maturity, t, forward, strikes, ivs in sorted(slices, key=lambda s: s[1]):
+            strikes, ivs = np.asarray(strikes, dtype=float), np.asarray(ivs, dtype=float)
+            ok = (strikes > 0) & (ivs > 0) & np.isfinite(ivs)
+            if t > 0 and forward > 0 and ok.sum() >= MIN_POINTS:
+                usable.append((maturity, t, forward, strikes[ok], ivs[ok]))
+        if not usable:
+            raise ValueError(f"no expiry has {MIN_POINTS} or more quotes to fit")
+        self.built_at = built_at or time.time()
+        self.maturities = [s[0] for s in usable]
+        self.years = np.array([s[1] for s in usable])
+        self.forwards = np.array([s[2] for s in usable])
+        self.params = np.empty((len(usable), 5))
+        self.rmse = np.empty(len(usable))
+        self.points = [len(s[3]) for s in usable]
+        all_k, all_w, all_i = [], [], []
+        for i, (_, t, forward, strikes, ivs) in enumerate(usable):
+            k = np.log(strikes / forward)
+            w = (ivs / 100) ** 2 * t
+            self.params[i], _ = fit_svi(k, w)
+            self.rmse[i] = float(np.sqrt(np.mean((np.sqrt(svi(self.params[i], k) / t) * 100 - ivs) ** 2)))
+            all_k.append(k)
+            all_w.append(w)
+            all_i.append(np.full(k.size, i))
+        # ATM total variance per expiry, made non-decreasing for SSVI
+        self.theta = np.maximum.accumulate(np.maximum(svi(self.params, np.zeros(len(usable))), 1e-8))
+        k, w, index = np.concatenate(all_k), np.concatenate(all_w), np.concatenate(all_i)
+        self.ssvi_params, _ = fit_ssvi(self.theta[index], k, w)
+        model = ssvi(self.theta[index], k, *self.ssvi_params)
+        self.ssvi_rmse = float(np.sqrt(np.mean((np.sqrt(model / self.years[index]) - np.sqrt(w / self.years[index])) ** 2)) * 100)
+        self.butterfly_ok = [bool(np.all(svi_density(p, CHECK_K) >= -1e-9)) for p in self.params]
+        grid = svi(self.params[:, None, :], CHECK_K[None, :])
+        self.calendar_ok = bool(np.all(np.diff(grid, axis=0) >= -1e-9))
+
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+    def forward(self, t: np.ndarray) -> np.ndarray:
+        return np.interp(t, self.years, self.forwards)
+
+    def iv(self, strikes: Any, tenors: Any, model: str = "svi") -> np.ndarray:
+        """IVs in percent on a (tenors, strikes) grid; tenors in years.
+
+        svi interpolates total variance linearly in time between the fitted slices at the
+        same log-moneyness (scaling the nearest slice before the first or after the last
+        expiry); ssvi evaluates the global fit with its ATM variance interpolated likewise.
+        """
+        t = np.asarray(tenors, dtype=float)[:, None]
+        if np.any(t <= 0):
+            raise ValueError("tenors must be in the future")
+        k = np.log(np.asarray(strikes, dtype=float)[None, :] / self.forward(t))
+        if model == "ssvi":
+            theta = np.interp(t, np.concatenate([[0.0], self.years]), np.concatenate([[0.0], self.theta]))
+            beyond = t > self.years[-1]
+            theta = np.where(beyond, self.theta[-1] * t / self.years[-1], theta)
+            w = ssvi(np.maximum(theta, 1e-12), k, *self.ssvi_params)
+        elif model == "svi":
+            j = np.clip(np.searchsorted(self.years, t[:, 0]) - 1, 0, len(self.years) - 2)[:, None] if len(self.years) > 1 else np.zeros((t.shape[0], 1), dtype=int)
+            lower = svi(self.params[j], k)
+            if len(self.years) > 1:
+                upper = svi(self.params[j + 1], k)
+                t0, t1 = self.years[j], self.years[j + 1]
+                w = lower + (t - t0) / (t1 - t0) * (upper - lower)
+                w = np.where(t < self.years[0], svi(self.params[0], k) * t / self.years[0], w)
+                w = np.where(t > self.years[-1], svi(self.params[-1], k) * t / self.years[-1], w)
+            else:
+                w = lower * t / self.years[0]
+        else:
+            raise ValueError(f"unknown model '{model}', expected 'svi' or 'ssvi'")
+        return np.sqrt(np.maximum(w, 0) / t) * 100
+
+    def summary(self) -> Dict[str, Any]:
+        names = ("a", "b", "rho", "m", "sigma")
+        return {
+            "built_at": datetime.fromtimestamp(self.built_at, tz=timezone.utc).isoformat(timespec="seconds"),
+            "age_seconds": round(self.age(), 1),
+            "calendar_ok": self.calendar_ok,
+            "slices": [
+                {
+                    "maturity": self.maturities[i],
+                    "years": round(float(self.years[i]), 6),
+                    "forward": float(self.forwards[i]),
+                    "atm_iv": round(float(np.sqrt(svi(self.params[i], 0.0) / self.years[i]) * 100), 4),
+                    **{name: float(value) for name, value in zip(names, self.params[i])},
+                    "points": self.points[i],
+                    "rmse_iv": round(float(self.rmse[i]), 4),
+                    "butterfly_ok": self.butterfly_ok[i],
+                }
+                for i in range(len(self.maturities))
+            ],
+            "ssvi": {
+                **{name: float(value) for name, value in zip(("rho", "eta", "gamma"), self.ssvi_params)},
+                "rmse_iv": round(self.ssvi_rmse, 4),
+            },
+        }
+
+
+class SurfaceCache:
+    """Fitted surfaces by (market, currency), each kept for `ttl` seconds."""
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._surfaces: Dict[Tuple[str, str], Surface] = {}
+        self.counters = {"hits": 0, "builds": 0, "build_seconds": 0.0}
+
+    def get(self, key: Tuple[str, str]) -> Optional[Surface]:
+        surface = self._surfaces.get(key)
+        if surface is None or surface.age() > self.ttl:
+            return None
+        self.counters["hits"] += 1
+        return surface
+
+    def set(self, key: Tuple[str, str], surface: Surface, seconds: float):
+        self._surfaces[key] = surface
+        self.counters["builds"] += 1
+        self.counters["build_seconds"] += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ttl": self.ttl,
+            "surfaces": len(self._surfaces),
+            **self.counters,
+            "build_seconds": round(self.counters["build_seconds"], 4),
+        }
@@ -0,0 +1,196 @@
+"""
+Client-side rate limiting for the Laevitas MCP Server
+"""
+
+import time
+import asyncio
+from typing import Dict, Any, AsyncIterator, Callable, Awaitable
+import httpx
+
+
+def is_overload(status_code: int) -> bool:
+    """Responses that mean the API wants less traffic: 429 and 5xx."""
+    return status_code == 429 or status_code >= 500
+
+
+class TokenBucket:
+    """Allow `rate` requests per second on average, with bursts of up to `burst`.
+
+    Callers that find the bucket empty wait in arrival order for the next token.
+    A rate of 0 or less disables the bucket.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.counters = {"acquired": 0, "delayed": 0, "wait_seconds": 0.0}
+
+    async def acquire(self):
+        if self.rate <= 0:
+            self.counters["acquired"] += 1
+            return
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.rate
+                self.counters["delayed"] += 1
+                self.counters["wait_seconds"] += wait
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+            self.counters["acquired"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        if self.rate > 0:
+            self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self.tokens, 2),
+            **self.counters,
+            "wait_seconds": round(self.counters["wait_seconds"], 3),
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class AdaptiveLimiter:
+    """AIMD limit on the number of requests in flight.
+
+    Each successful response raises the limit by 1/limit (about +1 per round of
+    requests); an overload response multiplies it by `backoff`. Overloads arriving
+    within `cooldown` seconds of the last decrease count as the same event, so a burst
+    of 429s from requests already in flight halves the limit once, not once per request.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.waiting = 0
+        self._last_decrease = float("-inf")
+        self._cond = asyncio.Condition()
+        self.counters = {"queued": 0, "increases": 0, "decreases": 0, "peak_in_flight": 0}
+
+    async def acquire(self):
+        async with self._cond:
+            if self.in_flight >= int(self.limit):
+                self.counters["queued"] += 1
+                self.waiting += 1
+                try:
+                    await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+                finally:
+                    self.waiting -= 1
+            self.in_flight += 1
+            self.counters["peak_in_flight"] = max(self.counters["peak_in_flight"], self.in_flight)
+
+    async def release(self):
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self):
+        if self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.counters["increases"] += 1
+
+    def on_overload(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self.counters["decreases"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            **self.counters,
+        }
+
+
+class HeldSlot(httpx.AsyncByteStream):
+    """A streamed response body that holds its request's concurrency slot until it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, limiter: AdaptiveLimiter):
+        self._stream = stream
+        self._limiter = limiter
+        self._held = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._held:
+                self._held = False
+                await self._limiter.release()
+
+
+class Throttle:
+    """Send requests through a token bucket and an adaptive concurrency limit.
+
+    The limiter learns from each response: 429, 5xx and timeouts shrink it, anything
+    else grows it.
+    """
+
+    def __init__(self, bucket: TokenBucket, limiter: AdaptiveLimiter):
+        self.bucket = bucket
+        self.limiter = limiter
+        self.counters = {"sent": 0, "rate_limited": 0, "server_errors": 0, "timeouts": 0}
+
+    async def send(self, call: Callable[[], Awaitable[httpx.Response]], stream: bool = False) -> httpx.Response:
+        """Send call() once a slot and a token are free.
+
+        With stream, call() returns a response whose body is still to be read; the slot
+        is then held until the response is closed, so large bodies count against the limit.
+        """
+        await self.limiter.acquire()
+        held = False
+        try:
+            await self.bucket.acquire()
+            self.counters["sent"] += 1
+            try:
+                response = await call()
+            except httpx.TimeoutException:
+                self.counters["timeouts"] += 1
+                self.limiter.on_overload()
+                raise
+            if is_overload(response.status_code):
+                self.counters["rate_limited" if response.status_code == 429 else "server_errors"] += 1
+                self.limiter.on_overload()
+            else:
+                self.limiter.on_success()
+            if stream and not response.is_closed:
+                response.stream = HeldSlot(response.stream, self.limiter)
+                held = True
+            return response
+        finally:
+            if not held:
+                await self.limiter.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "bucket": self.bucket.stats(), "concurrency": self.limiter.stats()}
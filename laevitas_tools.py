@@ -0,0 +1,251 @@
+"""
+Tool registry for the Laevitas MCP Server
+
+Builds one MCP tool per endpoint in laevitas_catalog.json. Tool names, curated
+docstrings, required query parameters and integer query parameters come from
+laevitas_tools.json, keyed by endpoint path; endpoints missing from it get a name
+derived from the catalog methodName and a docstring generated from the catalog
+description.
+"""
+
+import os
+import re
+import json
+import inspect
+import functools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Tuple, Type
+from pydantic import BaseModel, ConfigDict, create_model
+from laevitas_catalog import get_catalog
+
+TOOLS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "laevitas_tools.json")
+
+PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+# Central options appended to the tools of paginated endpoints: (name, annotation, default)
+PAGINATED_OPTIONS = [
+    ("fetch_all", bool, False),
+]
+
+PAGINATED_OPTIONS_DOC = """
+Pagination options:
+- fetch_all: Fetch every page concurrently and merge the items into one response"""
+
+# Appended to the tools of paginated endpoints taking a start/end range
+RANGE_OPTIONS = [
+    ("split_range", bool, False),
+    ("since_last", bool, False),
+]
+
+RANGE_OPTIONS_DOC = """- split_range: Split start..end into aligned windows of one page each at the granularity
+  (default 1h), fetch them concurrently and return one series ordered by date. With the local
+  store enabled, only the parts of the range not fetched before are requested
+- since_last: Return only rows dated after the latest row returned by the previous since_last call
+  with the same arguments (apart from start/end), oldest first; only the tail is fetched. max_rows
+  cuts between dates, so rows sharing a date come in the same call"""
+
+# Appended to the tools of endpoints taking a market path parameter
+MARKET_OPTIONS = [
+    ("all_markets", bool, False),
+]
+
+MARKET_OPTIONS_DOC = """
+Market options:
+- all_markets: Call every market listed for the endpoint (and, for options, the currency) at once,
+  instead of the one given as market, and return their rows in one table with a market column.
+  Markets that fail or are slow are reported under markets and left out; output options apply
+  to the merged rows"""
+
+# Appended to the tools of historical option trade endpoints
+TRADE_OPTIONS = [
+    ("implied_vol", bool, False),
+]
+
+TRADE_OPTIONS_DOC = """
+Trade options:
+- implied_vol: Add iv (percent) to each trade, solved locally (Black-76) from its price, with
+  index_price as the forward and the time from the trade's date to the 08:00 UTC expiry;
+  where and sort_by can use iv"""
+
+# Central options appended to every tool
+OUTPUT_OPTIONS = [
+    ("max_rows", Optional[int], None),
+    ("format", Optional[str], None),
+    ("fields", Optional[List[str]], None),
+    ("where", Optional[List[str]], None),
+    ("sort_by", Optional[str], None),
+    ("top_n", Optional[int], None),
+]
+
+OUTPUT_OPTIONS_DOC = """
+Output options:
+- max_rows: Return at most this many rows; large responses are decoded as they stream in and the
+  download stops there (with fetch_all, no further pages are fetched)
+- format: Output layout, 'rows' (default) or 'columnar' ({columns, data: {column: [values]}})
+- fields: Keys to keep, e.g. ["date", "items.open_interest"]; names that are not top-level keys
+  select fields of each row, so ["strike", "iv"] keeps just those row fields
+- where: Row filters that must all hold: '<field> <op> <value>' with op one of = != > >= < <=
+  between, in, not in, contains, e.g. ["strike between 90000 and 110000", "maturity in 27JUN25,26SEP25"]
+- sort_by: Row field to sort on, largest first; append ' asc' for smallest first
+- top_n: Keep only the first n rows (after where and sort_by), e.g. top_n=10, sort_by='open_interest'"""
+
+
+@dataclass
+class EndpointSpec:
+    """Everything needed to serve one catalog endpoint, computed once at startup."""
+
+    name: str
+    path: str
+    path_params: Tuple[str, ...]
+    query_params: Tuple[str, ...]
+    options: Tuple[str, ...]
+    doc: str
+    signature: inspect.Signature
+    markets: Tuple[str, ...] = ()
+
+    def format_path(self, args: Dict[str, Any]) -> str:
+        return self.path.format_map(args)
+
+    def query(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: args[name] for name in self.query_params if args.get(name) is not None}
+
+    @functools.cached_property
+    def arguments(self) -> Type[BaseModel]:
+        """Model validating and coercing the tool's arguments as for a direct call; unknown ones are rejected."""
+        fields = {
+            p.name: (p.annotation, ... if p.default is inspect.Parameter.empty else p.default)
+            for p in self.signature.parameters.values()
+        }
+        return create_model(f"{self.name}_arguments", __config__=ConfigDict(extra="forbid"), **fields)
+
+
+def tool_name(method_name: str) -> str:
+    name = method_name.lower()
+    return name if name.startswith("get") else f"get_{name}"
+
+
+def example_values(values: Any) -> List[Any]:
+    """Unique catalog example values, in catalog order."""
+    if not isinstance(values, list):
+        return []
+    return list(dict.fromkeys(values))
+
+
+def generated_doc(api: Dict[str, Any], path_params: List[str], query_params: List[str]) -> str:
+    lines = [api.get("description", "").strip() or api["path"], "", "Path parameters:"]
+    for name in path_params:
+        values = example_values((api.get("path_params") or {}).get(name))
+        lines.append(f"{name}: {values}" if 0 < len(values) <= 12 else f"{name}: e.g. {values[:3]}")
+    lines += ["", "Query parameters:"]
+    for name in query_params:
+        values = example_values(api["query_params"][name])
+        lines.append(f"{name}: e.g. {values}" if values else name)
+    return "\n".join(lines)
+
+
+def build_spec(api: Dict[str, Any], override: Dict[str, Any]) -> EndpointSpec:
+    path = api["path"]
+    in_template = PATH_PARAM.findall(path)
+    # Catalog order is the order the original tools took their arguments in
+    path_params = [p for p in (api.get("path_params") or {}) if p in in_template]
+    path_params += [p for p in in_template if p not in path_params]
+    query_params = list(api.get("query_params") or {})
+    required = override.get("required", [])
+    # The catalog's own spelling (e.g. DERIBIT on historical endpoints) is what all_markets requests
+    markets = tuple(dict.fromkeys(str(m) for m in (api.get("path_params") or {}).get("market") or []))
+    fan_out = "market" in path_params and len(markets) > 1
+
+    # With all_markets available, market may be left out
+    parameters = [
+        inspect.Parameter(p, inspect.Parameter.KEYWORD_ONLY, annotation=Optional[str], default=None)
+        if fan_out and p == "market"
+        else inspect.Parameter(p, inspect.Parameter.KEYWORD_ONLY, annotation=str)
+        for p in path_params
+    ]
+    parameters += [
+        inspect.Parameter(q, inspect.Parameter.KEYWORD_ONLY, annotation=str) for q in query_params if q in required
+    ]
+    # Optional query parameters are strings, as the original tools took them, unless listed in int_params
+    int_params = override.get("int_params", [])
+    parameters += [
+        inspect.Parameter(q, inspect.Parameter.KEYWORD_ONLY, annotation=Optional[int] if q in int_params else Optional[str], default=None)
+        for q in query_params
+        if q not in required
+    ]
+
+    doc = override.get("doc") or generated_doc(api, path_params, query_params)
+    paginated = "page" in query_params
+    ranged = paginated and "start" in query_params and "end" in query_params
+    trades = path.startswith("/historical/options/") and "/trades/" in path
+    option_specs = (
+        (PAGINATED_OPTIONS if paginated else [])
+        + (RANGE_OPTIONS if ranged else [])
+        + (MARKET_OPTIONS if fan_out else [])
+        + (TRADE_OPTIONS if trades else [])
+        + OUTPUT_OPTIONS
+    )
+    options = [name for name, _, _ in option_specs]
+    parameters += [
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation, default=default)
+        for name, annotation, default in option_specs
+    ]
+    if paginated:
+        doc += "\n" + PAGINATED_OPTIONS_DOC
+    if ranged:
+        doc += "\n" + RANGE_OPTIONS_DOC
+    if fan_out:
+        doc += "\n" + MARKET_OPTIONS_DOC
+    if trades:
+        doc += "\n" + TRADE_OPTIONS_DOC
+    doc += "\n" + OUTPUT_OPTIONS_DOC
+
+    return EndpointSpec(
+        name=override.get("name") or tool_name(api["methodName"]),
+        path=path,
+        path_params=tuple(path_params),
+        query_params=tuple(query_params),
+        options=tuple(options),
+        doc=doc,
+        signature=inspect.Signature(parameters, return_annotation=str),
+        markets=markets if fan_out else (),
+    )
+
+
+def load_specs(tools_path: str = TOOLS_PATH) -> List[EndpointSpec]:
+    """Build the endpoint specs for every catalog endpoint not marked skip in laevitas_tools.json."""
+    with open(tools_path) as f:
+        overrides = json.load(f)
+    specs = []
+    for api in get_catalog().api_list:
+        override = overrides.get(api["path"], {})
+        if override.get("skip"):
+            continue
+        specs.append(build_spec(api, override))
+    return specs
+
+
+def make_tool(spec: EndpointSpec, handler: Callable[[EndpointSpec, Dict[str, Any]], Awaitable[str]]):
+    """Create the coroutine function FastMCP registers for an endpoint."""
+
+    async def tool(**kwargs: Any) -> str:
+        return await handler(spec, kwargs)
+
+    tool.__name__ = spec.name
+    tool.__qualname__ = spec.name
+    tool.__doc__ = spec.doc
+    tool.__signature__ = spec.signature
+    tool.spec = spec
+    return tool
+
+
+def register_tools(mcp, handler: Callable[[EndpointSpec, Dict[str, Any]], Awaitable[str]]) -> Dict[str, Callable[..., Awaitable[str]]]:
+    """Register one tool per catalog endpoint on the FastMCP server; returns the tool functions by name.
+
+    Each function's spec attribute holds its EndpointSpec.
+    """
+    tools = {}
+    for spec in load_specs():
+        tool = make_tool(spec, handler)
+        mcp.add_tool(tool, name=spec.name, description=spec.doc)
+        tools[spec.name] = tool
+    return tools
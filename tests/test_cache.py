@@ -0,0 +1,144 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import pytest
+import laevitas_cache
+from laevitas_cache import ResponseCache, SingleFlight, parse_range_end
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(laevitas_cache, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.mark.parametrize("method, endpoint, params, ttl", [
+    ("GET", "/analytics/options/oi_strike_all/deribit/BTC", {}, 15.0),
+    ("GET", "/historical/options/trades/deribit/BTC", {"end": "2025-01-02"}, None),
+    ("GET", "/V2/historical/futures/ohlcv/binance/BTCUSDT", {"end": "2025-01-02T10:15"}, None),
+    ("GET", "/historical/options/trades/deribit/BTC", {}, 60.0),
+    ("GET", "/pricer/v2/risk_slide_instruments/deribit", {}, 21600.0),
+    ("GET", "/pricer/v2/calculate_option_price", {}, 0),
+    ("POST", "/analytics/options/oi_strike_all/deribit/BTC", {}, 0),
+])
+def test_ttl_by_path_family(method, endpoint, params, ttl):
+    assert ResponseCache().ttl_for(method, endpoint, params) == ttl
+
+
+def test_open_historical_range_expires():
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    assert ResponseCache().ttl_for("GET", "/historical/options/trades/deribit/BTC", {"end": today}) == 60.0
+
+
+@pytest.mark.parametrize("params, end", [
+    ({"end": "2025-05-19"}, datetime(2025, 5, 20, tzinfo=timezone.utc)),
+    ({"date_h": "2025-05-04T14"}, datetime(2025, 5, 4, 15, tzinfo=timezone.utc)),
+    ({"end": "2025-05-19T10:15"}, datetime(2025, 5, 19, 10, 15, tzinfo=timezone.utc)),
+    ({"end": "1747649700000"}, datetime(2025, 5, 19, 10, 15, tzinfo=timezone.utc)),
+    ({"start": "2025-05-19"}, None),
+])
+def test_range_end(params, end):
+    assert parse_range_end(params) == end
+
+
+def test_entries_expire(clock):
+    cache = ResponseCache()
+    cache.set("a", b"1", 15.0)
+    clock[0] += 14
+    assert cache.get("a") == b"1"
+    clock[0] += 2
+    assert cache.get("a") is None
+    assert cache.counters["expirations"] == 1
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1", None)
+    cache.set("b", b"2", None)
+    cache.get("a")
+    cache.set("c", b"3", None)
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+
+def test_disk_tier_promotes_to_memory(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    ResponseCache(disk_path=path).set("a", b"body", None)
+    cache = ResponseCache(disk_path=path)
+    assert cache.get("a") == b"body"
+    assert cache.get("a") == b"body"
+    assert (cache.counters["disk_hits"], cache.counters["memory_hits"]) == (1, 1)
+
+
+def test_short_ttls_stay_in_memory(tmp_path):
+    path = str(tmp_path / "responses.sqlite")
+    ResponseCache(disk_path=path).set("a", b"body", 15.0)
+    assert ResponseCache(disk_path=path).get("a") is None
+
+
+def test_disk_tier_is_capped(tmp_path, clock):
+    path = str(tmp_path / "responses.sqlite")
+    cache = ResponseCache(max_entries=0, disk_path=path, disk_max_bytes=10)
+    cache.set("expired", b"xxx", 300.0)
+    cache.set("old", b"xxxx", None)
+    cache.set("new", b"xxxx", None)
+    clock[0] += 301
+    cache.set("newest", b"xxxx", None)
+    assert cache.get("expired") is None and cache.get("old") is None
+    assert cache.get("new") == b"xxxx" and cache.get("newest") == b"xxxx"
+    assert cache.stats()["disk_bytes"] == 8
+    assert ResponseCache(disk_path=path).stats()["disk_bytes"] == 8
+
+
+def test_single_flight_shares_one_call():
+    async def run():
+        flight, calls = SingleFlight(), []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return b"body"
+
+        bodies = await asyncio.gather(*[flight.do("a", call) for _ in range(10)])
+        return bodies, calls, flight.stats()
+
+    bodies, calls, stats = asyncio.run(run())
+    assert bodies == [b"body"] * 10
+    assert len(calls) == 1
+    assert stats == {"leaders": 1, "coalesced": 9, "in_flight": 0}
+
+
+def test_single_flight_survives_a_cancelled_waiter():
+    async def run():
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return b"body"
+
+        first = asyncio.ensure_future(flight.do("a", call))
+        second = asyncio.ensure_future(flight.do("a", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == b"body"
+
+
+def test_single_flight_shares_errors_then_forgets_them():
+    async def run():
+        flight, calls = SingleFlight(), []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream")
+
+        results = await asyncio.gather(*[flight.do("a", call) for _ in range(3)], return_exceptions=True)
+        await asyncio.gather(flight.do("a", call), return_exceptions=True)
+        return results, calls
+
+    results, calls = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 2
@@ -0,0 +1,121 @@
+import os
+import json
+import pytest
+from laevitas_catalog import Catalog, get_catalog, load_catalog
+
+ARGS = {"market": "deribit", "currency": "BTC", "maturity": "31DEC21"}
+
+
+@pytest.mark.parametrize("path", [
+    "/analytics/options/expired_expiries/{market}/{currency}",
+    "/analytics/derivs/futures/{market}/{currency}/{maturity}",
+    "/historical/options/oi_strike/{market}/{currency}/{maturity}",
+])
+def test_expired_maturity_accepted(path):
+    assert get_catalog().check_params(path, ARGS) is None
+
+
+def test_expired_option_maturity_rejected():
+    error = get_catalog().check_params("/analytics/options/oi_strike/{market}/{currency}/{maturity}", ARGS)
+    assert error and "has already expired" in error
+
+
+def catalog_data(strikes=(90000, 100000, 110000, 120000, 95000)):
+    return {
+        "params": {
+            "maturities": {"data": {"Deribit": {"btc": ["26DEC25", "27JUN25", "26SEP25", "27JUN25"]}, "bybit": {}}},
+            "strikes": {"data": {"deribit": {"BTC": list(strikes), "ETH": [3000]}}},
+            "currency": {"data": ["btc", "eth"]},
+        },
+        "api_list": [
+            {"path": "/analytics/options/oi_expiry/{market}/{currency}",
+             "path_params": {"market": ["deribit", "okx", "aggregate"], "currency": ["BTC", "SOL"]}},
+            {"path": "/historical/futures/ohlcv/{market}", "path_params": {"market": ["DERIBIT", "BINANCE"]}},
+        ],
+    }
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(catalog_data()))
+    return str(path), str(tmp_path / "catalog.pickle")
+
+
+def test_snapshot_reused_while_source_unchanged(catalog_file):
+    path, snapshot = catalog_file
+    assert load_catalog(path, snapshot).source == "json"
+    assert os.path.exists(snapshot)
+    catalog = load_catalog(path, snapshot)
+    assert catalog.source == "snapshot"
+    assert catalog.strikes("deribit", "btc") == (90000, 95000, 100000, 110000, 120000)
+
+
+def test_snapshot_rebuilt_when_source_size_changes(catalog_file):
+    path, snapshot = catalog_file
+    load_catalog(path, snapshot)
+    stat = os.stat(path)
+    with open(path, "w") as f:
+        json.dump(catalog_data(strikes=(80000, 100000)), f)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    catalog = load_catalog(path, snapshot)
+    assert catalog.source == "json"
+    assert catalog.strikes("deribit", "BTC") == (80000, 100000)
+    assert load_catalog(path, snapshot).source == "snapshot"
+
+
+def test_snapshot_rebuilt_when_source_mtime_changes(catalog_file):
+    path, snapshot = catalog_file
+    load_catalog(path, snapshot)
+    # Same size, new contents
+    text = open(path).read().replace("120000", "130000")
+    stat = os.stat(path)
+    with open(path, "w") as f:
+        f.write(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    catalog = load_catalog(path, snapshot)
+    assert catalog.source == "json"
+    assert catalog.strikes("deribit", "BTC")[-1] == 130000
+
+
+def test_unreadable_snapshot_rebuilt(catalog_file):
+    path, snapshot = catalog_file
+    with open(snapshot, "wb") as f:
+        f.write(b"not a pickle")
+    assert load_catalog(path, snapshot).source == "json"
+    assert load_catalog(path, snapshot).source == "snapshot"
+
+
+def test_indexes():
+    catalog = Catalog.from_json(catalog_data())
+    assert catalog.maturities("DERIBIT", "btc") == ("27JUN25", "26SEP25", "26DEC25")
+    assert catalog.has_maturity("deribit", "BTC", "26sep25") and not catalog.has_maturity("deribit", "BTC", "28MAR25")
+    assert catalog.option_markets() == ["deribit"]
+    assert catalog.option_currencies("Deribit") == ["BTC", "ETH"]
+    assert catalog.has_strike("deribit", "BTC", 95000.0) and not catalog.has_strike("deribit", "BTC", 96000)
+    assert catalog.markets == {"deribit", "okx", "aggregate", "binance"}
+    assert catalog.currencies == {"BTC", "ETH", "SOL"}
+    assert catalog.is_currency("sol") and not catalog.is_currency("DOGE")
+
+
+@pytest.mark.parametrize("strike, count, nearest", [
+    (101000, 3, [95000, 100000, 110000]),
+    (100000, 1, [100000]),
+    (1, 2, [90000, 95000]),
+    (10**6, 2, [110000, 120000]),
+    (100000, 10, [90000, 95000, 100000, 110000, 120000]),
+])
+def test_nearest_strikes(strike, count, nearest):
+    assert Catalog.from_json(catalog_data()).nearest_strikes("deribit", "BTC", strike, count) == nearest
+
+
+def test_nearest_strikes_of_unlisted_currency():
+    assert Catalog.from_json(catalog_data()).nearest_strikes("deribit", "SOL", 100) == []
+
+
+def test_venues_skip_aggregates_and_unlisted_option_currencies():
+    catalog = Catalog.from_json(catalog_data())
+    path = "/analytics/options/oi_expiry/{market}/{currency}"
+    # okx has no option listings indexed, so it is kept
+    assert catalog.venues(path, ("deribit", "okx", "aggregate"), "BTC") == ["deribit", "okx"]
+    assert catalog.venues(path, ("DERIBIT", "OKX"), "SOL") == ["OKX"]
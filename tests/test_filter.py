@@ -0,0 +1,115 @@
+import random
+import pytest
+from laevitas_filter import apply_query, compile_predicate, query_rows
+
+ROWS = [
+    {"id": 1, "strike": 90000, "maturity": "27JUN25", "type": "C", "greeks": {"delta": 0.7}},
+    {"id": 2, "strike": "100000", "maturity": "26SEP25", "type": "P", "greeks": {"delta": -0.4}},
+    {"id": 3, "strike": 110000.0, "maturity": "26DEC25", "type": "c"},
+    {"id": 4, "maturity": "BTC-27JUN25-call", "type": None},
+]
+
+
+def matching(predicate):
+    test = compile_predicate(predicate)
+    return [row["id"] for row in ROWS if test(row)]
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("strike = 100000", [2]),
+    ("strike == 1e5", [2]),
+    ("type = c", [1, 3]),
+    ("type != 'C'", [2, 4]),
+    ("greeks.delta = -0.4", [2]),
+])
+def test_equality(predicate, ids):
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("strike > 90000", [2, 3]),
+    ("strike >= 100000", [2, 3]),
+    ("strike < 100000", [1]),
+    ("strike <= 100000", [1, 2]),
+    ("greeks.delta > 0", [1]),
+])
+def test_numeric_comparison(predicate, ids):
+    # Numbers given as text compare as numbers; rows without the field never match
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("strike between 95000 and 110000", [2, 3]),
+    ("strike between 110000, 95000", [2, 3]),
+    ("strike BETWEEN [90000 100000]", [1, 2]),
+])
+def test_between(predicate, ids):
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("maturity in 27JUN25,26sep25", [1, 2]),
+    ("maturity in ['27JUN25', '26DEC25']", [1, 3]),
+    ("strike in 90000 110000", [1, 3]),
+])
+def test_in(predicate, ids):
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("maturity not in 27JUN25,26SEP25", [3, 4]),
+    ("type NOT  IN (p)", [1, 3, 4]),
+])
+def test_not_in(predicate, ids):
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate, ids", [
+    ("maturity contains jun25", [1, 4]),
+    ("maturity contains 'CALL'", [4]),
+    ("strike contains 000", [1, 2, 3]),
+])
+def test_contains(predicate, ids):
+    assert matching(predicate) == ids
+
+
+@pytest.mark.parametrize("predicate", ["strike", "strike ~ 1", "strike > high", "strike between 1", "type in ()"])
+def test_invalid_predicates(predicate):
+    with pytest.raises(ValueError):
+        compile_predicate(predicate)
+
+
+def test_where_predicates_all_hold():
+    assert [row["id"] for row in query_rows(ROWS, ("strike > 0", "type = c"))] == [1, 3]
+
+
+@pytest.mark.parametrize("sort_by, ids", [
+    ("strike", [3, 2, 1, 4]),
+    ("strike asc", [1, 2, 3, 4]),
+    ("maturity ASC", [3, 2, 1, 4]),
+    ("maturity desc", [4, 1, 2, 3]),
+    ("type asc", [1, 2, 3, 4]),
+    ("type desc", [3, 2, 1, 4]),
+    ("greeks.delta asc", [2, 1, 3, 4]),
+])
+def test_sort_puts_missing_values_last(sort_by, ids):
+    assert [row["id"] for row in query_rows(ROWS, sort_by=sort_by)] == ids
+
+
+@pytest.mark.parametrize("sort_by", ["v", "v asc", "name", "name desc"])
+@pytest.mark.parametrize("top_n", [0, 1, 7, 200])
+def test_top_n_matches_a_full_sort(sort_by, top_n):
+    rng = random.Random(7)
+    rows = [{"v": rng.randint(0, 20), "name": rng.choice("abcde")} for _ in range(100)]
+    rows += [{"v": None}, {}]
+    assert query_rows(rows, sort_by=sort_by, top_n=top_n) == query_rows(rows, sort_by=sort_by)[:top_n]
+
+
+def test_top_n_without_sort_keeps_row_order():
+    assert query_rows(ROWS, top_n=2) == ROWS[:2]
+
+
+def test_apply_query_to_wrapped_rows():
+    result = apply_query({"meta": {}, "data": ROWS}, ("type in c,p",), "strike asc", 2)
+    assert [row["id"] for row in result["data"]] == [1, 2]
+    assert apply_query("Error: x", ("a = 1",)) == "Error: x"
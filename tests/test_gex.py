@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from laevitas_gex import oi_points, oi_grid, gex_profile, zero_crossings, zero_gamma, price_grid
+
+
+def profile(call_oi, put_oi, strikes=(90.0, 110.0), vol=50.0, t=0.25, points=401):
+    strikes = np.array(strikes)
+    prices = price_grid(100.0, 70.0, 130.0, points)
+    vols = np.full((1, strikes.size), vol)
+    result = gex_profile(prices, 100.0, np.array([100.0]), np.array([t]), strikes, vols, np.array([call_oi]), np.array([put_oi]))
+    return prices, result
+
+
+def test_oi_points_row_shapes():
+    rows = [
+        {"instrument": "BTC-27JUN25-100000-C", "open_interest": 12},
+        {"strike": 90000, "maturity": "27jun25", "option_type": "put", "oi": "3.5"},
+        {"strike": 110000, "call_oi": 4, "put_oi": None},
+        {"strike": "n/a", "call_oi": 1},
+        "not a row",
+    ]
+    assert oi_points(rows) == [
+        ("27JUN25", 100000.0, True, 12.0),
+        ("27JUN25", 90000.0, False, 3.5),
+        (None, 110000.0, True, 4.0),
+        (None, 110000.0, False, 0.0),
+    ]
+
+
+def test_oi_grid_sums_points():
+    maturities, strikes, call_oi, put_oi = oi_grid([
+        ("26DEC31", 100.0, True, 1.0),
+        ("26DEC31", 100.0, True, 2.0),
+        ("25JUN32", 90.0, False, 5.0),
+    ])
+    assert maturities == ["26DEC31", "25JUN32"]
+    assert strikes.tolist() == [90.0, 100.0]
+    assert call_oi.tolist() == [[0.0, 3.0], [0.0, 0.0]]
+    assert put_oi.tolist() == [[0.0, 0.0], [5.0, 0.0]]
+
+
+def test_calls_add_and_puts_subtract_gamma():
+    _, calls = profile([1.0, 1.0], [0.0, 0.0])
+    _, puts = profile([0.0, 0.0], [1.0, 1.0])
+    assert (calls["gex"] > 0).all() and (calls["put_gex"] == 0).all()
+    assert (puts["gex"] < 0).all() and (puts["call_gex"] == 0).all()
+    np.testing.assert_allclose(calls["gex"], -puts["gex"])
+    assert calls["by_strike"].sum() == pytest.approx(calls["gex"][200])
+
+
+def test_zero_gamma_of_a_known_book():
+    # Gammas of the 90 put and 110 call match where d1 is opposite: F = sqrt(K1 K2) exp(-vol^2 t / 2)
+    prices, result = profile([0.0, 1.0], [1.0, 0.0])
+    flips = zero_crossings(prices, result["gex"])
+    expected = np.sqrt(90.0 * 110.0) * np.exp(-0.5 ** 2 * 0.25 / 2)
+    assert len(flips) == 1
+    assert flips[0]["to"] == "positive"
+    assert flips[0]["price"] == pytest.approx(expected, abs=0.02)
+    assert zero_gamma(flips, 100.0) == flips[0]["price"]
+
+
+def test_zero_crossings_interpolate():
+    prices = np.array([1.0, 2.0, 3.0, 4.0])
+    flips = zero_crossings(prices, np.array([-1.0, 1.0, 3.0, -1.0]))
+    assert flips == [{"price": 1.5, "to": "positive"}, {"price": 3.75, "to": "negative"}]
+    assert zero_gamma(flips, 3.0) == 3.75
+    assert zero_gamma([], 3.0) is None
@@ -0,0 +1,132 @@
+import json
+import asyncio
+import pytest
+from laevitas_history import fetch_all_pages, fetch_windows, plan_windows, rows_since
+
+
+def pages(count, size=10):
+    async def fetch_page(page):
+        rows = [{"v": (page - 1) * size + i} for i in range(size)]
+        return json.dumps({"meta": {"total_pages": count}, "items": rows}).encode()
+    return fetch_page
+
+
+def test_transform_filters_before_max_rows():
+    result = asyncio.run(fetch_all_pages(pages(3), max_rows=5, transform=lambda row: row if row["v"] >= 12 else None))
+    assert [row["v"] for row in result["items"]] == [12, 13, 14, 15, 16]
+    assert result["meta"]["truncated"]
+
+
+def test_all_pages_merged_in_order():
+    result = asyncio.run(fetch_all_pages(pages(4), concurrency=2))
+    assert [row["v"] for row in result["items"]] == list(range(40))
+    assert not result["meta"]["truncated"]
+
+
+def test_windows_filter_before_max_rows():
+    async def fetch_window(start, end):
+        rows = [{"date": date, "v": date} for date in range(int(start), int(end) + 1)]
+        return {"meta": {"pages_fetched": 1}, "items": rows}
+
+    windows = [("0", "10"), ("10", "20"), ("20", "30")]
+    result = asyncio.run(fetch_windows(fetch_window, windows, max_rows=5, transform=lambda row: row if row["v"] >= 18 else None))
+    assert [row["v"] for row in result["items"]] == [18, 19, 20, 21, 22]
+    assert result["meta"]["truncated"]
+
+
+def test_windows_aligned_to_granularity():
+    # Five hourly rows per window: 4h windows, aligned to multiples of 4h since the epoch
+    assert plan_windows("2025-01-01T01:30", "2025-01-01T10:00", "1h", rows=5) == [
+        ("2025-01-01T01:30", "2025-01-01T04:00"),
+        ("2025-01-01T04:00", "2025-01-01T08:00"),
+        ("2025-01-01T08:00", "2025-01-01T10:00"),
+    ]
+    assert plan_windows("1735691400000", "2025-01-01T05:00", "1h", rows=5)[0] == ("1735691400000", "2025-01-01T04:00")
+
+
+@pytest.mark.parametrize("end, last", [
+    ("2025-01-01T08:00", ("2025-01-01T04:00", "2025-01-01T08:00")),
+    ("2025-01-01T09:59", ("2025-01-01T08:00", "2025-01-01T09:59")),
+    ("2025-01-02", ("2025-01-01T20:00", "2025-01-02")),
+])
+def test_windows_end_at_the_callers_end(end, last):
+    windows = plan_windows("2025-01-01T01:30", end, "1h", rows=5)
+    assert windows[-1] == last
+    assert all(a[1] == b[0] for a, b in zip(windows, windows[1:]))
+
+
+def test_range_within_one_window():
+    assert plan_windows("2025-01-01", "2025-01-01T03:59", "1h", rows=5) == [("2025-01-01", "2025-01-01T03:59")]
+
+
+def test_windows_reject_unreadable_ranges():
+    with pytest.raises(ValueError):
+        plan_windows("yesterday", "2025-01-01", "1h")
+    with pytest.raises(ValueError):
+        plan_windows("2025-01-01", "2025-01-02", "1w")
+
+
+def test_window_boundary_rows_kept_once():
+    async def fetch_window(start, end):
+        # Both ends are inclusive; two symbols per date
+        rows = [{"date": date, "symbol": symbol} for date in range(int(start), int(end) + 1) for symbol in "ab"]
+        return {"meta": {"pages_fetched": 1}, "items": rows}
+
+    result = asyncio.run(fetch_windows(fetch_window, [("0", "3"), ("3", "6"), ("6", "9")]))
+    assert [(row["date"], row["symbol"]) for row in result["items"]] == [(date, symbol) for date in range(10) for symbol in "ab"]
+    assert result["meta"]["windows_fetched"] == 3
+
+
+def test_rows_since_filters_before_max_rows():
+    rows = [{"date": date, "v": date % 3} for date in range(1, 11)]
+    result, cursor = rows_since({"meta": {}, "items": rows}, 2, max_rows=2, transform=lambda row: row if row["v"] == 0 else None)
+    assert [row["date"] for row in result["items"]] == [3, 6]
+    assert result["meta"]["truncated"]
+    assert cursor == 6
+
+
+def test_rows_since_cursor_moves_past_filtered_rows():
+    rows = [{"date": date, "v": date} for date in range(1, 6)]
+    result, cursor = rows_since({"meta": {}, "items": rows}, None, max_rows=3, transform=lambda row: row if row["v"] < 3 else None)
+    assert [row["date"] for row in result["items"]] == [1, 2]
+    assert not result["meta"]["truncated"]
+    # The rows the filter dropped are not fetched again by the next call
+    assert cursor == 5
+
+
+def test_rows_since_max_rows_stops_at_a_date_boundary():
+    # One row per symbol and date, as in per-instrument snapshots
+    rows = [{"date": date, "symbol": symbol} for date in (1, 2, 3) for symbol in "abc"]
+    cursor, polled = None, []
+    for _ in range(4):
+        result, cursor = rows_since({"meta": {}, "items": rows}, cursor, max_rows=4)
+        polled += [(row["date"], row["symbol"]) for row in result["items"]]
+    assert polled == [(row["date"], row["symbol"]) for row in rows]
+
+
+def test_rows_since_keeps_a_date_larger_than_max_rows_whole():
+    rows = [{"date": date, "symbol": symbol} for date in (1, 2) for symbol in "abc"]
+    result, cursor = rows_since({"meta": {}, "items": rows}, None, max_rows=2)
+    assert [row["symbol"] for row in result["items"]] == ["a", "b", "c"]
+    assert result["meta"]["truncated"]
+    assert cursor == 1
+
+
+def test_rows_since_truncated_result_moves_past_complete_dates():
+    rows = [{"date": date} for date in range(1, 6)]
+    result, cursor = rows_since({"meta": {"truncated": True}, "items": rows}, None)
+    # Date 5 may continue on the pages that were not fetched
+    assert [row["date"] for row in result["items"]] == [1, 2, 3, 4]
+    assert result["meta"]["truncated"] and not result["meta"]["cursor_held"]
+    assert cursor == 4
+    result, cursor = rows_since({"meta": {}, "items": rows + [{"date": 6}]}, cursor)
+    assert [row["date"] for row in result["items"]] == [5, 6]
+    assert cursor == 6
+
+
+def test_rows_since_truncated_newest_first_holds_cursor():
+    rows = [{"date": date} for date in range(5, 0, -1)]
+    result, cursor = rows_since({"meta": {"truncated": True}, "items": rows}, 2)
+    assert result["items"] == []
+    assert result["meta"]["cursor_held"]
+    assert cursor == 2
@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+import httpx
+from laevitas_http import ConnectionWarmer, make_client, pool_stats
+
+
+def connection(version, idle):
+    return SimpleNamespace(info=lambda: f"'api.test:443', {version}, IDLE", is_idle=lambda: idle)
+
+
+def test_pool_stats_counts_connections():
+    pool = SimpleNamespace(connections=[connection("HTTP/2", False), connection("HTTP/1.1", True)])
+    client = SimpleNamespace(_transport=SimpleNamespace(_pool=pool))
+    assert pool_stats(client) == {"connections": 2, "http2": 1, "idle": 1}
+
+
+def test_pool_stats_of_real_client():
+    assert pool_stats(make_client("https://api.test", {}, 5.0)) == {"connections": 0, "http2": 0, "idle": 0}
+
+
+def test_pool_stats_without_pool_internals():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+    assert pool_stats(client) == {"connections": None, "http2": None, "idle": None}
+
+
+def warmer_client(handler):
+    return httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+
+
+def test_warm_counts_pings_and_failures():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 2:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(404)
+
+    warmer = ConnectionWarmer(warmer_client(handler), connections=3, path="/ping")
+    asyncio.run(warmer.warm())
+    assert [(request.method, request.url.path) for request in calls] == [("HEAD", "/ping")] * 3
+    stats = warmer.stats()
+    assert (stats["warmups"], stats["pings"], stats["failures"]) == (1, 3, 1)
+    assert stats["last_warm_seconds"] is not None
+
+
+def test_running_without_connections_sends_nothing():
+    calls = []
+    warmer = ConnectionWarmer(warmer_client(lambda request: calls.append(request) or httpx.Response(200)))
+
+    async def main():
+        async with warmer.running():
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert calls == [] and warmer.counters["warmups"] == 0
+
+
+def test_running_pings_until_the_block_exits():
+    calls = []
+    warmer = ConnectionWarmer(warmer_client(lambda request: calls.append(request) or httpx.Response(200)), connections=2, ping_interval=0.01)
+
+    async def main():
+        async with warmer.running():
+            while warmer.counters["warmups"] < 3:
+                await asyncio.sleep(0.005)
+        sent = len(calls)
+        await asyncio.sleep(0.05)
+        return sent
+
+    assert asyncio.run(main()) == len(calls) >= 6
+
+
+def test_running_waits_for_a_cancelled_warm_up():
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request)
+            raise
+        return httpx.Response(200)
+
+    warmer = ConnectionWarmer(warmer_client(handler), connections=2)
+
+    async def main():
+        async with warmer.running():
+            await asyncio.sleep(0.01)
+        # The warm-up in flight has unwound by the time the block exits
+        return len(cancelled), [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(main()) == (2, [])
@@ -0,0 +1,86 @@
+import pytest
+from laevitas_output import to_columnar, compile_tree, field_tree, projection
+
+
+def from_columnar(result):
+    data = result["data"]
+    size = len(next(iter(data.values()), []))
+    return [{column: data[column][i] for column in result["columns"]} for i in range(size)]
+
+
+@pytest.mark.parametrize("key", ["items", "data"])
+def test_columnar_round_trip(key):
+    rows = [
+        {"date": 1, "open": 10.5, "close": 11.0},
+        {"date": 2, "close": 12.0, "volume": 3},
+        {"date": 3, "open": 12.0, "close": None, "volume": 4},
+    ]
+    result = to_columnar({"meta": {"total": 3}, key: rows})
+    assert result["meta"] == {"total": 3}
+    assert result["columns"] == ["date", "open", "close", "volume"]
+    assert all(len(values) == len(rows) for values in result["data"].values())
+    assert from_columnar(result) == [{column: row.get(column) for column in result["columns"]} for row in rows]
+
+
+def test_columnar_leaves_other_results_alone():
+    for result in ([1, 2], {"items": [1, 2]}, {"total": 3}, "Error: x"):
+        assert to_columnar(result) == result
+
+
+def test_columnar_of_no_rows():
+    assert to_columnar({"items": []}) == {"columns": [], "data": {}}
+
+
+def test_field_tree_merges_dotted_paths():
+    assert field_tree(("a.b", "a.c", "d", "e..f")) == {"a": {"b": None, "c": None}, "d": None, "e": {"f": None}}
+
+
+@pytest.mark.parametrize("fields", [("a", "a.b"), ("a.b", "a")])
+def test_field_tree_leaf_keeps_the_whole_subtree(fields):
+    assert field_tree(fields) == {"a": None}
+
+
+def test_compile_tree_traverses_lists():
+    project = compile_tree({"x": {"y": None}, "missing": None})
+    assert project({"x": [{"y": 1, "z": 2}, {"z": 3}], "w": 4}) == {"x": [{"y": 1}, {}]}
+
+
+ROWS = [{"strike": 100, "iv": 50.0, "oi": 3}, {"strike": 110, "iv": 48.0, "oi": 1}]
+
+
+def test_projection_of_dotted_paths():
+    result = {"meta": {"total": 2, "pages": 1}, "items": ROWS}
+    assert projection(("meta.total", "items.strike"))(result) == {"meta": {"total": 2}, "items": [{"strike": 100}, {"strike": 110}]}
+
+
+@pytest.mark.parametrize("key", ["items", "data"])
+def test_projection_resolves_other_names_in_rows(key):
+    result = {"meta": {"total": 2}, key: ROWS}
+    assert projection(("meta", "strike", "iv"))(result) == {
+        "meta": {"total": 2},
+        key: [{"strike": 100, "iv": 50.0}, {"strike": 110, "iv": 48.0}],
+    }
+
+
+def test_projection_merges_row_names_and_row_paths():
+    assert projection(("strike", "items.oi"))({"items": ROWS}) == {"items": [{"strike": 100, "oi": 3}, {"strike": 110, "oi": 1}]}
+
+
+def test_projection_keeps_rows_requested_whole():
+    assert projection(("items", "strike"))({"meta": {}, "items": ROWS}) == {"items": ROWS}
+
+
+def test_projection_resolves_names_per_response():
+    project = projection(("date", "oi"))
+    assert project is projection(("date", "oi"))
+    # date is a top-level key of the first response and a row key of the second
+    assert project({"date": 5, "items": ROWS}) == {"date": 5, "items": [{"oi": 3}, {"oi": 1}]}
+    rows = [{"date": 1, "oi": 2, "iv": 3}]
+    assert project({"items": rows}) == {"items": [{"date": 1, "oi": 2}]}
+    assert project({"date": 5, "items": rows}) == {"date": 5, "items": [{"oi": 2}]}
+
+
+def test_projection_of_unwrapped_results():
+    project = projection(("strike",))
+    assert project(ROWS) == [{"strike": 100}, {"strike": 110}]
+    assert project({"strike": 1, "iv": 2}) == {"strike": 1}
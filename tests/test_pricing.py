@@ -0,0 +1,145 @@
+import math
+import numpy as np
+import pytest
+from laevitas_pricing import norm_cdf, black76, price_legs, implied_vol, add_implied_vol, risk_slide
+
+
+def test_norm_cdf_matches_erfc():
+    x = np.linspace(-40, 40, 100001)
+    exact = np.array([0.5 * math.erfc(-v / math.sqrt(2)) for v in x])
+    assert np.max(np.abs(norm_cdf(x) - exact)) < 1e-15
+
+
+def test_put_call_parity():
+    rng = np.random.default_rng(0)
+    f, k = 100.0, 100 * np.exp(rng.uniform(-1, 1, 1000))
+    t, vol, rate = rng.uniform(0.01, 2, 1000), rng.uniform(0.05, 2, 1000), rng.uniform(0, 0.05, 1000)
+    call = black76(f, k, t, vol, True, rate)["price"]
+    put = black76(f, k, t, vol, False, rate)["price"]
+    assert np.max(np.abs(call - put - np.exp(-rate * t) * (f - k))) < 1e-11
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_greeks_match_finite_differences(is_call):
+    f, k, t, vol, rate = 100.0, np.array([70.0, 95.0, 100.0, 130.0]), 0.5, 0.6, 0.03
+
+    def price(**bumped):
+        return black76(**{"forward": f, "strike": k, "t": t, "vol": vol, "is_call": is_call, "rate": rate, **bumped})["price"]
+
+    def delta_at(forward):
+        return black76(forward, k, t, vol, is_call, rate)["delta"]
+
+    greeks = black76(f, k, t, vol, is_call, rate)
+    h = 1e-4
+    delta = (price(forward=f + h) - price(forward=f - h)) / (2 * h)
+    gamma = (delta_at(f + h) - delta_at(f - h)) / (2 * h)
+    vega = (price(vol=vol + h) - price(vol=vol - h)) / (2 * h) / 100
+    theta = -(price(t=t + h) - price(t=t - h)) / (2 * h) / 365
+    rho = (price(rate=rate + h) - price(rate=rate - h)) / (2 * h) / 100
+    np.testing.assert_allclose(greeks["delta"], delta, rtol=1e-7, atol=1e-10)
+    np.testing.assert_allclose(greeks["gamma"], gamma, rtol=1e-7)
+    np.testing.assert_allclose(greeks["vega"], vega, rtol=1e-7)
+    np.testing.assert_allclose(greeks["theta"], theta, rtol=1e-6)
+    np.testing.assert_allclose(greeks["rho"], rho, rtol=1e-6, atol=1e-10)
+
+
+def test_expired_options_are_worth_intrinsic():
+    greeks = black76(100.0, [90.0, 110.0], 0.0, 0.5, True)
+    np.testing.assert_allclose(greeks["price"], [10.0, 0.0])
+    np.testing.assert_allclose(greeks["gamma"], [0.0, 0.0])
+
+
+def test_price_legs_totals_are_quantity_weighted():
+    legs = [
+        {"type": "call", "strike": 100, "years": 0.5, "vol": 50, "quantity": 2},
+        {"type": "put", "strike": 90, "years": 0.5, "vol": 55, "quantity": -1},
+    ]
+    result = price_legs(legs, forward=100)
+    expected = 2 * result["legs"][0]["delta"] - result["legs"][1]["delta"]
+    assert result["total"]["delta"] == pytest.approx(expected)
+
+
+def test_price_legs_rejects_incomplete_leg():
+    with pytest.raises(ValueError):
+        price_legs([{"type": "call", "strike": 100, "years": 0.5}], forward=100)
+
+
+def test_implied_vol_round_trip():
+    rng = np.random.default_rng(1)
+    n = 50000
+    f = np.full(n, 100.0)
+    k = f * np.exp(rng.uniform(-1.2, 1.2, n))
+    t, vol, rate = rng.uniform(1 / 365, 2, n), rng.uniform(0.05, 3, n), rng.uniform(0, 0.05, n)
+    is_call = rng.random(n) < 0.5
+    greeks = black76(f, k, t, vol, is_call, rate)
+    iv = implied_vol(greeks["price"], f, k, t, is_call, rate)
+    sensitive = greeks["vega"] * 100 > 1e-4 * f
+    assert not np.isnan(iv[sensitive]).any()
+    assert np.max(np.abs(iv[sensitive] - vol[sensitive])) < 1e-8
+    solved = ~np.isnan(iv)
+    repriced = black76(f[solved], k[solved], t[solved], iv[solved], is_call[solved], rate[solved])["price"]
+    assert np.max(np.abs(repriced - greeks["price"][solved]) / f[solved]) < 1e-9
+
+
+def test_implied_vol_atm():
+    price = black76(100.0, 100.0, 1.0, 0.2, True)["price"]
+    assert implied_vol(price, 100.0, 100.0, 1.0, True) == pytest.approx(0.2, abs=1e-10)
+
+
+@pytest.mark.parametrize("price, forward, strike, t, is_call", [
+    (5.0, 100.0, 90.0, 0.5, True),  # below intrinsic
+    (0.0, 100.0, 120.0, 0.5, True),  # worthless
+    (100.0, 100.0, 120.0, 0.5, True),  # at the forward
+    (95.0, 100.0, 90.0, 0.5, False),  # put above the strike
+    (5.0, 100.0, 100.0, 0.0, True),  # expired
+    (5.0, 100.0, -1.0, 0.5, True),  # bad strike
+])
+def test_implied_vol_no_solution(price, forward, strike, t, is_call):
+    assert np.isnan(implied_vol(price, forward, strike, t, is_call))
+
+
+def test_implied_vol_bisection_fallback():
+    # Short-dated, very high vol: Halley's step leaves the bracket, so bisection takes over
+    f, k, t, vol = 100.0, 7.4023289895967865, 0.002790934358255852, 6.8645428158866855
+    price = black76(f, k, t, vol, False)["price"]
+    assert implied_vol(price, f, k, t, False) == pytest.approx(vol, rel=1e-9)
+
+
+def test_implied_vol_keeps_shape():
+    iv = implied_vol(np.full((2, 3), 8.0), 100.0, 100.0, 1.0, True)
+    assert iv.shape == (2, 3)
+
+
+def test_add_implied_vol_to_trades():
+    price = float(black76(100000.0, 110000.0, 0.25, 0.6, True)["price"])
+    rows = [
+        {"price": price / 100000.0, "index_price": 100000.0, "strike": 110000, "maturity": "27JUN25",
+         "option_type": "call", "market": "deribit", "currency": "BTC", "date": "2025-03-28T13:30"},
+        {"price": 1.0, "index_price": 100000.0, "strike": 110000, "maturity": "bogus", "option_type": "call"},
+    ]
+    result = add_implied_vol({"items": rows})
+    t = (27 - 28 + 31 + 30 + 31) / 365 + (8 - 13.5) / 24 / 365
+    expected = implied_vol(price, 100000.0, 110000.0, t, True) * 100
+    assert result["items"][0]["iv"] == pytest.approx(float(expected), abs=1e-4)
+    assert result["items"][1]["iv"] is None
+
+
+def test_risk_slide_futures_add_no_notional():
+    slide = risk_slide([100000.0], [0.0], [0.0], [0.0], [False], [2.0], [False], spot_shocks=[-0.1, 0.0, 0.1], vol_shocks=[0.0])
+    assert slide["value"] == 0.0
+    np.testing.assert_allclose(slide["pnl"][:, 0], [-20000.0, 0.0, 20000.0])
+    np.testing.assert_allclose(slide["delta"], 2.0)
+
+
+def test_risk_slide_mixed_portfolio():
+    forward, strike, t, vol = 100.0, 110.0, 0.5, 60.0
+    spots, vols = [-0.2, 0.0, 0.2], [-10.0, 0.0, 10.0]
+    slide = risk_slide([forward, forward], [strike, 0.0], [t, 0.0], [vol, 0.0], [True, False], [-3.0, 1.0], [True, False], spots, vols)
+    option = -3 * float(black76(forward, strike, t, vol / 100, True)["price"])
+    assert slide["value"] == pytest.approx(option)
+    assert slide["pnl"][1, 1] == pytest.approx(0.0, abs=1e-12)
+    for i, spot in enumerate(spots):
+        for j, shock in enumerate(vols):
+            greeks = black76(forward * (1 + spot), strike, t, (vol + shock) / 100, True)
+            assert slide["pnl"][i, j] == pytest.approx(-3 * float(greeks["price"]) - option + forward * spot)
+            assert slide["delta"][i, j] == pytest.approx(-3 * float(greeks["delta"]) + 1)
@@ -0,0 +1,132 @@
+import asyncio
+from types import SimpleNamespace
+import httpx
+import pytest
+import laevitas_retry
+from laevitas_retry import RetryPolicy, deadline_scope, parse_retry_after
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(laevitas_retry, "time", clock)
+    monkeypatch.setattr(laevitas_retry, "asyncio", SimpleNamespace(sleep=clock.sleep))
+    # Full jitter draws its upper bound, so delays are predictable
+    monkeypatch.setattr(laevitas_retry, "random", SimpleNamespace(uniform=lambda low, high: high))
+    return clock
+
+
+def upstream(*outcomes):
+    """A call replaying outcomes (status codes, (status, headers) or exceptions); the last one repeats."""
+    outcomes = list(outcomes)
+    calls = []
+    http = httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(lambda request: respond(request)))
+
+    def respond(request):
+        outcome = outcomes.pop(0) if len(outcomes) > 1 else outcomes[0]
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("failed", request=request)
+        status, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        return httpx.Response(status, headers=headers)
+
+    def call(method):
+        async def send(timeout):
+            calls.append(timeout)
+            return await http.request(method, "/")
+        return send
+
+    return call, calls
+
+
+def run(policy, method, call):
+    return asyncio.run(policy.run(method, call(method)))
+
+
+def test_transient_failures_are_retried_with_backoff(clock):
+    policy = RetryPolicy(attempts=4, base_delay=0.25)
+    call, calls = upstream(503, httpx.ConnectError, 200)
+    assert run(policy, "GET", call).status_code == 200
+    assert clock.slept == [0.25, 0.5]
+    assert len(calls) == 3
+    assert policy.counters["recovered"] == 1
+    assert policy.reasons == {"503": 1, "ConnectError": 1}
+
+
+def test_retry_after_is_honoured(clock):
+    policy = RetryPolicy(base_delay=0.25)
+    call, _ = upstream((429, {"Retry-After": "3"}), 200)
+    assert run(policy, "GET", call).status_code == 200
+    assert clock.slept == [3.0]
+
+
+def test_retries_run_out(clock):
+    policy = RetryPolicy(attempts=3)
+    call, calls = upstream(503)
+    assert run(policy, "GET", call).status_code == 503
+    assert len(calls) == 3
+    assert policy.counters["exhausted"] == 1
+
+
+def test_permanent_errors_are_not_retried(clock):
+    policy = RetryPolicy()
+    call, calls = upstream(404)
+    assert run(policy, "GET", call).status_code == 404
+    assert len(calls) == 1
+
+
+def test_deadline_stops_retries(clock):
+    policy = RetryPolicy(deadline=60.0)
+    call, calls = upstream((429, {"Retry-After": "5"}), 200)
+
+    async def scoped():
+        with deadline_scope(2.0):
+            return await policy.run("GET", call("GET"))
+
+    assert asyncio.run(scoped()).status_code == 429
+    assert len(calls) == 1
+    assert calls[0] == pytest.approx(2.0)
+    assert policy.counters["deadline_exceeded"] == 1
+    assert clock.slept == []
+
+
+def test_nested_deadline_never_extends_the_outer_one(clock):
+    with deadline_scope(1.0):
+        with deadline_scope(10.0):
+            assert laevitas_retry.call_deadline.get() == 1.0
+    assert laevitas_retry.call_deadline.get() is None
+
+
+@pytest.mark.parametrize("outcome", [503, (429, {"Retry-After": "1"})])
+def test_non_get_is_never_retried(clock, outcome):
+    policy = RetryPolicy()
+    call, calls = upstream(outcome, 200)
+    assert run(policy, "POST", call).status_code != 200
+    assert len(calls) == 1
+    assert policy.counters["retries"] == 0
+
+
+def test_non_get_transport_error_is_raised(clock):
+    call, calls = upstream(httpx.ConnectError, 200)
+    with pytest.raises(httpx.ConnectError):
+        run(RetryPolicy(), "POST", call)
+    assert len(calls) == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,276 @@
+import os
+import json
+import asyncio
+import httpx
+import pytest
+
+os.environ.setdefault("LAEVITAS_API_KEY", "test")
+
+import laevitas_server as server
+from laevitas_cache import parse_range_end
+from laevitas_catalog import get_catalog
+from laevitas_history import Cursors, parse_instant
+from laevitas_store import SeriesStore
+
+TRADES = "/historical/options/trades/deribit/BTC"
+
+
+def page_rows(page):
+    # Larger values sit on later pages, so a cut in page order misses the top rows
+    return [{"date": (page - 1) * 8 + i + 1, "v": (page - 1) * 8 + i} for i in range(8)]
+
+
+def trades(request):
+    page = request.url.params.get("page")
+    if page is None:
+        rows = [row for p in (1, 2, 3) for row in page_rows(p)]
+        return httpx.Response(200, json={"meta": {"total": len(rows)}, "items": rows})
+    return httpx.Response(200, json={"meta": {"total_pages": 3}, "items": page_rows(int(page))})
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Route the server's client to a handler; returns the requests it received."""
+    requests = []
+
+    def install(handler):
+        def record(request):
+            requests.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(server, "client", httpx.AsyncClient(base_url=server.BASE_URL, transport=httpx.MockTransport(record)))
+        return requests
+
+    monkeypatch.setattr(server, "cursors", Cursors())
+    monkeypatch.setattr(server.throttle.bucket, "rate", 0)
+    server.cache.clear()
+    yield install
+    server.cache.clear()
+
+
+def call(**kwargs):
+    return json.loads(asyncio.run(server.make_request("GET", TRADES, {"start": "2025-01-01", "end": "2025-01-02"}, **kwargs)))
+
+
+@pytest.mark.parametrize("option", ["fetch_all", "split_range", "since_last"])
+def test_paged_ranking_sees_every_row(upstream, option):
+    upstream(trades)
+    expected = [row["v"] for row in call(sort_by="v", max_rows=5)["items"]]
+    assert expected == [23, 22, 21, 20, 19]
+    assert [row["v"] for row in call(sort_by="v", max_rows=5, **{option: True})["items"]] == expected
+
+
+def hourly(request):
+    # As the API reads it: a date end covers the whole day, a minute end is inclusive
+    params = dict(request.url.params)
+    start = int(parse_instant(params["start"]).timestamp())
+    end = parse_range_end(params)
+    stop = int(end.timestamp()) - (end > parse_instant(params["end"]))
+    rows = [{"date": stamp * 1000, "v": stamp} for stamp in range(start - start % 3600, stop + 1, 3600) if stamp >= start]
+    return httpx.Response(200, json={"meta": {"total_pages": 1}, "items": rows})
+
+
+def test_store_reads_date_end_as_whole_day(upstream, monkeypatch):
+    upstream(hourly)
+    params = {"start": "2025-01-01", "end": "2025-01-02", "granularity": "1h"}
+    direct = json.loads(asyncio.run(server.make_request("GET", TRADES, params, split_range=True)))
+    monkeypatch.setattr(server, "store", SeriesStore(":memory:"))
+    fetched = json.loads(asyncio.run(server.make_request("GET", TRADES, params, split_range=True)))
+    stored = json.loads(asyncio.run(server.make_request("GET", TRADES, params, split_range=True)))
+    assert len(direct["items"]) == 48
+    assert fetched["items"] == direct["items"]
+    assert stored["items"] == direct["items"]
+    assert stored["meta"]["gaps"] == 0
+
+
+def analytics(request):
+    path = request.url.path
+    if path == "/analytics/futures/futures_curve/BTC/deribit":
+        return httpx.Response(200, json={"data": [{"maturity": "PERPETUAL", "value": 99000}, {"maturity": "26DEC31", "value": 110000}]})
+    if path.startswith("/analytics/options/iv_all/deribit/BTC/26DEC31/"):
+        return httpx.Response(200, json={"data": [{"strike": 100000, "mark_iv": 50}, {"strike": 120000, "mark_iv": 60}]})
+    return httpx.Response(404, json={"error": "not found"})
+
+
+def test_slide_inputs_resolve_vols_and_forwards(upstream):
+    requests = upstream(analytics)
+    positions = [
+        {"instrument": "BTC-26DEC31-110000-C", "quantity": -1},
+        {"instrument": "BTC-26DEC31-100000-P", "vol": 70},
+        {"instrument": "BTC-26DEC31", "quantity": 2, "forward": 111000},
+    ]
+    inputs = asyncio.run(server.slide_inputs(positions, "deribit", None, None))
+    call, put, future = inputs["legs"]
+    assert inputs["currency"] == "BTC"
+    assert (call["vol"], call["vol_source"], call["forward"], call["forward_source"]) == (55.0, "smile", 110000.0, "curve")
+    assert (put["vol"], put.get("vol_source")) == (70, None)
+    assert (future["forward"], future.get("forward_source"), future["strike"]) == (111000, None, None)
+    # Only the call smile was needed
+    assert sorted(request.url.path for request in requests) == [
+        "/analytics/futures/futures_curve/BTC/deribit",
+        "/analytics/options/iv_all/deribit/BTC/26DEC31/C",
+    ]
+
+
+@pytest.mark.parametrize("positions, message", [
+    ([{"instrument": "BTC-26DEC31-150000-C", "forward": 100000}], "no forward or vol"),
+    ([{"instrument": "BTC-26DEC31"}, {"instrument": "ETH-26DEC31"}], "slide one currency at a time"),
+    ([], "at least one instrument"),
+])
+def test_slide_inputs_errors(upstream, positions, message):
+    upstream(lambda request: httpx.Response(404, json={}))
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(server.slide_inputs(positions, "deribit", None, None))
+
+
+def test_futures_only_slide_has_no_pnl_at_zero_shock(upstream):
+    upstream(analytics)
+    result = json.loads(asyncio.run(server.get_calculateportfolioriskslide([{"instrument": "BTC-26DEC31", "quantity": 3}])))
+    zero = result["spot_shocks"].index(0.0)
+    assert result["value"] == 0.0
+    assert result["pnl"][zero] == [0.0] * len(result["vol_shocks"])
+    assert result["pnl"][-1][0] == pytest.approx(3 * 110000 * result["spot_shocks"][-1])
+
+
+def test_identical_gets_share_one_upstream_call(upstream):
+    async def slow(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": []})
+
+    requests = upstream(slow)
+
+    async def run(method):
+        return await asyncio.gather(*[server.request_body(method, "/analytics/options/oi_strike_all/deribit/BTC") for _ in range(5)])
+
+    assert asyncio.run(run("GET")) == [b'{"data":[]}'] * 5
+    assert len(requests) == 1
+    server.cache.clear()
+    asyncio.run(run("POST"))
+    assert len(requests) == 6
+
+
+def snapshots(request):
+    market = request.url.path.rsplit("/", 1)[-1]
+    if market == "bitmex":
+        return httpx.Response(500, text="down")
+    if market == "bybit":
+        return httpx.Response(200, text="plain text")
+    rows = [{"symbol": f"{market}-{i}", "open_interest": i} for i in range(3)]
+    return httpx.Response(200, json={"data": rows})
+
+
+def test_batch_reports_each_call(upstream, monkeypatch):
+    upstream(snapshots)
+    monkeypatch.setattr(server.retry, "attempts", 1)
+    calls = [
+        {"tool": "getfuturesmarketsnapshot", "args": {"market": "deribit", "top_n": "2", "sort_by": "open_interest"}},
+        {"tool": "getfuturesmarketsnapshot", "args": {"market": "bitmex"}},
+        {"tool": "getfuturesmarketsnapshot", "args": {"market": "bybit"}},
+        {"tool": "getfuturesmarketsnapshot", "args": {"market": "deribit", "top_n": "many"}},
+        {"tool": "getfuturesmarketsnapshot", "args": {"market": "deribit", "page": 2}},
+        {"tool": "getnothing", "args": {}},
+        {"tool": "getfuturesmarketsnapshot", "args": ["deribit"]},
+    ]
+    result = json.loads(asyncio.run(server.batch(calls)))
+    ok, failed, plain, invalid, unexpected, unknown, shapeless = result["results"]
+    assert (result["ok"], result["errors"]) == (2, 5)
+    assert ok["status"] == "ok"
+    assert [row["open_interest"] for row in ok["result"]["data"]] == [2, 1]
+    assert failed["status"] == "error" and "500" in failed["error"]
+    assert plain == {**plain, "status": "ok", "result": "plain text"}
+    assert invalid["status"] == "error" and "top_n" in invalid["error"]
+    assert unexpected["status"] == "error" and "page" in unexpected["error"]
+    assert unknown["error"] == "unknown tool 'getnothing'"
+    assert shapeless["error"] == "args must be an object"
+
+
+def test_batch_times_out_slow_calls(upstream):
+    async def slow(request):
+        if "deribit" in request.url.path:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={"data": []})
+
+    upstream(slow)
+    calls = [{"tool": "getfuturesmarketsnapshot", "args": {"market": market}} for market in ("deribit", "binance")]
+    result = json.loads(asyncio.run(server.batch(calls, timeout=0.05)))
+    slow_call, fast_call = result["results"]
+    assert slow_call["status"] == "timeout"
+    assert fast_call == {**fast_call, "status": "ok", "result": {"data": []}}
+
+
+def test_batch_limit(monkeypatch):
+    monkeypatch.setattr(server, "BATCH_MAX_CALLS", 1)
+    assert asyncio.run(server.batch([{}, {}])).startswith("Error:")
+
+
+def test_all_markets_reports_failing_venues(upstream, monkeypatch):
+    def handler(request):
+        market = request.url.path.split("/")[-2]
+        if market == "binance":
+            return httpx.Response(503, text="unavailable")
+        return httpx.Response(200, json={"data": [{"maturity": "26DEC31", "oi": len(market)}]})
+
+    requests = upstream(handler)
+    monkeypatch.setattr(server.retry, "attempts", 1)
+    tool = server.tools["getoptionsopeninterestbyexpiry"]
+    venues = get_catalog().venues(tool.spec.path, tool.spec.markets, "SOL")
+    assert "aggregate" in tool.spec.markets and "aggregate" not in venues
+    assert "okx" in tool.spec.markets and "okx" not in venues
+    arguments = tool.spec.arguments.model_validate({"currency": "SOL", "all_markets": True, "sort_by": "oi"})
+    result = json.loads(asyncio.run(tool(**dict(arguments))))
+    assert sorted(request.url.path.split("/")[-2] for request in requests) == sorted(venues)
+    markets = {entry["market"]: entry for entry in result["markets"]}
+    assert list(markets) == venues
+    assert markets["binance"]["status"] == "error" and "503" in markets["binance"]["error"]
+    assert all(entry == {"market": m, "status": "ok", "rows": 1} for m, entry in markets.items() if m != "binance")
+    assert [row["market"] for row in result["items"]] == sorted((m for m in venues if m != "binance"), key=len, reverse=True)
+
+
+def test_all_markets_requests_the_catalog_spelling(upstream):
+    # Rows naming their own market must not lose the tag of the venue that was called
+    requests = upstream(lambda request: httpx.Response(200, json=[{"market": "other", "oi": 1}]))
+    tool = server.tools["getfuturesmarketsnapshot"]
+    assert tool.spec.markets[0] == "DERIBIT"
+    arguments = tool.spec.arguments.model_validate({"all_markets": True})
+    result = json.loads(asyncio.run(tool(**dict(arguments))))
+    assert sorted(request.url.path.split("/")[-1] for request in requests) == sorted(tool.spec.markets)
+    assert sorted(row["market"] for row in result["items"]) == sorted(tool.spec.markets)
+
+
+SNAPSHOT = "/analytics/futures/snapshot/deribit"
+
+
+def snapshot_rows(request):
+    return httpx.Response(200, json={"data": [{"v": i} for i in range(50)], "date": 1})
+
+
+def test_streamed_body_read_to_the_end_is_cached(upstream):
+    requests = upstream(snapshot_rows)
+    for _ in range(2):
+        result = asyncio.run(server.request_rows("GET", SNAPSHOT, {}, max_rows=100))
+        assert result == ({"data": [{"v": i} for i in range(50)], "date": 1}, False)
+    assert len(requests) == 1
+
+
+def test_streamed_body_cut_short_is_not_cached(upstream):
+    requests = upstream(snapshot_rows)
+    for _ in range(2):
+        result, truncated = asyncio.run(server.request_rows("GET", SNAPSHOT, {}, max_rows=3))
+        assert result["data"] == [{"v": 0}, {"v": 1}, {"v": 2}] and truncated
+    assert len(requests) == 2
+    # The concurrency slot is returned once the abandoned stream is closed
+    assert server.throttle.limiter.in_flight == 0
+
+
+def test_stream_joins_a_full_fetch_in_flight(upstream):
+    requests = upstream(snapshot_rows)
+
+    async def main():
+        full = asyncio.ensure_future(server.request_body("GET", SNAPSHOT, {}))
+        await asyncio.sleep(0)
+        return await server.request_rows("GET", SNAPSHOT, {}, max_rows=2), await full
+
+    (result, truncated), body = asyncio.run(main())
+    assert result["data"] == [{"v": 0}, {"v": 1}] and truncated
+    assert json.loads(body)["date"] == 1
+    assert len(requests) == 1
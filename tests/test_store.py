@@ -0,0 +1,48 @@
+import asyncio
+from laevitas_store import SeriesStore, fetch_with_store
+
+
+def run(store, rows, calls, **kwargs):
+    async def fetch_interval(lo, hi, max_rows, max_bytes):
+        calls.append((lo, hi))
+        return {"meta": {}, "items": [dict(row) for row in rows if lo <= row.get("date", lo) <= hi]}
+    return asyncio.run(fetch_with_store(store, "series", 0, 3000, fetch_interval, **kwargs))
+
+
+def test_dated_interval_is_stored():
+    store, calls = SeriesStore(":memory:"), []
+    rows = [{"date": 1000, "v": 1}, {"date": 2000, "v": 2}]
+    run(store, rows, calls)
+    result = run(store, rows, calls)
+    assert len(calls) == 1
+    assert result["meta"]["stored_rows"] == 2
+
+
+def test_undated_rows_are_kept_and_not_covered():
+    store, calls = SeriesStore(":memory:"), []
+    rows = [{"date": 1000, "v": 1}, {"v": "undated"}, {"date": 2000, "v": 2}]
+    first = run(store, rows, calls)
+    second = run(store, rows, calls)
+    assert len(calls) == 2
+    for result in (first, second):
+        assert len(result["items"]) == 3
+        assert result["meta"]["undated_rows"] == 1
+
+
+def test_max_rows_stops_fetching_gaps():
+    store, calls = SeriesStore(":memory:"), []
+    store.add("series", 1000, 1500, [{"date": 1000, "v": 1}])
+    rows = [{"date": 500, "v": 0}, {"date": 1000, "v": 1}, {"date": 2000, "v": 2}, {"date": 2500, "v": 3}]
+    result = run(store, rows, calls, max_rows=2, concurrency=1)
+    assert calls == [(0, 1000)]
+    assert [row["v"] for row in result["items"]] == [0, 1]
+    assert result["meta"]["truncated"]
+
+
+def test_transform_filters_before_max_rows():
+    store, calls = SeriesStore(":memory:"), []
+    store.add("series", 0, 1000, [{"date": 0, "v": 0}, {"date": 1000, "v": 1}])
+    rows = [{"date": 1000, "v": 1}, {"date": 2000, "v": 2}, {"date": 2500, "v": 3}, {"date": 3000, "v": 4}]
+    result = run(store, rows, calls, max_rows=2, transform=lambda row: row if row["v"] % 2 == 0 else None)
+    assert [row["v"] for row in result["items"]] == [0, 2]
+    assert store.stats()["rows"] == 5
@@ -0,0 +1,69 @@
+import json
+import asyncio
+import pytest
+from laevitas_stream import collect_rows, RowParser
+
+BODIES = [
+    b'[0.1,[],true]',
+    b'[1e5,-2.5E-3,0,12345678901234567890,null,"x"]',
+    b'{"meta":{"total":3.25},"items":[{"a":1.5},{"b":-0.0}],"next":10}',
+    b'{"data":[1.0e+2,2],"page":7}',
+    b' [ 3.14 , {"k": [1, 2.5]} ] ',
+    b'42.5',
+    '{"items":[{"name":"été","v":0.5}]}'.encode(),
+]
+
+
+def chunked(body: bytes, *cuts: int):
+    async def chunks():
+        last = 0
+        for cut in cuts:
+            yield body[last:cut]
+            last = cut
+        yield body[last:]
+    return chunks()
+
+
+def collect(chunks, **kwargs):
+    return asyncio.run(collect_rows(chunks, **kwargs))
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_every_split_point(body):
+    expected = json.loads(body)
+    for cut in range(len(body) + 1):
+        result, stopped = collect(chunked(body, cut))
+        assert result == expected, f"split at {cut}"
+        assert not stopped
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_byte_at_a_time(body):
+    result, _ = collect(chunked(body, *range(1, len(body))))
+    assert result == json.loads(body)
+
+
+def test_max_rows_across_splits():
+    body = b'{"items":[1.25,2.5,3.75,4.0],"total":4}'
+    for cut in range(len(body) + 1):
+        result, stopped = collect(chunked(body, cut), max_rows=2)
+        assert result["items"] == [1.25, 2.5]
+        assert stopped
+
+
+def test_transform_filters_before_max_rows():
+    body = b'[1,20,3,40,5]'
+    result, _ = collect(chunked(body, 4), max_rows=2, transform=lambda row: row if row > 10 else None)
+    assert result == [20, 40]
+
+
+def test_invalid_body_raises():
+    parser = RowParser(lambda row: True)
+    parser.feed("[0x]")
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_incomplete_body_raises():
+    with pytest.raises(ValueError):
+        collect(chunked(b'[1,2', 2))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from laevitas_surface import Surface, svi, svi_density, fit_svi, CHECK_K
+
+FORWARD = 100.0
+
+# Raw SVI parameters (a, b, rho, m, sigma)
+SMILE = np.array([0.04, 0.4, -0.4, 0.1, 0.2])
+# Vogt's example: within Lee's bound, yet with butterfly arbitrage
+VOGT = np.array([-0.0410, 0.1331, 0.3060, 0.3586, 0.4153])
+
+
+def svi_slice(maturity, t, params):
+    k = np.linspace(-1, 1, 41)
+    return maturity, t, FORWARD, list(FORWARD * np.exp(k)), list(np.sqrt(svi(params, k) / t) * 100)
+
+
+def flat_slice(maturity, t, iv):
+    return maturity, t, FORWARD, list(FORWARD * np.exp(np.linspace(-1, 1, 21))), [iv] * 21
+
+
+def test_fit_svi_recovers_parameters():
+    k = np.linspace(-1, 1, 41)
+    params, rmse = fit_svi(k, svi(SMILE, k))
+    np.testing.assert_allclose(params, SMILE, atol=2e-3)
+    assert rmse < 1e-3
+
+
+def test_density_flags_butterfly_arbitrage():
+    assert svi_density(SMILE, CHECK_K).min() > 0
+    assert svi_density(VOGT, CHECK_K).min() < 0
+
+
+def test_surface_flags_butterfly_arbitrage():
+    surface = Surface([svi_slice("27JUN25", 1.0, SMILE), svi_slice("26DEC25", 1.5, SMILE * [1.5, 1, 1, 1, 1])])
+    assert surface.butterfly_ok == [True, True]
+    assert surface.calendar_ok
+    assert Surface([svi_slice("27JUN25", 1.0, VOGT)]).butterfly_ok == [False]
+
+
+def test_surface_flags_calendar_arbitrage():
+    # Total variance falls from 0.32 to 0.16 between the expiries
+    surface = Surface([flat_slice("27JUN25", 0.5, 80.0), flat_slice("26DEC25", 1.0, 40.0)])
+    assert not surface.calendar_ok
+
+
+def test_iv_interpolates_total_variance_between_expiries():
+    surface = Surface([flat_slice("28MAR25", 0.25, 50.0), flat_slice("26DEC25", 1.0, 60.0)])
+    iv = surface.iv([80.0, 100.0, 120.0], [0.25, 0.5, 1.0])
+    w = 0.5 ** 2 * 0.25 + (0.5 - 0.25) / 0.75 * (0.6 ** 2 - 0.5 ** 2 * 0.25)
+    np.testing.assert_allclose(iv[0], 50.0, atol=1e-3)
+    np.testing.assert_allclose(iv[1], np.sqrt(w / 0.5) * 100, atol=1e-3)
+    np.testing.assert_allclose(iv[2], 60.0, atol=1e-3)
+
+
+def test_iv_rejects_past_tenors():
+    surface = Surface([flat_slice("27JUN25", 0.5, 50.0)])
+    with pytest.raises(ValueError):
+        surface.iv([100.0], [0.0])
@@ -0,0 +1,169 @@
+import asyncio
+from types import SimpleNamespace
+import httpx
+import pytest
+import laevitas_throttle
+from laevitas_throttle import TokenBucket, AdaptiveLimiter, Throttle
+
+
+class Clock:
+    """Monotonic time that only moves when the code under test sleeps (or the test says so)."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(laevitas_throttle, "time", clock)
+    monkeypatch.setattr(laevitas_throttle, "asyncio", SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock, Condition=asyncio.Condition))
+    return clock
+
+
+def client(handler):
+    return httpx.AsyncClient(base_url="https://api.test", transport=httpx.MockTransport(handler))
+
+
+def test_bucket_allows_a_burst_then_waits_for_refill(clock):
+    bucket = TokenBucket(rate=2.0, burst=3.0)
+
+    async def run():
+        for _ in range(4):
+            await bucket.acquire()
+
+    asyncio.run(run())
+    assert clock.slept == [pytest.approx(0.5)]
+    assert bucket.counters["delayed"] == 1
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=3.0)
+
+    async def run():
+        for _ in range(3):
+            await bucket.acquire()
+        clock.now += 1.0
+        assert bucket.stats()["tokens"] == 2.0
+        clock.now += 10.0
+        assert bucket.stats()["tokens"] == 3.0
+
+    asyncio.run(run())
+    assert clock.slept == []
+
+
+def test_bucket_disabled_without_rate(clock):
+    bucket = TokenBucket(rate=0, burst=1)
+
+    async def run():
+        for _ in range(100):
+            await bucket.acquire()
+
+    asyncio.run(run())
+    assert clock.slept == []
+
+
+def test_limiter_backs_off_on_429_and_recovers(clock):
+    limiter = AdaptiveLimiter(initial=8, max_limit=32, cooldown=1.0)
+    throttle = Throttle(TokenBucket(rate=0, burst=1), limiter)
+    statuses = [429, 429, 429]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0) if statuses else 200)
+
+    async def run(http):
+        # A burst of 429s within the cooldown halves the limit once
+        await asyncio.gather(*[throttle.send(lambda: http.get("/")) for _ in range(3)])
+        assert limiter.limit == 4.0
+        clock.now += 2.0
+        statuses.append(503)
+        await throttle.send(lambda: http.get("/"))
+        assert limiter.limit == 2.0
+        for _ in range(20):
+            await throttle.send(lambda: http.get("/"))
+
+    asyncio.run(run(client(handler)))
+    assert limiter.limit > 6.0
+    assert limiter.counters["decreases"] == 2
+    assert throttle.counters["rate_limited"] == 3
+    assert throttle.counters["server_errors"] == 1
+
+
+def test_limiter_caps_requests_in_flight(clock):
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    throttle = Throttle(TokenBucket(rate=0, burst=1), limiter)
+    running = []
+
+    async def handler(request):
+        running.append(1)
+        assert len(running) <= 2
+        await asyncio.sleep(0.001)
+        running.pop()
+        return httpx.Response(200)
+
+    async def run(http):
+        await asyncio.gather(*[throttle.send(lambda: http.get("/")) for _ in range(10)])
+
+    asyncio.run(run(client(handler)))
+    assert limiter.counters["peak_in_flight"] == 2
+    assert limiter.counters["queued"] > 0
+    assert limiter.in_flight == 0
+
+
+def test_timeouts_count_as_overload(clock):
+    limiter = AdaptiveLimiter(initial=8)
+    throttle = Throttle(TokenBucket(rate=0, burst=1), limiter)
+
+    def handler(request):
+        raise httpx.ReadTimeout("slow", request=request)
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(throttle.send(lambda: client(handler).get("/")))
+    assert limiter.limit == 4.0
+    assert throttle.counters["timeouts"] == 1
+    assert limiter.in_flight == 0
+
+
+def test_streamed_response_holds_its_slot_until_closed(clock):
+    limiter = AdaptiveLimiter(initial=1, max_limit=1)
+    throttle = Throttle(TokenBucket(rate=0, burst=1), limiter)
+    async def body():
+        for _ in range(10):
+            yield b"x" * 100
+
+    http = client(lambda request: httpx.Response(200, content=body()))
+
+    def stream():
+        return http.send(http.build_request("GET", "/"), stream=True)
+
+    async def run():
+        response = await throttle.send(stream, stream=True)
+        second = asyncio.ensure_future(throttle.send(stream, stream=True))
+        await asyncio.sleep(0)
+        # The first body is still unread, so the second request waits for the slot
+        assert limiter.in_flight == 1 and limiter.waiting == 1
+        assert len(await response.aread()) == 1000
+        await response.aclose()
+        await (await second).aclose()
+
+    asyncio.run(run())
+    assert limiter.counters["queued"] == 1
+    assert limiter.in_flight == 0
+
+
+def test_response_read_up_front_releases_its_slot(clock):
+    limiter = AdaptiveLimiter(initial=1, max_limit=1)
+    throttle = Throttle(TokenBucket(rate=0, burst=1), limiter)
+    http = client(lambda request: httpx.Response(200, content=b"x"))
+    asyncio.run(throttle.send(lambda: http.get("/"), stream=True))
+    assert limiter.in_flight == 0
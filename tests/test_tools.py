@@ -0,0 +1,38 @@
+import json
+import inspect
+from pathlib import Path
+from typing import Optional
+import pytest
+from laevitas_tools import load_specs
+
+# Tools and parameters ([name, annotation, required]) registered by the hand-written server
+# the catalog-generated tools replaced. The old server defined getoptionsopeninterestbystrike
+# twice; FastMCP keeps the first registration, the oi_strike_all endpoint, so that is the one
+# recorded (the per-maturity endpoint is now getoptionsoibystrike).
+PRE_SERIES = json.loads((Path(__file__).parent / "pre_series_tools.json").read_text())
+
+SPECS = {spec.name: spec for spec in load_specs()}
+
+
+def annotation(value):
+    return value.__name__ if isinstance(value, type) else str(value).replace("typing.", "")
+
+
+@pytest.mark.parametrize("name", sorted(PRE_SERIES))
+def test_pre_series_tool_kept(name):
+    assert name in SPECS
+    spec = SPECS[name]
+    params = [p for p in spec.signature.parameters.values() if p.name not in spec.options]
+    expected = PRE_SERIES[name]
+    if spec.markets:
+        # With all_markets available, market may be left out
+        i = [p.name for p in params].index("market")
+        assert params[i].annotation == Optional[str] and params[i].default is None
+        assert expected[i] == ["market", "str", True]
+        params, expected = params[:i] + params[i + 1:], expected[:i] + expected[i + 1:]
+    assert [[p.name, annotation(p.annotation), p.default is inspect.Parameter.empty] for p in params] == expected
+
+
+def test_per_maturity_oi_by_strike_tool():
+    assert SPECS["getoptionsopeninterestbystrike"].path == "/analytics/options/oi_strike_all/{market}/{currency}"
+    assert SPECS["getoptionsoibystrike"].path == "/analytics/options/oi_strike/{market}/{currency}/{maturity}"